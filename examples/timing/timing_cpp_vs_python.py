@@ -1,60 +1,67 @@
 import sys
 import time
+import random
 import rtamt
 
+# number of samples fed to every monitor
+SAMPLES = 1000
+
+def create_spec(spec_class, name, bound_str):
+    spec = spec_class()
+    spec.name = name
+    spec.declare_var('a', 'float')
+    spec.declare_var('b', 'float')
+    spec.declare_var('c', 'float')
+    spec.spec = 'c = always[0:' + bound_str + '](a + b >= - 2)'
+
+    try:
+        spec.parse()
+        spec.pastify()
+    except rtamt.RTAMTException as err:
+        print('RTAMT Exception: {}'.format(err))
+        sys.exit()
+    return spec
+
+# returns the mean update time and the reset time of the spec, in seconds
+def run(spec, aTraj, bTraj):
+    start = time.time()
+    for i in range(len(aTraj)):
+        spec.update(i, [('a', aTraj[i]), ('b', bTraj[i])])
+    end = time.time()
+    time_update = (end - start) / len(aTraj)
+
+    start = time.time()
+    spec.reset()
+    end = time.time()
+    time_reset = end - start
+
+    return time_update, time_reset
+
 def monitor():
     # data
-    dataSet = {
-         'a': [(0, 100.0), (1, -1.0), (2, -2.0)],
-         'b': [(0, 20.0), (1, 2.0), (2, -10.0)]
-    }
+    aTraj = [random.uniform(-10, 10) for i in range(SAMPLES)]
+    bTraj = [random.uniform(-10, 10) for i in range(SAMPLES)]
+
+    print('{0:>8} | {1:>18} | {2:>18} | {3:>18} | {4:>18}'.format(
+        'Bound', 'Python update [us]', 'CPP update [us]', 'Python reset [us]', 'CPP reset [us]'))
 
     for i in range(0,7):
 
         bound = 10**i
         bound_str = str(bound)
 
-        spec_python = rtamt.StlDiscreteTimeSpecification()
-        spec_python.name = 'PythonMonitor'
-        spec_python.declare_var('a', 'float')
-        spec_python.declare_var('b', 'float')
-        spec_python.declare_var('c', 'float')
-        spec_python.spec = 'c = always[0:' + bound_str + '](a + b >= - 2)'
-
-        spec_cpp = rtamt.StlDiscreteTimeSpecificationCpp()
-        spec_cpp.name = 'CPPMonitor'
-        spec_cpp.declare_var('a', 'float')
-        spec_cpp.declare_var('b', 'float')
-        spec_cpp.declare_var('c', 'float')
-        spec_cpp.spec = 'c = always[0:' + bound_str + '](a + b >= - 2)'
-
-        try:
-            spec_python.parse()
-            spec_cpp.parse()
-        except rtamt.RTAMTException as err:
-            print('RTAMT Exception: {}'.format(err))
-            sys.exit()
-
-        # # eval
-        aTraj = dataSet['a']
-        bTraj = dataSet['b']
-        for i in range(len(dataSet['a'])):
-            aData = aTraj[i]
-            bData = bTraj[i]
-            start_python = time.time()
-            spec_python.update(aData[0], [('a', aData[1]), ('b', bData[1])])
-            end_python = time.time()
-            start_cpp = time.time()
-            spec_cpp.update(aData[0], [('a', aData[1]), ('b', bData[1])])
-            end_cpp = time.time()
-
-            time_python = end_python - start_python
-            time_cpp = end_cpp - start_cpp
-
-            print('Bound {0} - Python time {1} - CPP time {2}'.format(bound, time_python, time_cpp))
+        spec_python = create_spec(rtamt.StlDiscreteTimeOnlineSpecification, 'PythonMonitor', bound_str)
+        spec_cpp = create_spec(rtamt.StlDiscreteTimeOnlineSpecificationCpp, 'CPPMonitor', bound_str)
+
+        # the update time should not grow with the bound
+        update_python, reset_python = run(spec_python, aTraj, bTraj)
+        update_cpp, reset_cpp = run(spec_cpp, aTraj, bTraj)
+
+        print('{0:>8} | {1:>18.2f} | {2:>18.2f} | {3:>18.2f} | {4:>18.2f}'.format(
+            bound, update_python * 1e6, update_cpp * 1e6, reset_python * 1e6, reset_cpp * 1e6))
 
 
 if __name__ == '__main__':
     # Process arguments
 
-    monitor()
\ No newline at end of file
+    monitor()
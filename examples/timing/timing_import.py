@@ -0,0 +1,45 @@
+import sys
+import time
+import subprocess
+
+# number of runs of every command, the best one is reported
+REPEAT = 10
+
+BASELINE = 'pass'
+
+IMPORT = 'import rtamt'
+
+FIRST_MONITOR = '''
+import rtamt
+spec = rtamt.StlDiscreteTimeSpecification()
+spec.declare_var('req', 'float')
+spec.declare_var('gnt', 'float')
+spec.spec = '(req >= 3) implies (once[0:5](gnt >= 3))'
+spec.parse()
+spec.update(0, [('req', 0.1), ('gnt', 0.3)])
+'''
+
+# returns the best wall time of a fresh interpreter running the code, in seconds
+def run(code):
+    best = None
+    for i in range(REPEAT):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', code])
+        end = time.time()
+        if best is None or end - start < best:
+            best = end - start
+    return best
+
+def monitor():
+    baseline = run(BASELINE)
+
+    print('{0:>16} | {1:>10} | {2:>14}'.format('Command', 'Time [s]', 'Without Python'))
+    for name, code in [('python', BASELINE), ('import rtamt', IMPORT), ('first monitor', FIRST_MONITOR)]:
+        t = run(code)
+        print('{0:>16} | {1:>10.3f} | {2:>14.3f}'.format(name, t, t - baseline))
+
+
+if __name__ == '__main__':
+    # Process arguments
+
+    monitor()
@@ -0,0 +1,57 @@
+import sys
+import time
+import array
+import random
+from multiprocessing import cpu_count
+import rtamt
+
+# number of monitors and of samples fed to every monitor
+MONITORS = 32
+SAMPLES = 100000
+
+def create_spec():
+    spec = rtamt.StlDiscreteTimeOnlineSpecificationCpp()
+    spec.declare_var('a', 'float')
+    spec.declare_var('b', 'float')
+    spec.declare_var('c', 'float')
+    spec.spec = 'c = always[0:100]((a >= 2) -> eventually[0:10](b >= 0))'
+
+    try:
+        spec.parse()
+        spec.pastify()
+    except rtamt.RTAMTException as err:
+        print('RTAMT Exception: {}'.format(err))
+        sys.exit()
+    return spec
+
+def monitor():
+    # data
+    timestamps = array.array('d', range(SAMPLES))
+    datasets = []
+    for i in range(MONITORS):
+        aTraj = array.array('d', [random.uniform(-10, 10) for k in range(SAMPLES)])
+        bTraj = array.array('d', [random.uniform(-10, 10) for k in range(SAMPLES)])
+        datasets.append([('a', aTraj), ('b', bTraj)])
+    outs = [array.array('d', [0.0]) * SAMPLES for i in range(MONITORS)]
+
+    print('{0} monitors, {1} samples each, {2} cores'.format(MONITORS, SAMPLES, cpu_count()))
+    print('{0:>8} | {1:>10} | {2:>8}'.format('Workers', 'Time [s]', 'Speedup'))
+
+    workers = 1
+    time_single = None
+    while workers <= 2 * cpu_count():
+        with rtamt.MonitorGroup([create_spec() for i in range(MONITORS)], workers) as group:
+            start = time.time()
+            group.update_batch(timestamps, datasets, outs)
+            end = time.time()
+
+        if time_single is None:
+            time_single = end - start
+        print('{0:>8} | {1:>10.3f} | {2:>8.2f}'.format(workers, end - start, time_single / (end - start)))
+        workers = 2 * workers
+
+
+if __name__ == '__main__':
+    # Process arguments
+
+    monitor()
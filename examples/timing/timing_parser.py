@@ -0,0 +1,59 @@
+import sys
+import time
+import random
+import rtamt
+
+from rtamt.syntax.ast.parser.ast_cache import ast_cache
+
+# number of variables and of assertions in the specification file
+VARIABLES = 50
+ASSERTIONS = 300
+REPEAT = 5
+
+def create_spec_file():
+    lines = ['float x{}'.format(i) for i in range(VARIABLES)]
+    lines = lines + ['float s{}'.format(i) for i in range(ASSERTIONS)] + ['float out']
+    for i in range(ASSERTIONS):
+        a, b = random.sample(range(VARIABLES), 2)
+        lines.append('s{0} = always[0,{1}]((x{2} >= {3}) -> eventually[1:{4}](x{2} + x{5} <= 2.5 and not(x{5} < -1)));'
+                     .format(i, i % 10 + 1, a, i % 7, i % 5 + 1, b))
+    lines.append('out = s0 or s1;')
+    return '\n'.join(lines)
+
+# returns the best parse time of the spec over REPEAT runs, in seconds
+def parse(text, parser_type):
+    best = None
+    for i in range(REPEAT):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.parser_type = parser_type
+        spec.spec = text
+        try:
+            start = time.time()
+            spec.parse()
+            end = time.time()
+        except rtamt.RTAMTException as err:
+            print('RTAMT Exception: {}'.format(err))
+            sys.exit()
+        if best is None or end - start < best:
+            best = end - start
+    return best
+
+def monitor():
+    # parse every specification
+    ast_cache.enabled = False
+    text = create_spec_file()
+
+    print('{0} assertions over {1} variables'.format(ASSERTIONS, VARIABLES))
+    print('{0:>8} | {1:>10} | {2:>8}'.format('Parser', 'Time [s]', 'Speedup'))
+    time_antlr = None
+    for parser_type in [rtamt.ParserType.ANTLR, rtamt.ParserType.PRATT]:
+        t = parse(text, parser_type)
+        if time_antlr is None:
+            time_antlr = t
+        print('{0:>8} | {1:>10.3f} | {2:>8.2f}'.format(str(parser_type), t, time_antlr / t))
+
+
+if __name__ == '__main__':
+    # Process arguments
+
+    monitor()
@@ -1,13 +1,53 @@
+import sys
+import importlib
+
 from rtamt.exception.exception import RTAMTException
 from rtamt.semantics.enumerations.io_type import StlIOType
-from rtamt.semantics.enumerations.options import Language, Semantics, TimeInterpretation
-
-from rtamt.spec.stl.discrete_time.specification import StlDiscreteTimeSpecification
-from rtamt.spec.stl.discrete_time.specification import StlDiscreteTimeSpecification as STLSpecification # for old API
-from rtamt.spec.stl.discrete_time.specification import StlDiscreteTimeOfflineSpecification
-from rtamt.spec.stl.discrete_time.specification import StlDiscreteTimeOnlineSpecification
-from rtamt.spec.stl.discrete_time.specification import StlDiscreteTimeOnlineSpecificationCpp
-from rtamt.spec.stl.dense_time.specification import StlDenseTimeSpecification
-from rtamt.spec.stl.dense_time.specification import StlDenseTimeSpecification as STLCTSpecification # for old API
-from rtamt.spec.stl.dense_time.specification import StlDenseTimeOfflineSpecification
-from rtamt.spec.stl.dense_time.specification import StlDenseTimeOnlineSpecification
+from rtamt.semantics.enumerations.options import Language, Semantics, TimeInterpretation, BufferPolicy, ParserType
+from rtamt.semantics.enumerations.verdict import Verdict
+
+# The specifications pull in the parsers, interpreters and the ANTLR runtime,
+# they are imported on first access (PEP 562) - public name: (module, attribute)
+_LAZY_ATTRIBUTES = {
+    'DenseTimeSignal': ('rtamt.semantics.dense_time_signal', 'DenseTimeSignal'),
+
+    'StlDiscreteTimeSpecification': ('rtamt.spec.stl.discrete_time.specification', 'StlDiscreteTimeSpecification'),
+    'STLSpecification': ('rtamt.spec.stl.discrete_time.specification', 'StlDiscreteTimeSpecification'), # for old API
+    'StlDiscreteTimeOfflineSpecification': ('rtamt.spec.stl.discrete_time.specification',
+                                            'StlDiscreteTimeOfflineSpecification'),
+    'StlDiscreteTimeOnlineSpecification': ('rtamt.spec.stl.discrete_time.specification',
+                                           'StlDiscreteTimeOnlineSpecification'),
+    'StlDiscreteTimeOnlineSpecificationCpp': ('rtamt.spec.stl.discrete_time.specification',
+                                              'StlDiscreteTimeOnlineSpecificationCpp'),
+    'MonitorGroup': ('rtamt.spec.stl.discrete_time.monitor_group', 'MonitorGroup'),
+    'StlDenseTimeSpecification': ('rtamt.spec.stl.dense_time.specification', 'StlDenseTimeSpecification'),
+    'STLCTSpecification': ('rtamt.spec.stl.dense_time.specification', 'StlDenseTimeSpecification'), # for old API
+    'StlDenseTimeOfflineSpecification': ('rtamt.spec.stl.dense_time.specification',
+                                         'StlDenseTimeOfflineSpecification'),
+    'StlDenseTimeOnlineSpecification': ('rtamt.spec.stl.dense_time.specification',
+                                        'StlDenseTimeOnlineSpecification')
+}
+
+__all__ = ['RTAMTException', 'StlIOType', 'Language', 'Semantics', 'TimeInterpretation', 'BufferPolicy',
+           'ParserType', 'Verdict'] + sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module_name), attribute)
+    # later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# module __getattr__ is only supported from Python 3.7
+if sys.version_info < (3, 7):
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
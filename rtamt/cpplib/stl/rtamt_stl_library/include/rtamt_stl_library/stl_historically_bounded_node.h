@@ -1,7 +1,7 @@
 #ifndef STL_HISTORICALLY_BOUNDED_NODE_H
 #define STL_HISTORICALLY_BOUNDED_NODE_H
 
-#include <boost/circular_buffer.hpp>
+#include <rtamt_stl_library/stl_sliding_window.h>
 
 namespace stl_library {
 
@@ -9,16 +9,17 @@ class StlHistoricallyBoundedNode {
     private:
         int begin;
         int end;
-        boost::circular_buffer<double> buffer;
+        long counter;
+        // samples younger than begin are not yet visible in the window
+        StlDelayLine delay;
+        StlMonotonicWedge wedge;
 
     public:
         StlHistoricallyBoundedNode(int begin, int end);
         double update(double sample);
         void reset();
-       
 };
 
 } // namespace stl_library
 
 #endif /* STL_HISTORICALLY_BOUNDED_NODE_H */
-
@@ -0,0 +1,76 @@
+#ifndef STL_MONITOR_H
+#define STL_MONITOR_H
+
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <rtamt_stl_library/stl_comp_op.h>
+#include <rtamt_stl_library/stl_sliding_window.h>
+
+namespace stl_library {
+
+// One node of the compiled graph, reading its inputs from and writing its
+// output to the value slots of the monitor
+class StlMonitorInstruction {
+    public:
+        int left;
+        int right;
+        int out;
+
+        virtual ~StlMonitorInstruction() {}
+        virtual double update(double left, double right) = 0;
+        virtual void reset() = 0;
+};
+
+// A monitor owning the whole node graph of a specification. The graph is a
+// flat list of instructions in topological order, so a single update call
+// evaluates every node on the current sample.
+class StlMonitor {
+    private:
+        std::vector<double> values;
+        std::vector<int> variable_slots;
+        std::vector<std::unique_ptr<StlMonitorInstruction> > instructions;
+        // one history per delayed slot, shared by all its delays and owned
+        // by the instruction that records it
+        std::vector<int> history_slots;
+        std::vector<StlSampleHistory*> histories;
+        int out_slot;
+        double timestamp;
+
+        int add_slot(double value);
+        int add_instruction(StlMonitorInstruction* instruction, int left, int right);
+
+    public:
+        StlMonitor();
+        StlMonitor(const StlMonitor&) = delete;
+        StlMonitor& operator=(const StlMonitor&) = delete;
+
+        int add_variable();
+        int add_constant(double value);
+        int add_predicate(StlComparisonOperator op, int left, int right);
+        int add_unary(const std::string& op, int child);
+        int add_binary(const std::string& op, int left, int right);
+        int add_unary_bounded(const std::string& op, int child, int begin, int end);
+        int add_binary_bounded(const std::string& op, int left, int right, int begin, int end);
+        int add_delay(int child, int delay);
+        void set_out(int slot);
+
+        double update(double timestamp, const double* inputs);
+        double update(double timestamp, const std::vector<double>& inputs);
+        void update_batch(std::size_t length, const double* timestamps,
+                          const std::vector<const double*>& columns, double* out);
+        void reset();
+
+        double value(int slot) const;
+        double get_timestamp() const;
+        int variable_count() const;
+        int slot_count() const;
+
+        static int count_sampling_violations(std::size_t length, const double* timestamps, double previous,
+                                             double normalize, double lower, double upper);
+};
+
+} // namespace stl_library
+
+#endif /* STL_MONITOR_H */
@@ -1,7 +1,7 @@
 #ifndef STL_ONCE_BOUNDED_NODE_H
 #define STL_ONCE_BOUNDED_NODE_H
 
-#include <boost/circular_buffer.hpp>
+#include <rtamt_stl_library/stl_sliding_window.h>
 
 namespace stl_library {
 
@@ -9,7 +9,10 @@ class StlOnceBoundedNode {
     private:
         int begin;
         int end;
-        boost::circular_buffer<double> buffer;
+        long counter;
+        // samples younger than begin are not yet visible in the window
+        StlDelayLine delay;
+        StlMonotonicWedge wedge;
 
     public:
         StlOnceBoundedNode(int begin, int end);
@@ -20,4 +23,3 @@ class StlOnceBoundedNode {
 } // namespace stl_library
 
 #endif /* STL_ONCE_BOUNDED_NODE_H */
-
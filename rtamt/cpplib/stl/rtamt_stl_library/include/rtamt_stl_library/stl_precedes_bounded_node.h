@@ -1,7 +1,8 @@
 #ifndef STL_PRECEDES_BOUNDED_NODE_H
 #define STL_PRECEDES_BOUNDED_NODE_H
 
-#include <boost/circular_buffer.hpp>
+#include <rtamt_stl_library/stl_sliding_window.h>
+#include <vector>
 
 namespace stl_library {
 
@@ -9,8 +10,32 @@ class StlPrecedesBoundedNode {
     private:
         int begin;
         int end;
-        boost::circular_buffer<double> buffer[2];
-        
+        long counter;
+        struct Sample {
+            long index;
+            double left;
+            double right;
+        };
+        // summary of a segment of samples, see stl_precedes_bounded_node.cpp
+        struct Summary {
+            double out;
+            double left;
+        };
+        struct FrontSample {
+            long index;
+            double left;
+            Summary summary;
+        };
+
+        // two-stack queue over the samples [t-end+begin, t]
+        std::vector<Sample> back;
+        Summary back_summary;
+        std::vector<FrontSample> front;
+        // min of left over [t-end, t-end+begin-1]
+        StlMonotonicWedge wedge_left;
+
+        static Summary compose(const Summary& first, const Summary& second);
+
     public:
         StlPrecedesBoundedNode(int begin, int end);
         double update(double left, double right);
@@ -20,4 +45,3 @@ class StlPrecedesBoundedNode {
 } // namespace stl_library
 
 #endif /* STL_PRECEDES_BOUNDED_NODE_H */
-
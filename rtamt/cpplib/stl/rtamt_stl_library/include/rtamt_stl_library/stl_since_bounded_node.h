@@ -1,7 +1,7 @@
 #ifndef STL_SINCE_BOUNDED_NODE_H
 #define STL_SINCE_BOUNDED_NODE_H
 
-#include <boost/circular_buffer.hpp>
+#include <rtamt_stl_library/stl_sliding_window.h>
 
 namespace stl_library {
 
@@ -9,16 +9,20 @@ class StlSinceBoundedNode {
     private:
         int begin;
         int end;
-        boost::circular_buffer<double> buffer[2];
+        long counter;
+        // right samples younger than begin are not yet candidates
+        StlDelayLine delay_right;
+        // min of the last begin left samples
+        StlMonotonicWedge wedge_left;
+        // candidates min(right(s), left(s+1..t)) for s in [t-end, t-begin]
+        StlMonotonicWedge wedge_candidates;
 
     public:
         StlSinceBoundedNode(int begin, int end);
         double update(double left, double right);
         void reset();
-       
 };
 
 } // namespace stl_library
 
 #endif /* STL_SINCE_BOUNDED_NODE_H */
-
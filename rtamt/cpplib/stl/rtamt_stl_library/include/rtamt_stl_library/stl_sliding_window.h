@@ -0,0 +1,73 @@
+#ifndef STL_SLIDING_WINDOW_H
+#define STL_SLIDING_WINDOW_H
+
+#include <cstddef>
+#include <vector>
+
+namespace stl_library {
+
+// Streaming sliding-window extremum (Lemire's monotonic wedge). Samples are
+// pushed with their (increasing) index and the wedge only keeps the samples
+// that can still become the extremum of the window, so push, evict and front
+// are amortized O(1) regardless of the window length. The samples live in a
+// ring that grows on demand and is never shrunk, so reset is O(1).
+class StlMonotonicWedge {
+    private:
+        bool is_max;
+        double empty_value;
+        std::vector<long> indices;
+        std::vector<double> values;
+        std::size_t head;
+        std::size_t count;
+
+        bool dominates(double value, double old) const;
+        std::size_t position(std::size_t i) const;
+        void grow();
+
+    public:
+        StlMonotonicWedge(bool is_max);
+        void push(long index, double value);
+        // drop all samples with index strictly smaller than index
+        void evict(long index);
+        // replace every sample v by min(v, value) for a max wedge and by
+        // max(v, value) for a min wedge
+        void clip(double value);
+        double front() const;
+        void reset();
+};
+
+// Delays a stream by a fixed number of samples
+class StlDelayLine {
+    private:
+        std::vector<double> buffer;
+        std::size_t head;
+        std::size_t count;
+
+    public:
+        StlDelayLine(int delay);
+        // returns false while fewer than delay samples are buffered, otherwise
+        // sets out to the sample pushed delay samples ago
+        bool push(double sample, double& out);
+        void reset();
+};
+
+// The last samples of a stream, readable at any delay up to the capacity
+class StlSampleHistory {
+    private:
+        std::vector<double> buffer;
+        std::size_t head;
+        std::size_t count;
+
+    public:
+        StlSampleHistory();
+        // makes room for reading at the given delay
+        void reserve(int delay);
+        void push(double sample);
+        // the sample pushed delay samples ago, -inf if there is none yet
+        double get(int delay) const;
+        void reset();
+};
+
+} // namespace stl_library
+
+#endif /* STL_SLIDING_WINDOW_H */
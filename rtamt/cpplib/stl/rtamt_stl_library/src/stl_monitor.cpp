@@ -0,0 +1,311 @@
+#include <rtamt_stl_library/stl_monitor.h>
+#include <rtamt_stl_library/stl_predicate_node.h>
+#include <rtamt_stl_library/stl_not_node.h>
+#include <rtamt_stl_library/stl_abs_node.h>
+#include <rtamt_stl_library/stl_exp_node.h>
+#include <rtamt_stl_library/stl_sqrt_node.h>
+#include <rtamt_stl_library/stl_rise_node.h>
+#include <rtamt_stl_library/stl_fall_node.h>
+#include <rtamt_stl_library/stl_previous_node.h>
+#include <rtamt_stl_library/stl_once_node.h>
+#include <rtamt_stl_library/stl_historically_node.h>
+#include <rtamt_stl_library/stl_addition_node.h>
+#include <rtamt_stl_library/stl_subtraction_node.h>
+#include <rtamt_stl_library/stl_multiplication_node.h>
+#include <rtamt_stl_library/stl_division_node.h>
+#include <rtamt_stl_library/stl_pow_node.h>
+#include <rtamt_stl_library/stl_and_node.h>
+#include <rtamt_stl_library/stl_or_node.h>
+#include <rtamt_stl_library/stl_implies_node.h>
+#include <rtamt_stl_library/stl_iff_node.h>
+#include <rtamt_stl_library/stl_xor_node.h>
+#include <rtamt_stl_library/stl_since_node.h>
+#include <rtamt_stl_library/stl_once_bounded_node.h>
+#include <rtamt_stl_library/stl_historically_bounded_node.h>
+#include <rtamt_stl_library/stl_since_bounded_node.h>
+#include <rtamt_stl_library/stl_precedes_bounded_node.h>
+#include <algorithm>
+#include <stdexcept>
+
+using namespace stl_library;
+
+namespace {
+
+template <class Node>
+class StlUnaryInstruction : public StlMonitorInstruction {
+    private:
+        Node node;
+
+    public:
+        StlUnaryInstruction(const Node& node) : node(node) {}
+        double update(double left, double right) { return node.update(left); }
+        void reset() { node.reset(); }
+};
+
+template <class Node>
+class StlBinaryInstruction : public StlMonitorInstruction {
+    private:
+        Node node;
+
+    public:
+        StlBinaryInstruction(const Node& node) : node(node) {}
+        double update(double left, double right) { return node.update(left, right); }
+        void reset() { node.reset(); }
+};
+
+// Pushes the child into its history, placed before the instructions reading it
+class StlRecordInstruction : public StlMonitorInstruction {
+    public:
+        StlSampleHistory history;
+
+        double update(double left, double right) { history.push(left); return left; }
+        void reset() { history.reset(); }
+};
+
+// once[delay,delay](child), read from the history of child
+class StlDelayInstruction : public StlMonitorInstruction {
+    private:
+        const StlSampleHistory* history;
+        int delay;
+
+    public:
+        StlDelayInstruction(const StlSampleHistory* history, int delay) : history(history), delay(delay) {}
+        double update(double left, double right) { return history->get(delay); }
+        void reset() {}
+};
+
+template <class Node>
+StlMonitorInstruction* unary(const Node& node) {
+    return new StlUnaryInstruction<Node>(node);
+}
+
+template <class Node>
+StlMonitorInstruction* binary(const Node& node) {
+    return new StlBinaryInstruction<Node>(node);
+}
+
+} // namespace
+
+StlMonitor::StlMonitor() {
+    out_slot = -1;
+    timestamp = 0;
+}
+
+int StlMonitor::add_slot(double value) {
+    values.push_back(value);
+    return values.size() - 1;
+}
+
+int StlMonitor::add_instruction(StlMonitorInstruction* instruction, int left, int right) {
+    std::unique_ptr<StlMonitorInstruction> owned(instruction);
+    int size = values.size();
+    if (left < 0 || left >= size || right < 0 || right >= size) {
+        throw std::out_of_range("input slot out of range");
+    }
+    owned->left = left;
+    owned->right = right;
+    owned->out = add_slot(0);
+    instructions.push_back(std::move(owned));
+    return instructions.back()->out;
+}
+
+int StlMonitor::add_variable() {
+    int slot = add_slot(0);
+    variable_slots.push_back(slot);
+    return slot;
+}
+
+int StlMonitor::add_constant(double value) {
+    return add_slot(value);
+}
+
+int StlMonitor::add_predicate(StlComparisonOperator op, int left, int right) {
+    return add_instruction(binary(StlPredicateNode(op)), left, right);
+}
+
+int StlMonitor::add_unary(const std::string& op, int child) {
+    StlMonitorInstruction* instruction;
+    if (op == "not") {
+        instruction = unary(StlNotNode());
+    } else if (op == "abs") {
+        instruction = unary(StlAbsNode());
+    } else if (op == "exp") {
+        instruction = unary(StlExpNode());
+    } else if (op == "sqrt") {
+        instruction = unary(StlSqrtNode());
+    } else if (op == "rise") {
+        instruction = unary(StlRiseNode());
+    } else if (op == "fall") {
+        instruction = unary(StlFallNode());
+    } else if (op == "previous") {
+        instruction = unary(StlPreviousNode());
+    } else if (op == "once") {
+        instruction = unary(StlOnceNode());
+    } else if (op == "historically") {
+        instruction = unary(StlHistoricallyNode());
+    } else {
+        throw std::invalid_argument("unknown unary operator " + op);
+    }
+    return add_instruction(instruction, child, child);
+}
+
+int StlMonitor::add_binary(const std::string& op, int left, int right) {
+    StlMonitorInstruction* instruction;
+    if (op == "addition") {
+        instruction = binary(StlAdditionNode());
+    } else if (op == "subtraction") {
+        instruction = binary(StlSubtractionNode());
+    } else if (op == "multiplication") {
+        instruction = binary(StlMultiplicationNode());
+    } else if (op == "division") {
+        instruction = binary(StlDivisionNode());
+    } else if (op == "pow") {
+        instruction = binary(StlPowNode());
+    } else if (op == "and") {
+        instruction = binary(StlAndNode());
+    } else if (op == "or") {
+        instruction = binary(StlOrNode());
+    } else if (op == "implies") {
+        instruction = binary(StlImpliesNode());
+    } else if (op == "iff") {
+        instruction = binary(StlIffNode());
+    } else if (op == "xor") {
+        instruction = binary(StlXorNode());
+    } else if (op == "since") {
+        instruction = binary(StlSinceNode());
+    } else {
+        throw std::invalid_argument("unknown binary operator " + op);
+    }
+    return add_instruction(instruction, left, right);
+}
+
+int StlMonitor::add_unary_bounded(const std::string& op, int child, int begin, int end) {
+    StlMonitorInstruction* instruction;
+    if (op == "once") {
+        instruction = unary(StlOnceBoundedNode(begin, end));
+    } else if (op == "historically") {
+        instruction = unary(StlHistoricallyBoundedNode(begin, end));
+    } else {
+        throw std::invalid_argument("unknown bounded unary operator " + op);
+    }
+    return add_instruction(instruction, child, child);
+}
+
+int StlMonitor::add_binary_bounded(const std::string& op, int left, int right, int begin, int end) {
+    StlMonitorInstruction* instruction;
+    if (op == "since") {
+        instruction = binary(StlSinceBoundedNode(begin, end));
+    } else if (op == "precedes") {
+        instruction = binary(StlPrecedesBoundedNode(begin, end));
+    } else {
+        throw std::invalid_argument("unknown bounded binary operator " + op);
+    }
+    return add_instruction(instruction, left, right);
+}
+
+// The delays of the same slot share one history, sized by the longest delay
+int StlMonitor::add_delay(int child, int delay) {
+    if (delay < 0) {
+        throw std::invalid_argument("negative delay");
+    }
+    std::size_t i = std::find(history_slots.begin(), history_slots.end(), child) - history_slots.begin();
+    if (i == history_slots.size()) {
+        StlRecordInstruction* record = new StlRecordInstruction();
+        add_instruction(record, child, child);
+        history_slots.push_back(child);
+        histories.push_back(&record->history);
+    }
+    histories[i]->reserve(delay);
+    return add_instruction(new StlDelayInstruction(histories[i], delay), child, child);
+}
+
+void StlMonitor::set_out(int slot) {
+    if (slot < 0 || slot >= (int) values.size()) {
+        throw std::out_of_range("output slot out of range");
+    }
+    out_slot = slot;
+}
+
+// inputs holds one value per variable, in the order the variables were added
+double StlMonitor::update(double timestamp, const double* inputs) {
+    if (out_slot < 0) {
+        throw std::logic_error("the monitor has no output slot");
+    }
+    this->timestamp = timestamp;
+
+    std::size_t i;
+    for (i = 0; i < variable_slots.size(); i++) {
+        values[variable_slots[i]] = inputs[i];
+    }
+    for (i = 0; i < instructions.size(); i++) {
+        StlMonitorInstruction& instruction = *instructions[i];
+        values[instruction.out] = instruction.update(values[instruction.left], values[instruction.right]);
+    }
+    return values[out_slot];
+}
+
+double StlMonitor::update(double timestamp, const std::vector<double>& inputs) {
+    if (inputs.size() != variable_slots.size()) {
+        throw std::invalid_argument("expected one input per variable");
+    }
+    return update(timestamp, inputs.data());
+}
+
+// columns holds one column of length samples per variable, in the order the
+// variables were added, and out receives the length robustness values
+void StlMonitor::update_batch(std::size_t length, const double* timestamps,
+                              const std::vector<const double*>& columns, double* out) {
+    if (columns.size() != variable_slots.size()) {
+        throw std::invalid_argument("expected one input column per variable");
+    }
+    std::vector<double> inputs(columns.size());
+    std::size_t i;
+    std::size_t j;
+    for (i = 0; i < length; i++) {
+        for (j = 0; j < columns.size(); j++) {
+            inputs[j] = columns[j][i];
+        }
+        out[i] = update(timestamps[i], inputs.data());
+    }
+}
+
+void StlMonitor::reset() {
+    std::size_t i;
+    for (i = 0; i < instructions.size(); i++) {
+        instructions[i]->reset();
+    }
+    timestamp = 0;
+}
+
+double StlMonitor::value(int slot) const {
+    return values.at(slot);
+}
+
+double StlMonitor::get_timestamp() const {
+    return timestamp;
+}
+
+int StlMonitor::variable_count() const {
+    return variable_slots.size();
+}
+
+int StlMonitor::slot_count() const {
+    return values.size();
+}
+
+// Counts the durations between consecutive timestamps, scaled by normalize, that
+// fall outside [lower, upper]. The first duration is measured from previous, it
+// is skipped when previous is NaN.
+int StlMonitor::count_sampling_violations(std::size_t length, const double* timestamps, double previous,
+                                          double normalize, double lower, double upper) {
+    int violations = 0;
+    std::size_t i;
+    for (i = 0; i < length; i++) {
+        double duration = (timestamps[i] - previous) * normalize;
+        if (duration < lower || duration > upper) {
+            violations++;
+        }
+        previous = timestamps[i];
+    }
+    return violations;
+}
@@ -1,41 +1,26 @@
 #include <rtamt_stl_library/stl_once_bounded_node.h>
-#include <algorithm>
-#include <limits>
 
 using namespace stl_library;
 
-// Initialize previous and current value
-StlOnceBoundedNode::StlOnceBoundedNode(int begin, int end) {
+// The window [t-end, t-begin] is a max wedge fed through a delay of begin samples
+StlOnceBoundedNode::StlOnceBoundedNode(int begin, int end) : delay(begin), wedge(true) {
     this->begin = begin;
     this->end = end;
-    this->buffer = boost::circular_buffer<double>(end+1);
-    
-    int i;
-    for(i=0; i <= end; i++) {
-        double s;
-        s = - std::numeric_limits<double>::infinity();
-        this->buffer.push_back(s);
-    }
+    this->counter = 0;
 }
 
 void StlOnceBoundedNode::reset() {
-    int i;
-    for(i=0; i <= end; i++) {
-        double s;
-        s = - std::numeric_limits<double>::infinity();
-        this->buffer.push_back(s);
-    }
+    counter = 0;
+    delay.reset();
+    wedge.reset();
 }
 
 double StlOnceBoundedNode::update(double sample) {
-    double out;
-
-    this->buffer.push_back(sample);
-    
-    out = - std::numeric_limits<double>::infinity();
-    int i;
-    for (i=0; i <= end - begin; i++) {
-        out = std::max(out, buffer[i]);
+    double delayed;
+    if (delay.push(sample, delayed)) {
+        wedge.push(counter - begin, delayed);
     }
-    return out;
-}
\ No newline at end of file
+    wedge.evict(counter - end);
+    counter++;
+    return wedge.front();
+}
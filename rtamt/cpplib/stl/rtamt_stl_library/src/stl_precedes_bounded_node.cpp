@@ -4,54 +4,65 @@
 
 using namespace stl_library;
 
-// Initialize previous and current value
-StlPrecedesBoundedNode::StlPrecedesBoundedNode(int begin, int end) {
+// The segment [t-end+begin, t] is summarized by the pair
+// (max_s min(right(s), min left[t-end+begin..s-1]), min left[t-end+begin..t])
+// which composes associatively, so it is maintained with a two-stack queue.
+namespace {
+const double INF = std::numeric_limits<double>::infinity();
+}
+
+StlPrecedesBoundedNode::StlPrecedesBoundedNode(int begin, int end) : wedge_left(false) {
     this->begin = begin;
     this->end = end;
-    this->buffer[0] = boost::circular_buffer<double>(end+1);
-    this->buffer[1] = boost::circular_buffer<double>(end+1);
-    
-    int i;
-    for(i=0; i <= end; i++) {
-        double s_left;
-        double s_right;
-        s_left = std::numeric_limits<double>::infinity();
-        s_right = - std::numeric_limits<double>::infinity();
-        this->buffer[0].push_back(s_left);
-        this->buffer[1].push_back(s_right);
-    }
+    reset();
+}
+
+StlPrecedesBoundedNode::Summary StlPrecedesBoundedNode::compose(const Summary& first, const Summary& second) {
+    Summary summary;
+    summary.out = std::max(first.out, std::min(first.left, second.out));
+    summary.left = std::min(first.left, second.left);
+    return summary;
 }
 
 void StlPrecedesBoundedNode::reset() {
-    int i;
-    for(i=0; i <= end; i++) {
-        double s_left;
-        double s_right;
-        s_left = std::numeric_limits<double>::infinity();
-        s_right = - std::numeric_limits<double>::infinity();
-        this->buffer[0].push_back(s_left);
-        this->buffer[1].push_back(s_right);
-    }
+    counter = 0;
+    back.clear();
+    back_summary.out = -INF;
+    back_summary.left = INF;
+    front.clear();
+    wedge_left.reset();
 }
 
 double StlPrecedesBoundedNode::update(double left, double right) {
-    double out;
-
-    this->buffer[0].push_back(left);
-    this->buffer[1].push_back(right);
-    
-    out = - std::numeric_limits<double>::infinity();
-    int i;
-    for (i=begin; i <= end; i++) {
-        double left; 
-        double right;
-        right = buffer[1][i];
-        left = std::numeric_limits<double>::infinity();
-        int j;
-        for(j=0; j < i; j++) {
-            left = std::min(left, buffer[0][j]);
+    Sample sample = {counter, left, right};
+    Summary sample_summary = {right, left};
+    back.push_back(sample);
+    back_summary = compose(back_summary, sample_summary);
+
+    if ((long) (back.size() + front.size()) > end - begin + 1) {
+        if (front.empty()) {
+            Summary summary = {-INF, INF};
+            while (!back.empty()) {
+                Sample s = back.back();
+                back.pop_back();
+                Summary s_summary = {s.right, s.left};
+                summary = compose(s_summary, summary);
+                FrontSample f = {s.index, s.left, summary};
+                front.push_back(f);
+            }
+            back_summary.out = -INF;
+            back_summary.left = INF;
         }
-        out = std::max(out, std::min(left, right));
+        wedge_left.push(front.back().index, front.back().left);
+        front.pop_back();
+    }
+    wedge_left.evict(counter - end);
+
+    Summary summary = back_summary;
+    if (!front.empty()) {
+        summary = compose(front.back().summary, back_summary);
     }
-    return out;
-}
\ No newline at end of file
+
+    counter++;
+    return std::min(wedge_left.front(), summary.out);
+}
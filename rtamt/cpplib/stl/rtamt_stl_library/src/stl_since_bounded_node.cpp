@@ -1,57 +1,37 @@
 #include <rtamt_stl_library/stl_since_bounded_node.h>
 #include <algorithm>
-#include <limits>
 
 using namespace stl_library;
 
-// Initialize previous and current value
-StlSinceBoundedNode::StlSinceBoundedNode(int begin, int end) {
+// Every right sample s becomes a candidate min(right(s), left(s+1..t)) once it is
+// begin samples old. The candidates of the window [t-end, t-begin] are kept in a
+// max wedge and clipped by every new left sample.
+StlSinceBoundedNode::StlSinceBoundedNode(int begin, int end) : delay_right(begin), wedge_left(false),
+                                                               wedge_candidates(true) {
     this->begin = begin;
     this->end = end;
-    this->buffer[0] = boost::circular_buffer<double>(end+1);
-    this->buffer[1] = boost::circular_buffer<double>(end+1);
-    
-    int i;
-    for(i=0; i <= end; i++) {
-        double s_left;
-        double s_right;
-        s_left = std::numeric_limits<double>::infinity();
-        s_right = - std::numeric_limits<double>::infinity();
-        this->buffer[0].push_back(s_left);
-        this->buffer[1].push_back(s_right);
-    }
+    this->counter = 0;
 }
 
 void StlSinceBoundedNode::reset() {
-    int i;
-    for(i=0; i <= end; i++) {
-        double s_left;
-        double s_right;
-        s_left = std::numeric_limits<double>::infinity();
-        s_right = - std::numeric_limits<double>::infinity();
-        this->buffer[0].push_back(s_left);
-        this->buffer[1].push_back(s_right);
-    }
+    counter = 0;
+    delay_right.reset();
+    wedge_left.reset();
+    wedge_candidates.reset();
 }
 
 double StlSinceBoundedNode::update(double left, double right) {
-    double out;
+    wedge_candidates.clip(left);
+
+    wedge_left.push(counter, left);
+    wedge_left.evict(counter - begin + 1);
 
-    this->buffer[0].push_back(left);
-    this->buffer[1].push_back(right);
-    
-    out = - std::numeric_limits<double>::infinity();
-    int i;
-    for (i=0; i <= end - begin; i++) {
-        double left; 
-        double right;
-        right = buffer[1][i];
-        left = std::numeric_limits<double>::infinity();
-        int j;
-        for(j=i + 1; j <= end; j++) {
-            left = std::min(left, buffer[0][j]);
-        }
-        out = std::max(out, std::min(left, right));
+    double delayed;
+    if (delay_right.push(right, delayed)) {
+        wedge_candidates.push(counter - begin, std::min(delayed, wedge_left.front()));
     }
-    return out;
-}
\ No newline at end of file
+    wedge_candidates.evict(counter - end);
+
+    counter++;
+    return wedge_candidates.front();
+}
@@ -0,0 +1,153 @@
+#include <rtamt_stl_library/stl_sliding_window.h>
+#include <limits>
+
+using namespace stl_library;
+
+StlMonotonicWedge::StlMonotonicWedge(bool is_max) {
+    this->is_max = is_max;
+    if (is_max) {
+        empty_value = - std::numeric_limits<double>::infinity();
+    } else {
+        empty_value = std::numeric_limits<double>::infinity();
+    }
+    // the capacity is kept a power of two
+    indices = std::vector<long>(16);
+    values = std::vector<double>(16);
+    head = 0;
+    count = 0;
+}
+
+bool StlMonotonicWedge::dominates(double value, double old) const {
+    if (is_max) {
+        return value >= old;
+    }
+    return value <= old;
+}
+
+std::size_t StlMonotonicWedge::position(std::size_t i) const {
+    return (head + i) & (values.size() - 1);
+}
+
+void StlMonotonicWedge::grow() {
+    std::size_t capacity = values.size();
+    std::vector<long> new_indices(2 * capacity);
+    std::vector<double> new_values(2 * capacity);
+    std::size_t i;
+    for (i = 0; i < count; i++) {
+        new_indices[i] = indices[position(i)];
+        new_values[i] = values[position(i)];
+    }
+    indices.swap(new_indices);
+    values.swap(new_values);
+    head = 0;
+}
+
+void StlMonotonicWedge::push(long index, double value) {
+    while (count > 0 && dominates(value, values[position(count - 1)])) {
+        count--;
+    }
+    if (count == values.size()) {
+        grow();
+    }
+    indices[position(count)] = index;
+    values[position(count)] = value;
+    count++;
+}
+
+void StlMonotonicWedge::evict(long index) {
+    while (count > 0 && indices[head] < index) {
+        head = position(1);
+        count--;
+    }
+}
+
+void StlMonotonicWedge::clip(double value) {
+    // the clipped samples collapse into the youngest of them
+    bool clipped = false;
+    long index = 0;
+    while (count > 0 && dominates(values[head], value)) {
+        index = indices[head];
+        head = position(1);
+        count--;
+        clipped = true;
+    }
+    if (clipped) {
+        head = position(values.size() - 1);
+        indices[head] = index;
+        values[head] = value;
+        count++;
+    }
+}
+
+double StlMonotonicWedge::front() const {
+    if (count > 0) {
+        return values[head];
+    }
+    return empty_value;
+}
+
+void StlMonotonicWedge::reset() {
+    head = 0;
+    count = 0;
+}
+
+StlDelayLine::StlDelayLine(int delay) {
+    buffer = std::vector<double>(delay);
+    head = 0;
+    count = 0;
+}
+
+bool StlDelayLine::push(double sample, double& out) {
+    if (buffer.empty()) {
+        out = sample;
+        return true;
+    }
+    if (count < buffer.size()) {
+        buffer[(head + count) % buffer.size()] = sample;
+        count++;
+        return false;
+    }
+    out = buffer[head];
+    buffer[head] = sample;
+    head = (head + 1) % buffer.size();
+    return true;
+}
+
+void StlDelayLine::reset() {
+    head = 0;
+    count = 0;
+}
+
+StlSampleHistory::StlSampleHistory() {
+    buffer = std::vector<double>(1);
+    head = 0;
+    count = 0;
+}
+
+void StlSampleHistory::reserve(int delay) {
+    if ((std::size_t) delay + 1 > buffer.size()) {
+        buffer = std::vector<double>(delay + 1);
+        reset();
+    }
+}
+
+// head is the position of the latest sample
+void StlSampleHistory::push(double sample) {
+    head = (head + 1) % buffer.size();
+    buffer[head] = sample;
+    if (count < buffer.size()) {
+        count++;
+    }
+}
+
+double StlSampleHistory::get(int delay) const {
+    if ((std::size_t) delay >= count) {
+        return - std::numeric_limits<double>::infinity();
+    }
+    return buffer[(head + buffer.size() - delay) % buffer.size()];
+}
+
+void StlSampleHistory::reset() {
+    head = 0;
+    count = 0;
+}
@@ -0,0 +1,140 @@
+#include <boost/python.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/module.hpp>
+#include <boost/python/wrapper.hpp>
+
+#include <cstring>
+#include <memory>
+#include <vector>
+
+#include <rtamt_stl_library/stl_monitor.h>
+#include <rtamt_stl_library/stl_comp_op.h>
+
+using namespace boost::python;
+using namespace stl_library;
+
+// Releases the GIL for the lifetime of the object, so that monitors can be
+// updated from several threads in parallel. Nothing in its scope may touch
+// Python objects. A monitor itself must not be updated by two threads at once.
+class ReleaseGil {
+    private:
+        PyThreadState* state;
+
+    public:
+        ReleaseGil() {
+            state = PyEval_SaveThread();
+        }
+
+        ~ReleaseGil() {
+            PyEval_RestoreThread(state);
+        }
+};
+
+// values - sequence of floats, one per variable in the order they were added
+double update(StlMonitor& monitor, double timestamp, object values) {
+    std::vector<double> inputs(len(values));
+    std::size_t i;
+    for (i = 0; i < inputs.size(); i++) {
+        inputs[i] = extract<double>(values[i]);
+    }
+    ReleaseGil release;
+    return monitor.update(timestamp, inputs);
+}
+
+// A view of a C-contiguous buffer of doubles (NumPy array, array.array('d'),
+// memoryview, ...), held for the lifetime of the object
+class DoubleBuffer {
+    private:
+        Py_buffer view;
+
+    public:
+        DoubleBuffer(object obj, bool writable) {
+            int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+            if (writable) {
+                flags |= PyBUF_WRITABLE;
+            }
+            if (PyObject_GetBuffer(obj.ptr(), &view, flags) != 0) {
+                throw_error_already_set();
+            }
+            const char* format = view.format;
+            if (format[0] == '@' || format[0] == '=' || format[0] == '<') {
+                format++;
+            }
+            if (view.itemsize != sizeof(double) || std::strcmp(format, "d") != 0) {
+                PyBuffer_Release(&view);
+                PyErr_SetString(PyExc_TypeError, "expected a contiguous buffer of doubles");
+                throw_error_already_set();
+            }
+        }
+
+        ~DoubleBuffer() {
+            PyBuffer_Release(&view);
+        }
+
+        double* data() {
+            return static_cast<double*>(view.buf);
+        }
+
+        std::size_t size() const {
+            return view.len / sizeof(double);
+        }
+};
+
+// timestamps - buffer of doubles
+// columns - sequence of buffers of doubles, one per variable in the order they were added
+// out - writable buffer of doubles receiving the robustness of every sample
+void update_batch(StlMonitor& monitor, object timestamps, object columns, object out) {
+    DoubleBuffer timestamps_buffer(timestamps, false);
+    DoubleBuffer out_buffer(out, true);
+    std::size_t length = timestamps_buffer.size();
+    if (out_buffer.size() < length) {
+        PyErr_SetString(PyExc_ValueError, "the output buffer is shorter than the timestamps");
+        throw_error_already_set();
+    }
+
+    std::vector<std::unique_ptr<DoubleBuffer> > buffers;
+    std::vector<const double*> inputs;
+    long i;
+    for (i = 0; i < len(columns); i++) {
+        buffers.push_back(std::unique_ptr<DoubleBuffer>(new DoubleBuffer(columns[i], false)));
+        if (buffers.back()->size() < length) {
+            PyErr_SetString(PyExc_ValueError, "an input column is shorter than the timestamps");
+            throw_error_already_set();
+        }
+        inputs.push_back(buffers.back()->data());
+    }
+
+    // the buffers stay exported, so their owners cannot resize them meanwhile
+    ReleaseGil release;
+    monitor.update_batch(length, timestamps_buffer.data(), inputs, out_buffer.data());
+}
+
+int count_sampling_violations(object timestamps, double previous, double normalize, double lower, double upper) {
+    DoubleBuffer timestamps_buffer(timestamps, false);
+    return StlMonitor::count_sampling_violations(timestamps_buffer.size(), timestamps_buffer.data(), previous,
+                                                 normalize, lower, upper);
+}
+
+BOOST_PYTHON_MODULE(stl_monitor)
+{
+    class_<StlMonitor, boost::noncopyable>("StlMonitor", init<>())
+        .def("add_variable", &StlMonitor::add_variable)
+        .def("add_constant", &StlMonitor::add_constant)
+        .def("add_predicate", &StlMonitor::add_predicate)
+        .def("add_unary", &StlMonitor::add_unary)
+        .def("add_binary", &StlMonitor::add_binary)
+        .def("add_unary_bounded", &StlMonitor::add_unary_bounded)
+        .def("add_binary_bounded", &StlMonitor::add_binary_bounded)
+        .def("add_delay", &StlMonitor::add_delay)
+        .def("set_out", &StlMonitor::set_out)
+        .def("update", &update)
+        .def("update_batch", &update_batch)
+        .def("reset", &StlMonitor::reset)
+        .def("value", &StlMonitor::value)
+        .def("variable_count", &StlMonitor::variable_count)
+        .def("slot_count", &StlMonitor::slot_count)
+        .add_property("timestamp", &StlMonitor::get_timestamp)
+    ;
+
+    def("count_sampling_violations", &count_sampling_violations);
+}
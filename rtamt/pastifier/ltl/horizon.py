@@ -8,6 +8,12 @@ class LtlHorizon(LtlAstVisitor):
     def __init__(self):
         self.horizons = dict()
 
+    def visit(self, node, *args, **kwargs):
+        # the horizon of a shared subformula is computed once
+        if node in self.horizons:
+            return self.horizons[node]
+        return LtlAstVisitor.visit(self, node, *args, **kwargs)
+
     def visitConstant(self, node, *args, **kwargs):
         out = 0
         self.horizons[node] = out
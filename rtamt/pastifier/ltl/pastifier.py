@@ -37,12 +37,13 @@ class LtlPastifier(LtlAstVisitor):
 
     def pastify(self, ast):
         self.ast = ast
+        self.index_names(ast)
         h = LtlHorizon()
         horizons = dict()
         for spec in ast.specs:
             horizon = h.visit(spec, None)
-            self.subformula_horizons = h.horizons
             horizons[spec] = horizon
+        self.subformula_horizons = h.horizons
         pastified_specs = []
         for spec in ast.specs:
             horizon = horizons[spec]
@@ -52,13 +53,29 @@ class LtlPastifier(LtlAstVisitor):
         ast.specs = pastified_specs
         return ast
 
+    def index_names(self, ast):
+        # reverse index of phi_name_to_node_dict, so that renaming a visited node
+        # does not scan the whole dictionary
+        self.node_names = dict()
+        for name, node in ast.phi_name_to_node_dict.items():
+            self.node_names.setdefault(node, []).append(name)
+        # a subformula shared in the DAG is pastified once per remaining horizon
+        self.pastified = dict()
+
     def visit(self, node, *args, **kwargs):
+        key = (node, args[0])
+        if key in self.pastified:
+            return self.pastified[key]
         out = LtlAstVisitor.visit(self, node, *args, **kwargs)
-        d = self.ast.phi_name_to_node_dict
-        keys = [k for k, v in d.items() if v == node]
-        self.ast.phi_name_to_node_dict.update({key: out for key in keys})
+        self.rename(node, out)
+        self.pastified[key] = out
         return out
 
+    def rename(self, node, out):
+        # the names of a node refer to its first pastified version
+        for name in self.node_names.pop(node, []):
+            self.ast.phi_name_to_node_dict[name] = out
+
     def visitConstant(self, node, *args, **kwargs):
         node = Constant(node.val)
         return node
@@ -10,6 +10,9 @@ class StlHorizon(LtlHorizon, StlAstVisitor):
         LtlHorizon.__init__(self)
 
     def visit(self, node, *args, **kwargs):
+        # the horizon of a shared subformula is computed once
+        if node in self.horizons:
+            return self.horizons[node]
         return StlAstVisitor.visit(self, node, *args, **kwargs)
 
     def visitTimedEventually(self, node, *args, **kwargs):
@@ -43,12 +43,13 @@ class StlPastifier(LtlPastifier, StlAstVisitor):
 
     def pastify(self, ast):
         self.ast = ast
+        self.index_names(ast)
         h = StlHorizon()
         horizons = dict()
         for spec in ast.specs:
             horizon = h.visit(spec, None)
-            self.subformula_horizons = h.horizons
             horizons[spec] = horizon
+        self.subformula_horizons = h.horizons
         pastified_specs = []
         for spec in ast.specs:
             horizon = horizons[spec]
@@ -59,10 +60,12 @@ class StlPastifier(LtlPastifier, StlAstVisitor):
         return ast
 
     def visit(self, node, *args, **kwargs):
+        key = (node, args[0])
+        if key in self.pastified:
+            return self.pastified[key]
         out = StlAstVisitor.visit(self, node, *args, **kwargs)
-        d = self.ast.phi_name_to_node_dict
-        keys = [k for k, v in d.items() if v == node]
-        self.ast.phi_name_to_node_dict.update({key: out for key in keys})
+        self.rename(node, out)
+        self.pastified[key] = out
         return out
 
     def visitVariable(self, node, *args, **kwargs):
@@ -3,6 +3,7 @@
 from rtamt.syntax.ast.visitor.abstract_ast_visitor import AbstractAstVisitor
 from rtamt.semantics.abstract_offline_interpreter import AbstractOfflineInterpreter
 from rtamt.semantics.dense_time_interpreter import DenseTimeInterpreter
+from rtamt.semantics.dense_time_signal import DenseTimeSignal, as_dense_time_signal
 
 from rtamt.exception.exception import RTAMTException
 
@@ -16,6 +17,7 @@ class AbstractDenseTimeOfflineInterpreter(AbstractOfflineInterpreter, DenseTimeI
     #a = [[0, 1.3], [0.7, 3], [1.3, 0.1], [2.1, -2.2]]
     #b = [[0, 2.5], [0.7, 4], [1.3, -1.2], [2.1, 1.7]]
     #dataset = [['a', a], ['b', b]]
+    #a signal can also be a DenseTimeSignal or an (n, 2) NumPy array, the result is then a DenseTimeSignal
     #TODO merge dense and discrete into evaluate AbstractOfflineInterpreter
     def evaluate(self, dataset):
         # check ast exists
@@ -33,7 +35,14 @@ class AbstractDenseTimeOfflineInterpreter(AbstractOfflineInterpreter, DenseTimeI
         # reset var_object_dict()
         self.ast.var_object_dict = self.ast.var_object_dict.fromkeys(self.ast.var_object_dict, [])  #TODO I did not understant it.
 
-        return rob[len(rob)-1]
+        rob = rob[len(rob)-1]
+        columnar = any(as_dense_time_signal(data[1]) is not None for data in dataset)
+        if columnar:
+            rob = DenseTimeSignal.from_samples(rob)
+        elif isinstance(rob, DenseTimeSignal):
+            rob = rob.to_samples()
+
+        return rob
 
 
 def dense_time_offline_interpreter_factory(AstVisitor):
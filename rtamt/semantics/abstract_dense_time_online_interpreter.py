@@ -5,24 +5,136 @@ from rtamt.syntax.node.ltl.variable import Variable
 from rtamt.syntax.node.ltl.constant import Constant
 
 from rtamt.syntax.ast.visitor.abstract_ast_visitor import AbstractAstVisitor
-from rtamt.semantics.abstract_online_interpreter import AbstractOnlineInterpreter, AbstractOnlineUpdateVisitor
+from rtamt.semantics.abstract_online_interpreter import AbstractOnlineInterpreter, AbstractOnlineUpdateVisitor, AbstractOnlineResetVisitor
 from rtamt.semantics.dense_time_interpreter import DenseTimeInterpreter
+from rtamt.semantics.dense_time_signal import as_dense_time_signal
+from rtamt.semantics.abstract_dense_time_online_operation import AbstractDenseTimeOnlineOperation
+from rtamt.semantics.enumerations.options import BufferPolicy
 
 from rtamt.exception.exception import RTAMTException
 
+
+def compact(samples):
+    """Merges the adjacent segments with equal values
+
+        The first and the last sample are kept, the last one marks how far the signal is known.
+        Returns the compacted samples and the number of samples that were dropped.
+    """
+    if len(samples) < 3:
+        return samples, 0
+    sample_return = [samples[0]]
+    for sample in samples[1:-1]:
+        if sample[1] != sample_return[-1][1]:
+            sample_return.append(sample)
+    sample_return.append(samples[-1])
+    return sample_return, len(samples) - len(sample_return)
+
+
 class AbstractDenseTimeOnlineInterpreter(AbstractOnlineInterpreter, DenseTimeInterpreter):
 
     def __init__(self):
         AbstractOnlineInterpreter.__init__(self)
         DenseTimeInterpreter.__init__(self)
         self.updateVisitor = DenseTimeOnlineUpdateVisitor()
+        self.resetVisitor = AbstractOnlineResetVisitor()
         self.updateFinalVisitor = DenseTimeOnlineUpdateFinalVisitor()
+        # the number of redundant samples dropped from the output
+        self.compaction_counter = int(0)
+        self.buffer_limit = None
+        self.buffer_policy = BufferPolicy.DROP
+        self.blocked_counter = int(0)
+        # the time of the last sample of every input
+        self.input_end = dict()
         return
 
+    @property
+    def buffer_high_water(self):
+        # the largest number of residual samples kept by each operator
+        return self.updateVisitor.buffer_high_water
+
+    def set_buffer_limit(self, limit=None, policy=BufferPolicy.DROP):
+        if limit is not None and limit < 1:
+            raise RTAMTException('The buffer limit must be at least 1')
+        if not isinstance(policy, BufferPolicy):
+            raise RTAMTException('{} is not a buffer policy'.format(policy))
+        self.buffer_limit = limit
+        self.buffer_policy = policy
+
+    def residual_size(self):
+        # the number of samples kept by all the operators of the monitor
+        return sum(op.residual_size() for op in self.online_operator_dict.values()
+                   if isinstance(op, AbstractDenseTimeOnlineOperation))
+
+    def input_ends(self):
+        # the time of the last sample of every input, with the samples of the update
+        end = dict((var, self.input_end.get(var, -float('inf'))) for var in self.ast.free_vars)
+        for var in self.ast.free_vars:
+            samples = self.ast.var_object_dict.get(var)
+            if samples:
+                end[var] = samples[-1][0]
+        return end
+
+    def accept(self):
+        """Applies the buffer limit to the samples of an update, before they are consumed
+
+            The monitor keeps the residual samples of its operators and the samples of the
+            update. When they exceed the limit, DROP discards the oldest residual samples,
+            BLOCK rejects the update and RAISE raises an RTAMTException. An update extending
+            the input known for the shortest time lets the operators consume their residuals,
+            it is always accepted. Returns whether the update is accepted.
+        """
+        if self.buffer_limit is None:
+            return True
+        size = sum(len(self.ast.var_object_dict.get(var) or []) for var in self.ast.free_vars)
+        residual_size = self.residual_size()
+        if residual_size + size <= self.buffer_limit:
+            return True
+
+        ops = [op for op in self.online_operator_dict.values() if isinstance(op, AbstractDenseTimeOnlineOperation)]
+        if self.buffer_policy == BufferPolicy.DROP:
+            # the largest number of samples per buffer that keeps the monitor within the limit
+            sizes = sorted(size for op in ops for size in op.residual_sizes())
+            keep = self.buffer_limit - size
+            limit = 0
+            for i, buffer_size in enumerate(sizes):
+                # the buffers from i on are cut to limit samples
+                limit = max(0, min(buffer_size, keep // (len(sizes) - i)))
+                if limit < buffer_size:
+                    break
+                keep = keep - buffer_size
+            for op in ops:
+                op.drop_residuals(limit)
+            return True
+
+        horizon = min(self.input_end.values()) if self.input_end else -float('inf')
+        end = self.input_ends()
+        if end and min(end.values()) > horizon:
+            return True
+
+        if self.buffer_policy == BufferPolicy.RAISE:
+            raise RTAMTException('Dense time online monitor: {} samples exceed the limit of {}'.format(
+                residual_size + size, self.buffer_limit))
+        self.blocked_counter = self.blocked_counter + size
+        return False
+
+    def clone(self, ast=None):
+        # the dense-time operations cannot be reset, the clone builds them again
+        interpreter = super(AbstractOnlineInterpreter, self).clone(ast)
+        interpreter.set_buffer_limit(self.buffer_limit, self.buffer_policy)
+        return interpreter
+
+    def reset(self):
+        super(AbstractDenseTimeOnlineInterpreter, self).reset()
+        self.compaction_counter = int(0)
+        self.updateVisitor.buffer_high_water = dict()
+        self.blocked_counter = int(0)
+        self.input_end = dict()
+
     #input format
     #a = [[0, 1.3], [0.7, 3], [1.3, 0.1], [2.1, -2.2]]
     #b = [[0, 2.5], [0.7, 4], [1.3, -1.2], [2.1, 1.7]]
     #dataset = [['a', a], ['b', b]]
+    #a signal can also be a DenseTimeSignal or an (n, 2) NumPy array
     #TODO merge dense and discrete into update AbstractOnlineInterpreter
     def update(self, dataset):
         # check ast exists
@@ -31,9 +143,14 @@ class AbstractDenseTimeOnlineInterpreter(AbstractOnlineInterpreter, DenseTimeInt
         # update the value of every input variable
         self.set_variable_to_ast_from_dataset(dataset)
 
+        if not self.accept():
+            self.ast.var_object_dict = self.ast.var_object_dict.fromkeys(self.ast.var_object_dict, [])
+            return []
+        self.input_end = self.input_ends()
+
         # evaluate spec forest
         rob = self.updateVisitor.visitAst(self.ast, self.online_operator_dict, self.ast.var_object_dict)
-        rob = rob[len(rob) - 1]
+        rob = self.compact(rob[len(rob) - 1])
 
         self.ast.results = self.updateVisitor.results
 
@@ -54,20 +171,52 @@ class AbstractDenseTimeOnlineInterpreter(AbstractOnlineInterpreter, DenseTimeInt
 
         # evaluate spec forest
         rob = self.updateFinalVisitor.visitAst(self.ast, self.online_operator_dict, self.ast.var_object_dict)[0]
+        rob = self.compact(rob)
 
         self.ast.var_object_dict = self.ast.var_object_dict.fromkeys(self.ast.var_object_dict, [])  #TODO I did not understand it.
 
         return rob
 
+    def compact(self, samples):
+        # only the output is compacted, the operators need every breakpoint of their inputs to advance
+        sample_return, eliminated = compact(samples)
+        self.compaction_counter = self.compaction_counter + eliminated
+        return sample_return
+
     def set_variable_to_ast_from_dataset(self, dataset):
         for data in dataset:
             var_name = data[0]
             var_object = data[1]
+            signal = as_dense_time_signal(var_object)
+            if signal is not None:
+                # the online operators buffer the samples of each update in lists
+                var_object = signal.to_samples()
             if data[0] in self.ast.free_vars:
                 self.ast.var_object_dict[var_name] = var_object
                 self.online_operator_dict[var_name].sample = var_object
 
 class DenseTimeOnlineUpdateVisitor(AbstractOnlineUpdateVisitor):
+    def __init__(self):
+        super(DenseTimeOnlineUpdateVisitor, self).__init__()
+        self.buffer_high_water = dict()
+
+    def visitBinary(self, node, online_operator_dict, var_object_dict):
+        sample_return = super(DenseTimeOnlineUpdateVisitor, self).visitBinary(node, online_operator_dict, var_object_dict)
+        self.record_residuals(node, online_operator_dict[node.name])
+        return sample_return
+
+    def visitUnary(self, node, online_operator_dict, var_object_dict):
+        sample_return = super(DenseTimeOnlineUpdateVisitor, self).visitUnary(node, online_operator_dict, var_object_dict)
+        self.record_residuals(node, online_operator_dict[node.name])
+        return sample_return
+
+    def record_residuals(self, node, op):
+        if not isinstance(op, AbstractDenseTimeOnlineOperation):
+            return
+        size = op.residual_size()
+        if size > self.buffer_high_water.get(node.name, 0):
+            self.buffer_high_water[node.name] = size
+
     def visitVariable(self, node, online_operator_dict, var_object_dict):
         vals = var_object_dict[node.var]
         if node.field:  #TODO Tom did not understand this line.
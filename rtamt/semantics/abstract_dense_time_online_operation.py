@@ -6,8 +6,31 @@ from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
 class AbstractDenseTimeOnlineOperation(AbstractOnlineOperation):
     """
     Abstract Desne TimeOperation: template for online operation
+
+    residuals names the attributes holding the samples kept between updates,
+    operations names the attributes holding nested online operations.
     """
+    residuals = ()
+    operations = ()
 
     @abstractmethod
     def update_final(self, node, *args, **kargs):
         raise NotImplementedError(self.NOT_IMPLEMENTED)
+
+    def residual_size(self):
+        return sum(self.residual_sizes())
+
+    def residual_sizes(self):
+        sizes = [len(getattr(self, name)) for name in self.residuals]
+        for name in self.operations:
+            sizes.extend(getattr(self, name).residual_sizes())
+        return sizes
+
+    def drop_residuals(self, limit):
+        """Keeps the newest limit samples of every residual buffer"""
+        for name in self.residuals:
+            buf = getattr(self, name)
+            if len(buf) > limit:
+                setattr(self, name, buf[len(buf) - limit:])
+        for name in self.operations:
+            getattr(self, name).drop_residuals(limit)
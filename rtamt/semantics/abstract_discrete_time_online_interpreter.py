@@ -1,36 +1,61 @@
 import operator
+import collections
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from rtamt.syntax.node.ltl.constant import Constant
 from rtamt.syntax.ast.visitor.abstract_ast_visitor import AbstractAstVisitor
-from rtamt.semantics.abstract_online_interpreter import AbstractOnlineInterpreter, AbstractOnlineUpdateVisitor, AbstractOnlineResetVisitor
+from rtamt.semantics.abstract_online_interpreter import AbstractOnlineInterpreter, AbstractOnlineResetVisitor
 from rtamt.semantics.discrete_time_interpreter import DiscreteTimeInterpreter
+from rtamt.semantics.enumerations.verdict import Verdict
+from rtamt.semantics.bounds import UNKNOWN, point
 
 from rtamt.exception.exception import RTAMTException
 
+# robustness - the robustness returned by update
+# verdict, lower, upper - verdict and robustness bounds of the next sample update
+#                         will report, from the samples received so far
+EarlyVerdict = collections.namedtuple('EarlyVerdict', ['robustness', 'verdict', 'lower', 'upper'])
+
 class AbstractDiscreteTimeOnlineInterpreter(AbstractOnlineInterpreter, DiscreteTimeInterpreter):
+    # whether update(..., early=True) can bound the pending verdicts
+    early_verdicts = True
 
     def __init__(self):
         super(AbstractDiscreteTimeOnlineInterpreter, self).__init__()
-        self.updateVisitor = DiscreteTimeOnlineUpdateVisitor()
+        self.compileVisitor = DiscreteTimeOnlineCompileVisitor()
         self.resetVisitor = AbstractOnlineResetVisitor()
         return
 
+    def set_ast(self, ast):
+        super(AbstractDiscreteTimeOnlineInterpreter, self).set_ast(ast)
+
+        # flatten the spec forest into a schedule of online operator updates
+        self.schedule = self.compileVisitor.visitAst(self.ast, self.online_operator_dict)
+        return
+
     # timestamp - float
     # inputs - list of [var name, var value] pairs
+    # early - if True, returns an EarlyVerdict instead of the robustness
     # Example:
     # update(1, [['a', 2.2], ['b', 3.3]])
     # TODO merge dense and discrete into update AbstractOnlineInterpreter
-    def update(self, timestamp, dataset):
+    def update(self, timestamp, dataset, early=False):
         # check ast exists
         self.exist_ast()
+        if early and not self.early_verdicts:
+            raise RTAMTException('Early verdicts are not supported by {}'.format(type(self).__name__))
 
         # update the value of every input variable
         self.set_variable_to_ast_from_dataset(dataset)
 
         # evaluate spec forest
-        rob = self.updateVisitor.visitAst(self.ast, self.online_operator_dict, self.ast.var_object_dict)
-        rob = rob[len(rob) - 1]
-        self.ast.results = self.updateVisitor.results
-
+        rob = self.evaluate_sample(timestamp)
+        if early:
+            lower, upper = self.evaluate_bounds()
 
         out = self.ast.var_object_dict[self.ast.out_var]
         if self.ast.out_var_field:
@@ -47,6 +72,113 @@ class AbstractDiscreteTimeOnlineInterpreter(AbstractOnlineInterpreter, DiscreteT
         self.previous_time = timestamp
         self.update_counter = self.update_counter + 1
 
+        if early:
+            if lower > 0:
+                verdict = Verdict.SATISFIED
+            elif upper < 0:
+                verdict = Verdict.VIOLATED
+            else:
+                verdict = Verdict.UNKNOWN
+            return EarlyVerdict(rob, verdict, lower, upper)
+        return rob
+
+    # evaluates the spec forest on the current values of the variables
+    # and returns the robustness of the last spec
+    def evaluate_sample(self, timestamp):
+        values = self.schedule.values
+        var_object_dict = self.ast.var_object_dict
+        for slot, var, getter in self.schedule.variables:
+            if getter is None:
+                values[slot] = var_object_dict[var]
+            else:
+                values[slot] = getter(var_object_dict[var])
+        for update, left, right, slot in self.schedule.instructions:
+            if right is None:
+                values[slot] = update(values[left])
+            else:
+                values[slot] = update(values[left], values[right])
+
+        rob = values[self.schedule.out_slot]
+        self.ast.results = self.schedule.results
+        return rob
+
+    # bounds the robustness the next update will return, from the samples
+    # received so far - the variables of the next sample are unknown, the
+    # operations propagate the bounds of their next inputs to their next output
+    def evaluate_bounds(self):
+        bounds = self.schedule.bounds
+        for update, left, right, slot in self.schedule.bound_instructions:
+            if right is None:
+                bounds[slot] = update(bounds[left])
+            else:
+                bounds[slot] = update(bounds[left], bounds[right])
+        return bounds[self.schedule.out_slot]
+
+    # timestamps - list of floats
+    # dataset - list of [var name, list of var values] pairs
+    # Example:
+    # update_batch([1, 2], [['a', [2.2, 2.3]], ['b', [3.3, 3.4]]])
+    # The chunk is pushed through the schedule instruction by instruction, every
+    # online operator consuming its whole input column at once.
+    # If out is given, the robustness is written into it and out is returned.
+    def update_batch(self, timestamps, dataset, out=None):
+        # check ast exists
+        self.exist_ast()
+
+        length = len(timestamps)
+        if length == 0:
+            return [] if out is None else out
+
+        columns = dict()
+        for data in dataset:
+            if data[0] in self.ast.free_vars:
+                columns[data[0]] = data[1]
+
+        # evaluate spec forest
+        values = list(self.schedule.values)
+        for slot in self.schedule.constant_slots:
+            values[slot] = [values[slot]] * length
+        var_object_dict = self.ast.var_object_dict
+        for slot, var, getter in self.schedule.variables:
+            if var in columns:
+                column = columns[var]
+            else:
+                column = [var_object_dict[var]] * length
+            if getter is None:
+                values[slot] = list(column)
+            else:
+                values[slot] = [getter(v) for v in column]
+        for update, left, right, slot in self.schedule.instructions:
+            if right is None:
+                values[slot] = [update(i) for i in values[left]]
+            else:
+                values[slot] = [update(l, r) for l, r in zip(values[left], values[right])]
+
+        rob = values[self.schedule.out_slot]
+        last = [column[length - 1] for column in values]
+        self.schedule.values[:] = last
+        self.ast.results = self.schedule.results
+
+        # the variables keep the last sample of the chunk, as after repeated update
+        for var_name in columns:
+            var_value = columns[var_name][length - 1]
+            self.ast.var_object_dict[var_name] = var_value
+            self.online_operator_dict[var_name].sample = var_value
+
+        output = self.ast.var_object_dict[self.ast.out_var]
+        if self.ast.out_var_field:
+            setattr(output, self.ast.out_var_field, rob[length - 1])
+
+        for timestamp in timestamps:
+            if self.update_counter > 0:
+                duration = (timestamp - self.previous_time) * self.normalize
+                self.update_sampling_violation_counter(duration)
+            self.previous_time = timestamp
+            self.update_counter = self.update_counter + 1
+
+        if out is not None:
+            out[:length] = rob
+            return out
         return rob
 
     def reset(self):
@@ -74,17 +206,109 @@ class AbstractDiscreteTimeOnlineInterpreter(AbstractOnlineInterpreter, DiscreteT
         self.__update_counter = update_counter
 
 
-class DiscreteTimeOnlineUpdateVisitor(AbstractOnlineUpdateVisitor):
-    def visitVariable(self, node, online_operator_dict, var_object_dict):
-        var = var_object_dict[node.var]
-        if node.field:  #TODO Tom did not understand this line.
-            sample_return = operator.attrgetter(node.field)(var)
+class DiscreteTimeOnlineSchedule(object):
+    """A flat evaluation schedule of a spec forest
+
+        Attributes
+        --------------
+        values : list
+            one value slot per distinct sub-formula (keyed by its name)
+        variables : list of (slot, var name, getter)
+            slots loaded from var_object_dict, getter extracts the field or is None
+        constant_slots : list of int
+            slots holding constants, filled once at compile time
+        instructions : list of (update, left slot, right slot, slot)
+            online operator updates in topological order, right slot is None for unary operators
+        bounds : list of (lower, upper)
+            bounds of the next value of every slot, for early verdicts
+        bound_instructions : list of (bounds, left slot, right slot, slot)
+            as instructions, with the bounds method of the online operators
+        node_slots : dict(AbstractNode, int)
+            slot of every node of the forest
+        results : ScheduleResults
+            the value of every node after the last update, read from values on access
+        out_slot : int
+            slot of the last spec
+        """
+    def __init__(self):
+        self.values = []
+        self.variables = []
+        self.constant_slots = []
+        self.instructions = []
+        self.bounds = []
+        self.bound_instructions = []
+        self.node_slots = dict()
+        self.slots = dict()
+        self.results = ScheduleResults(self.values, self.node_slots)
+        self.out_slot = None
+
+
+class ScheduleResults(Mapping):
+    """The value of every node after the last update, read from the schedule on access"""
+    def __init__(self, values, node_slots):
+        self.values = values
+        self.node_slots = node_slots
+
+    def __getitem__(self, node):
+        return self.values[self.node_slots[node]]
+
+    def __iter__(self):
+        return iter(self.node_slots)
+
+    def __len__(self):
+        return len(self.node_slots)
+
+
+class DiscreteTimeOnlineCompileVisitor(AbstractAstVisitor):
+    def visitAst(self, ast, online_operator_dict):
+        schedule = DiscreteTimeOnlineSchedule()
+        for spec in ast.specs:
+            schedule.out_slot = self.visit(spec, online_operator_dict, schedule)
+        return schedule
+
+    def visit(self, node, online_operator_dict, schedule):
+        # a node shared by several parents is compiled once, its sub-tree is not walked again
+        try:
+            return schedule.node_slots[node]
+        except KeyError:
+            pass
+
+        child_slots = [self.visit(child, online_operator_dict, schedule) for child in node.children]
+
+        # every online operator is keyed by its sub-formula name, so it is
+        # scheduled (and updated) once per sample however often it occurs
+        if node.name in schedule.slots:
+            slot = schedule.slots[node.name]
         else:
-            sample_return = var
-        return sample_return
+            slot = len(schedule.values)
+            schedule.slots[node.name] = slot
+            schedule.values.append(None)
+            schedule.bounds.append(UNKNOWN)
+            super(DiscreteTimeOnlineCompileVisitor, self).visit(node, online_operator_dict, schedule,
+                                                                child_slots, slot)
+
+        schedule.node_slots[node] = slot
+        return slot
+
+    def visitBinary(self, node, online_operator_dict, schedule, child_slots, slot):
+        operation = online_operator_dict[node.name]
+        schedule.instructions.append((operation.update, child_slots[0], child_slots[1], slot))
+        schedule.bound_instructions.append((operation.bounds, child_slots[0], child_slots[1], slot))
 
-    def visitConstant(self, node, online_operator_dict, var_object_dict):
-        return node.val
+    def visitUnary(self, node, online_operator_dict, schedule, child_slots, slot):
+        operation = online_operator_dict[node.name]
+        schedule.instructions.append((operation.update, child_slots[0], None, slot))
+        schedule.bound_instructions.append((operation.bounds, child_slots[0], None, slot))
+
+    def visitLeaf(self, node, online_operator_dict, schedule, child_slots, slot):
+        if isinstance(node, Constant):
+            schedule.values[slot] = node.val
+            schedule.bounds[slot] = point(node.val)
+            schedule.constant_slots.append(slot)
+        elif node.field:
+            schedule.variables.append((slot, node.var, operator.attrgetter(node.field)))
+        else:
+            schedule.variables.append((slot, node.var, None))
 
 
 def discrete_time_online_interpreter_factory(AstVisitor):
@@ -95,4 +319,4 @@ def discrete_time_online_interpreter_factory(AstVisitor):
         def __init__(self, *args, **kwargs):
             super(DiscreteTimeOnlineInterpreter, self).__init__(*args, **kwargs)
 
-    return DiscreteTimeOnlineInterpreter
\ No newline at end of file
+    return DiscreteTimeOnlineInterpreter
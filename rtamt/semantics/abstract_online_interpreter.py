@@ -1,3 +1,4 @@
+import copy
 from abc import abstractmethod
 
 from rtamt.syntax.node.ltl.variable import Variable
@@ -12,15 +13,35 @@ class AbstractOnlineInterpreter(AbstractInterpreter):
         return
 
     def reset(self):
-        # reset sub-specs
-        for key in self.ast.var_subspec_dict:
-            node = self.ast.var_subspec_dict[key]
-            self.resetVisitor.visitAst(node, self.online_operator_dict)
-
-        # reset spec
+        # the sub-specs are inlined in the spec, their operators are reset with it
         self.resetVisitor.visitAst(self.ast, self.online_operator_dict)
         return
 
+    # With the ast of the cloned specification, the clone gets a copy of everything
+    # set_ast built (operators, schedule), in the reset state, instead of building it again.
+    def clone(self, ast=None):
+        interpreter = super(AbstractOnlineInterpreter, self).clone()
+        if ast is None or getattr(self, 'ast', None) is None:
+            return interpreter
+
+        # the nodes of the formulas are shared, the ast is the one of the clone
+        memo = dict()
+        nodes = list(self.ast.specs) + list(self.ast.var_subspec_dict.values())
+        while nodes:
+            node = nodes.pop()
+            if id(node) not in memo:
+                memo[id(node)] = node
+                nodes.extend(node.children)
+        memo[id(self.ast)] = ast
+
+        configuration = set(vars(interpreter))
+        for name, value in vars(self).items():
+            if name not in configuration:
+                setattr(interpreter, name, copy.deepcopy(value, memo))
+        interpreter.ast = ast
+        interpreter.reset()
+        return interpreter
+
     def set_ast(self, ast):
         super(AbstractOnlineInterpreter, self).set_ast(ast)
 
@@ -43,6 +64,17 @@ class AbstractOnlineInterpreter(AbstractInterpreter):
         raise NotImplementedError(self.NOT_IMPLEMENTED)
 
 class AbstractOnlineResetVisitor(AbstractAstVisitor):
+    def visitAst(self, ast, *args, **kwargs):
+        self.reset_names = set()
+        return super(AbstractOnlineResetVisitor, self).visitAst(ast, *args, **kwargs)
+
+    def visit(self, node, *args, **kwargs):
+        # a sub-formula shared by several specs or sub-specs is reset once
+        if node.name in self.reset_names:
+            return
+        self.reset_names.add(node.name)
+        return super(AbstractOnlineResetVisitor, self).visit(node, *args, **kwargs)
+
     def visitBinary(self, node, online_operator_dict):
         self.visitChildren(node, online_operator_dict)
         operator = online_operator_dict[node.name]
@@ -62,6 +94,21 @@ class AbstractOnlineResetVisitor(AbstractAstVisitor):
 class AbstractOnlineUpdateVisitor(AbstractAstVisitor):
     def __init__(self):
         self.results = dict()
+        self.updated = dict()
+
+    def visitAst(self, ast, *args, **kwargs):
+        self.updated = dict()
+        return super(AbstractOnlineUpdateVisitor, self).visitAst(ast, *args, **kwargs)
+
+    def visit(self, node, *args, **kwargs):
+        # a sub-formula shared by several specs or sub-specs is updated once per call
+        try:
+            return self.updated[node]
+        except KeyError:
+            pass
+        sample_return = super(AbstractOnlineUpdateVisitor, self).visit(node, *args, **kwargs)
+        self.updated[node] = sample_return
+        return sample_return
 
     def visitSpec(self, node, online_operator_dict, var_object_dict):
         sample_return = self.visit(node, online_operator_dict, var_object_dict)
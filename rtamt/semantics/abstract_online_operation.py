@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from abc import ABCMeta, abstractmethod
 
+from rtamt.semantics.bounds import UNKNOWN
+
 
 class AbstractOnlineOperation:
     """
@@ -21,3 +23,11 @@ class AbstractOnlineOperation:
     @abstractmethod
     def reset(self):
         raise NotImplementedError(self.NOT_IMPLEMENTED)
+
+    def bounds(self, *args):
+        """Bounds of the next output, given the bounds of the next inputs
+
+            Called after update, so the state already holds the current sample.
+            Operations that cannot bound their next output return UNKNOWN.
+        """
+        return UNKNOWN
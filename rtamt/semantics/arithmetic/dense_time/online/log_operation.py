@@ -3,6 +3,8 @@ import rtamt.semantics.stl.dense_time.online.intersection as intersect
 import math
 
 class LogOperation(AbstractDenseTimeOnlineOperation):
+    residuals = ('sample_left_buf', 'sample_right_buf')
+
     def __init__(self):
         self.sample_left_buf = []
         self.sample_right_buf = []
@@ -13,14 +15,14 @@ class LogOperation(AbstractDenseTimeOnlineOperation):
 
     def update(self, sample_left, sample_right, *args, **kargs):
         if self.sample_left_buf and sample_left and self.sample_left_buf[-1][0] == sample_left[0][0]:
-            self.sample_left_buf = self.sample_left_buf + sample_left[1:]
+            self.sample_left_buf.extend(sample_left[1:])
         else:
-            self.sample_left_buf = self.sample_left_buf + sample_left
+            self.sample_left_buf.extend(sample_left)
 
         if self.sample_right_buf and sample_right and self.sample_right_buf[-1][0] == sample_right[0][0]:
-            self.sample_right_buf = self.sample_right_buf + sample_right[1:]
+            self.sample_right_buf.extend(sample_right[1:])
         else:
-            self.sample_right_buf = self.sample_right_buf + sample_right
+            self.sample_right_buf.extend(sample_right)
 
         result, last, left, right = intersect.intersection(self.sample_left_buf, self.sample_right_buf, intersect.log)
 
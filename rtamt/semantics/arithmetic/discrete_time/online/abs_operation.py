@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import absolute
 
 
 class AbsOperation(AbstractOnlineOperation):
@@ -10,4 +11,7 @@ class AbsOperation(AbstractOnlineOperation):
 
     def update(self, sample):
         sample_result = abs(sample)
-        return sample_result
\ No newline at end of file
+        return sample_result
+
+    def bounds(self, sample):
+        return absolute(sample)
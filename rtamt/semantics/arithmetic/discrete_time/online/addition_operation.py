@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import add
 
 
 class AdditionOperation(AbstractOnlineOperation):
@@ -11,3 +12,6 @@ class AdditionOperation(AbstractOnlineOperation):
     def update(self, sample_left, sample_right):
         sample_result = sample_left + sample_right
         return sample_result
+
+    def bounds(self, sample_left, sample_right):
+        return add(sample_left, sample_right)
@@ -11,4 +11,7 @@ class ExpOperation(AbstractOnlineOperation):
 
     def update(self, sample):
         sample_result = math.exp(sample)
-        return sample_result
\ No newline at end of file
+        return sample_result
+
+    def bounds(self, sample):
+        return math.exp(sample[0]), math.exp(sample[1])
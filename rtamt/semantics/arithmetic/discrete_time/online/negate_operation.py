@@ -1,5 +1,6 @@
 import math
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import negate
 
 
 class NegateOperation(AbstractOnlineOperation):
@@ -11,4 +12,7 @@ class NegateOperation(AbstractOnlineOperation):
 
     def update(self, sample):
         sample_result = - sample
-        return sample_result
\ No newline at end of file
+        return sample_result
+
+    def bounds(self, sample):
+        return negate(sample)
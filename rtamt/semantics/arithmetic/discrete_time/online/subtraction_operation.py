@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import subtract
 
 
 class SubtractionOperation(AbstractOnlineOperation):
@@ -11,3 +12,6 @@ class SubtractionOperation(AbstractOnlineOperation):
     def update(self, sample_left, sample_right):
         sample_result = sample_left - sample_right
         return sample_result
+
+    def bounds(self, sample_left, sample_right):
+        return subtract(sample_left, sample_right)
@@ -0,0 +1,45 @@
+# Bounds (lower, upper) of a value that depends on samples that have not
+# arrived yet, propagated through the online operations to give early verdicts
+
+UNKNOWN = (-float("inf"), float("inf"))
+
+
+def point(value):
+    return value, value
+
+
+def negate(bounds):
+    return -bounds[1], -bounds[0]
+
+
+def add(left, right):
+    return lower(left[0] + right[0]), upper(left[1] + right[1])
+
+
+def subtract(left, right):
+    return lower(left[0] - right[1]), upper(left[1] - right[0])
+
+
+def absolute(bounds):
+    if bounds[0] >= 0:
+        return bounds
+    if bounds[1] <= 0:
+        return negate(bounds)
+    return 0, max(-bounds[0], bounds[1])
+
+
+def minimum(left, right):
+    return min(left[0], right[0]), min(left[1], right[1])
+
+
+def maximum(left, right):
+    return max(left[0], right[0]), max(left[1], right[1])
+
+
+# inf - inf is nan, which bounds nothing
+def lower(value):
+    return value if value == value else -float("inf")
+
+
+def upper(value):
+    return value if value == value else float("inf")
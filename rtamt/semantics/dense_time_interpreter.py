@@ -1,4 +1,5 @@
 from rtamt.semantics.time_interpreter import TimeInterpreter
+from rtamt.semantics.dense_time_signal import as_dense_time_signal
 
 class DenseTimeInterpreter(TimeInterpreter):
 
@@ -10,6 +11,7 @@ class DenseTimeInterpreter(TimeInterpreter):
     #a = [[0, 1.3], [0.7, 3], [1.3, 0.1], [2.1, -2.2]]
     #b = [[0, 2.5], [0.7, 4], [1.3, -1.2], [2.1, 1.7]]
     #dataset = [['a', a], ['b', b]]
+    #a signal can also be a DenseTimeSignal or an (n, 2) NumPy array
     def dataset_check(self, dataset):
         #TODO check that data fromat more.
         #TODO chage to dict format
@@ -19,6 +21,9 @@ class DenseTimeInterpreter(TimeInterpreter):
         for data in dataset:
             var_name = data[0]
             var_object = data[1]
+            signal = as_dense_time_signal(var_object)
+            if signal is not None:
+                var_object = signal
             if data[0] in self.ast.free_vars:
                 self.ast.var_object_dict[var_name] = var_object
 
@@ -0,0 +1,89 @@
+from rtamt.exception.exception import RTAMTException
+
+
+def _column_list(column):
+    # NumPy arrays (and array.array) convert to a list of Python scalars in one call
+    if isinstance(column, list):
+        return column
+    if hasattr(column, 'tolist'):
+        return column.tolist()
+    return list(column)
+
+
+class DenseTimeSignal(object):
+    """
+    A piecewise-constant dense-time signal stored as two parallel columns.
+
+    The signal has the value values[i] from times[i] until times[i+1]. The
+    columns are stored as given, so NumPy arrays are used without a copy.
+
+    A signal also reads as a sequence of [time, value] samples, which is the
+    format of the lists accepted by the dense-time monitors.
+
+    Attributes:
+        times : sequence of increasing sample times
+        values : sequence of sample values
+    """
+    __slots__ = ('times', 'values')
+
+    def __init__(self, times, values):
+        if len(times) != len(values):
+            raise RTAMTException('Dense time signal: {} times for {} values'.format(len(times), len(values)))
+        self.times = times
+        self.values = values
+
+    @classmethod
+    def from_samples(cls, samples):
+        if isinstance(samples, DenseTimeSignal):
+            return samples
+        return cls([sample[0] for sample in samples], [sample[1] for sample in samples])
+
+    @classmethod
+    def from_array(cls, array):
+        # the columns of an (n, 2) NumPy array are views, not copies
+        if getattr(array, 'ndim', None) != 2 or array.shape[1] != 2:
+            raise RTAMTException('Dense time signal: expected an (n, 2) array of [time, value] rows')
+        return cls(array[:, 0], array[:, 1])
+
+    def columns(self):
+        return _column_list(self.times), _column_list(self.values)
+
+    def to_samples(self):
+        times, values = self.columns()
+        return [[t, v] for t, v in zip(times, values)]
+
+    def map(self, method):
+        times, values = self.columns()
+        return DenseTimeSignal(self.times, [method(v) for v in values])
+
+    def __len__(self):
+        return len(self.times)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return DenseTimeSignal(self.times[key], self.values[key])
+        return [self.times[key], self.values[key]]
+
+    def __iter__(self):
+        times, values = self.columns()
+        for t, v in zip(times, values):
+            yield [t, v]
+
+    def __eq__(self, other):
+        if isinstance(other, DenseTimeSignal):
+            other = other.to_samples()
+        return self.to_samples() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'DenseTimeSignal({})'.format(self.to_samples())
+
+
+def as_dense_time_signal(var_object):
+    if isinstance(var_object, DenseTimeSignal):
+        return var_object
+    if getattr(var_object, 'ndim', None) == 2:
+        return DenseTimeSignal.from_array(var_object)
+    return None
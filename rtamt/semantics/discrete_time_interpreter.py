@@ -77,6 +77,15 @@ class DiscreteTimeInterpreter(TimeInterpreter):
 
         self.sampling_tolerance = tolerance
 
+    def clone(self, ast=None):
+        # the ast is set after the sampling period, which the operators depend on
+        interpreter = super(DiscreteTimeInterpreter, self).clone()
+        interpreter.set_sampling_period(self.sampling_period, self.sampling_period_unit, self.sampling_tolerance)
+        interpreter.normalize = self.normalize
+        if ast is not None:
+            interpreter.set_ast(ast)
+        return interpreter
+
     def get_sampling_period(self):
         return self.sampling_period * self.U[self.sampling_period_unit]
 
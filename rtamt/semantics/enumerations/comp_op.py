@@ -15,15 +15,5 @@ class StlComparisonOperator(Enum):
     GEQ = 5
 
     def __str__(self):
-        if self.value == 0:
-            return '<'
-        elif self.value == 1:
-            return '<='
-        elif self.value == 2:
-            return '=='
-        elif self.value == 3:
-            return '!='
-        elif self.value == 4:
-            return '>'
-        else:
-            return '>='
\ No newline at end of file
+        # _value_ rather than the value property, node names are built from it while parsing
+        return ('<', '<=', '==', '!=', '>', '>=')[self._value_]
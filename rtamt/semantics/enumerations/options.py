@@ -13,6 +13,14 @@ class Semantics(Enum):
 class Language(Enum):
     PYTHON = "python"
     CPP = "C++"
+    NUMPY = "numpy"
+    def __str__(self):
+        return self.value
+
+class BufferPolicy(Enum):
+    DROP = "drop"
+    BLOCK = "block"
+    RAISE = "raise"
     def __str__(self):
         return self.value
 
@@ -20,4 +28,10 @@ class TimeInterpretation(Enum):
     DISCRETE = "discrete_time"
     DENSE = "dense-time"
     def __str__(self):
-        return self.value
\ No newline at end of file
+        return self.value
+
+class ParserType(Enum):
+    ANTLR = "antlr"
+    PRATT = "pratt"
+    def __str__(self):
+        return self.value
@@ -0,0 +1,9 @@
+from enum import Enum
+
+class Verdict(Enum):
+    SATISFIED = "satisfied"
+    VIOLATED = "violated"
+    UNKNOWN = "unknown"
+
+    def __str__(self):
+        return self.value
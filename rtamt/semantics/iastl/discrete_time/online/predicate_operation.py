@@ -1,5 +1,6 @@
 from rtamt.semantics.stl.discrete_time.online.predicate_operation import PredicateOperation as StlPredicateOperation
 from rtamt.semantics.enumerations.options import Semantics
+from rtamt.semantics.bounds import UNKNOWN, point
 
 
 class PredicateOperation(StlPredicateOperation):
@@ -21,3 +22,14 @@ class PredicateOperation(StlPredicateOperation):
             out_sample = 0
 
         return out_sample
+
+    def bounds(self, sample_left, sample_right):
+        if sample_left[0] == sample_left[1] and sample_right[0] == sample_right[1]:
+            return point(self.update(sample_left[0], sample_right[0]))
+        if (self.semantics == Semantics.OUTPUT_ROBUSTNESS and not self.out_vars) or (
+                self.semantics == Semantics.INPUT_ROBUSTNESS and not self.in_vars):
+            return UNKNOWN
+        elif (self.semantics == Semantics.INPUT_VACUITY and not self.in_vars) or (
+                self.semantics == Semantics.OUTPUT_VACUITY and not self.out_vars):
+            return point(0)
+        return StlPredicateOperation.bounds(self, sample_left, sample_right)
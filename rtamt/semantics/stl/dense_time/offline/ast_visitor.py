@@ -3,12 +3,35 @@ import operator
 from collections import deque
 
 import rtamt.semantics.stl.dense_time.offline.intersection as intersect
+from rtamt.semantics.dense_time_signal import DenseTimeSignal
 
 from rtamt.syntax.ast.visitor.stl.ast_visitor import StlAstVisitor
 from rtamt.semantics.enumerations.comp_oper import StlComparisonOperator
 
 from rtamt.exception.exception import RTAMTException
 
+def map_operation(sample, method):
+    if isinstance(sample, DenseTimeSignal):
+        return sample.map(method)
+    return [[in_sample[0], method(in_sample[1])] for in_sample in sample]
+
+
+def sqrt(value):
+    if value < 0:
+        raise Exception('sqrt: the input is smaller than 0.')
+    return math.sqrt(value)
+
+
+def ln(value):
+    if value < 0:
+        raise Exception('ln: the input is smaller than 0.')
+    return math.log(value)
+
+
+def negation(value):
+    return - value
+
+
 def subtraction_operation(sample_left, sample_right):
     sample_return, last, left, right = intersect.intersection(sample_left, sample_right, intersect.subtraction)
     return sample_return
@@ -292,36 +315,39 @@ class StlDenseTimeOfflineAstVisitor(StlAstVisitor):
         sample_left  = self.visit(node.children[0], *args, **kwargs)
         sample_right = self.visit(node.children[1], *args, **kwargs)
 
-        sample_return = []
         input_list = subtraction_operation(sample_left, sample_right)
+        times, values = DenseTimeSignal.from_samples(input_list).columns()
 
+        out_times = []
+        out_values = []
         prev = float("nan")
-        for i, in_sample in enumerate(input_list):
+        for i, in_value in enumerate(values):
             if node.operator.value == StlComparisonOperator.EQ.value:
-                out_val = - abs(in_sample[1])
+                out_val = - abs(in_value)
             elif node.operator.value == StlComparisonOperator.NEQ.value:
-                out_val = abs(in_sample[1])
+                out_val = abs(in_value)
             elif node.operator.value == StlComparisonOperator.LEQ.value or node.operator.value == StlComparisonOperator.LESS.value:
-                out_val = - in_sample[1]
+                out_val = - in_value
             elif node.operator.value == StlComparisonOperator.GEQ.value or node.operator.value == StlComparisonOperator.GREATER.value:
-                out_val = in_sample[1]
+                out_val = in_value
             else:
                 out_val = float('nan')
 
-            if out_val != prev or i == len(input_list) - 1:
-                sample_return.append([in_sample[0], out_val])
+            if out_val != prev or i == len(values) - 1:
+                out_times.append(times[i])
+                out_values.append(out_val)
             prev = out_val
 
+        sample_return = DenseTimeSignal(out_times, out_values)
+        if not isinstance(input_list, DenseTimeSignal):
+            sample_return = sample_return.to_samples()
         return sample_return
 
 
     def visitVariable(self, node, *args, **kwargs):
         var = self.ast.var_object_dict[node.var]
         if node.field:
-            sample_return = []
-            for v in var:
-                val = operator.attrgetter(node.field)(v[1])
-                sample_return.append([v[0], val])
+            sample_return = map_operation(var, operator.attrgetter(node.field))
         else:
             sample_return = var
         return sample_return
@@ -330,35 +356,21 @@ class StlDenseTimeOfflineAstVisitor(StlAstVisitor):
     def visitAbs(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
 
-        sample_return = []
-        for i in sample:
-            out_time = i[0]
-            out_value = abs(i[1])
-            sample_return.append([out_time, out_value])
+        sample_return = map_operation(sample, abs)
         return sample_return
 
 
     def visitSqrt(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
 
-        sample_return = []
-        for i in sample:
-            if i[1] < 0:
-                raise Exception('sqrt: the input is smaller than 0.')
-            out_time = i[0]
-            out_value = math.sqrt(i[1])
-            sample_return.append([out_time, out_value])
+        sample_return = map_operation(sample, sqrt)
         return sample_return
 
 
     def visitExp(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
 
-        sample_return = []
-        for i in sample:
-            out_time = i[0]
-            out_value = math.exp(i[1])
-            sample_return.append([out_time, out_value])
+        sample_return = map_operation(sample, math.exp)
         return sample_return
 
 
@@ -379,13 +391,7 @@ class StlDenseTimeOfflineAstVisitor(StlAstVisitor):
     def visitLn(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
 
-        sample_return = []
-        for i in sample:
-            if i[1] < 0:
-                raise Exception('ln: the input is smaller than 0.')
-            out_time = i[0]
-            out_value = math.log(i[1])
-            sample_return.append([out_time, out_value])
+        sample_return = map_operation(sample, ln)
         return sample_return
 
 
@@ -425,22 +431,14 @@ class StlDenseTimeOfflineAstVisitor(StlAstVisitor):
     def visitNot(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
 
-        sample_return = []
-        for i in sample:
-            out_time = i[0]
-            out_value = - i[1]
-            sample_return.append([out_time, out_value])
+        sample_return = map_operation(sample, negation)
         return sample_return
 
 
     def visitNegate(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
 
-        sample_return = []
-        for i in sample:
-            out_time = i[0]
-            out_value = - i[1]
-            sample_return.append([out_time, out_value])
+        sample_return = map_operation(sample, negation)
         return sample_return
 
 
@@ -1,6 +1,7 @@
 import math
 
 from rtamt import RTAMTException
+from rtamt.semantics.dense_time_signal import DenseTimeSignal
 
 
 def interval_union(a, b, method):
@@ -48,145 +49,157 @@ def intersects(x1, x2, y1, y2):
     else:
         return False
 
-def _append(in_list, item):
-    if not in_list:
-        in_list.append(item)
-    else:
-        prev_item = in_list[-1]
-        if prev_item[1] != item[1]:
-            in_list.append(item)
+def _append(out_times, out_values, time, value):
+    if not out_values or out_values[-1] != value:
+        out_times.append(time)
+        out_values.append(value)
+
+
+def _columns(in_samples):
+    # copies of the time and value columns, which can be extended in place
+    if isinstance(in_samples, DenseTimeSignal):
+        times, values = in_samples.columns()
+        return list(times), list(values)
+    return [sample[0] for sample in in_samples], [sample[1] for sample in in_samples]
+
+
+def _samples(times, values, columnar):
+    if columnar:
+        return DenseTimeSignal(times, values)
+    return [[t, v] for t, v in zip(times, values)]
 
 
 def intersection(in_samples_1, in_samples_2, method):
-    in_samples_1 = list(in_samples_1)
-    in_samples_2 = list(in_samples_2)
+    # the result is a DenseTimeSignal if either input is one, a list of samples otherwise
+    columnar = isinstance(in_samples_1, DenseTimeSignal) or isinstance(in_samples_2, DenseTimeSignal)
+    times_1, values_1 = _columns(in_samples_1)
+    times_2, values_2 = _columns(in_samples_2)
 
-    out_samples = list()
+    out_times = list()
+    out_values = list()
     ans = list()
 
     # If either list of inputs is empty, the output list out_samples is empty
     # And the remainder lists correspond to the input lists (since they were not consumed)
-    if len(in_samples_1) == 0 or len(in_samples_2) == 0:
-        return out_samples, ans, in_samples_1, in_samples_2
+    if len(times_1) == 0 or len(times_2) == 0:
+        return (_samples(out_times, out_values, columnar), ans,
+                _samples(times_1, values_1, columnar), _samples(times_2, values_2, columnar))
 
     # Finitary interpretation of input signals
     # If needed, we extend the last value to infinity
-    if in_samples_1[-1][0] < float('inf'):
-        in_samples_1.append([float('inf'), in_samples_1[-1][1]])
-    if in_samples_2[-1][0] < float('inf'):
-        in_samples_2.append([float('inf'), in_samples_2[-1][1]])
+    if times_1[-1] < float('inf'):
+        times_1.append(float('inf'))
+        values_1.append(values_1[-1])
+    if times_2[-1] < float('inf'):
+        times_2.append(float('inf'))
+        values_2.append(values_2[-1])
 
     # In all other cases, the two lists have both at least 2 samples each
 
-    prev_in_sample_1 = in_samples_1[0]
-    prev_in_sample_2 = in_samples_2[0]
-
-    while in_samples_1[1:] and in_samples_2[1:]:
-        current_in_sample_1 = in_samples_1[1]
-        current_in_sample_2 = in_samples_2[1]
+    # the samples before the cursors i1 and i2 are consumed
+    i1 = 0
+    i2 = 0
+    n1 = len(times_1)
+    n2 = len(times_2)
+
+    while i1 + 1 < n1 and i2 + 1 < n2:
+        prev_time_1 = times_1[i1]
+        prev_time_2 = times_2[i2]
+        current_time_1 = times_1[i1 + 1]
+        current_time_2 = times_2[i2 + 1]
         # The output is computed according to 13 Allen relations between intervals
         # Case 1: input interval 1 precedes interval 2
         # [ interval 1 ]
         #                [ interval 2 ]
         # Move the index of the interval 1
-        if current_in_sample_1[0] < prev_in_sample_2[0]:
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        if current_time_1 < prev_time_2:
+            i1 = i1 + 1
         # Case 2: input interval 1 meets input interval 2
         # [ interval 1 ]
         #              [ interval 2 ]
-        elif prev_in_sample_1[0] < current_in_sample_1[0] == prev_in_sample_2[0] < current_in_sample_2[0]:
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        elif prev_time_1 < current_time_1 == prev_time_2 < current_time_2:
+            i1 = i1 + 1
         # Case 3: interval 1 overlaps with interval 2
         # [ interval 1      ]
         #              [ interval 2 ]
-        elif prev_in_sample_1[0] < prev_in_sample_2[0] < current_in_sample_1[0] < current_in_sample_2[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_2[0], out_value])
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        elif prev_time_1 < prev_time_2 < current_time_1 < current_time_2:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_2, out_value)
+            i1 = i1 + 1
         # Case 4: interval 1 is finished by interval 2
         # [  interval 1      ]
         #       [ interval 2 ]
-        elif prev_in_sample_1[0] < prev_in_sample_2[0] < current_in_sample_1[0] == current_in_sample_2[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_2[0], out_value])
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        elif prev_time_1 < prev_time_2 < current_time_1 == current_time_2:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_2, out_value)
+            i1 = i1 + 1
         # Case 5: interval 1 finishes interval 2
         #       [ interval 1 ]
         # [  interval 2      ]
-        elif prev_in_sample_2[0] < prev_in_sample_1[0] < current_in_sample_1[0] == current_in_sample_2[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_1[0], out_value])
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        elif prev_time_2 < prev_time_1 < current_time_1 == current_time_2:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_1, out_value)
+            i1 = i1 + 1
         # Case 6: interval 1 contains interval 2
         # [         interval 1     ]
         #      [ interval 2 ]
-        elif prev_in_sample_1[0] < prev_in_sample_2[0] < current_in_sample_2[0] < current_in_sample_1[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_2[0], out_value])
-            in_samples_2.pop(0)
-            prev_in_sample_2 = current_in_sample_2
+        elif prev_time_1 < prev_time_2 < current_time_2 < current_time_1:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_2, out_value)
+            i2 = i2 + 1
         # Case 7: interval 1 is started by interval 2
         # [ interval 1      ]
         # [ interval 2 ]
-        elif prev_in_sample_1[0] == prev_in_sample_2[0] < current_in_sample_2[0] < current_in_sample_1[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_2[0], out_value])
-            in_samples_2.pop(0)
-            prev_in_sample_2 = current_in_sample_2
+        elif prev_time_1 == prev_time_2 < current_time_2 < current_time_1:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_2, out_value)
+            i2 = i2 + 1
         # Case 8: interval 1 is equal to interval 2
         # [ interval 1 ]
         # [ interval 2 ]
-        elif prev_in_sample_1[0] == prev_in_sample_2[0] < current_in_sample_2[0] == current_in_sample_1[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_2[0], out_value])
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        elif prev_time_1 == prev_time_2 < current_time_2 == current_time_1:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_2, out_value)
+            i1 = i1 + 1
         # Case 9: interval 1 starts interval 2
         # [ interval 1 ]
         # [ interval 2     ]
-        elif prev_in_sample_1[0] == prev_in_sample_2[0] < current_in_sample_1[0] < current_in_sample_2[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_1[0], out_value])
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        elif prev_time_1 == prev_time_2 < current_time_1 < current_time_2:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_1, out_value)
+            i1 = i1 + 1
         # Case 10: interval 1 is contained in interval 2
         #    [ interval 1 ]
         # [         interval 2     ]
-        elif prev_in_sample_2[0] < prev_in_sample_1[0] < current_in_sample_1[0] < current_in_sample_2[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_1[0], out_value])
-            in_samples_1.pop(0)
-            prev_in_sample_1 = current_in_sample_1
+        elif prev_time_2 < prev_time_1 < current_time_1 < current_time_2:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_1, out_value)
+            i1 = i1 + 1
         # Case 11: interval 1 is met by interval 2
         #              [ interval 1 ]
         # [ interval 2 ]
-        elif prev_in_sample_2[0] < current_in_sample_2[0] == prev_in_sample_1[0] < current_in_sample_1[0]:
-            in_samples_2.pop(0)
-            prev_in_sample_2 = current_in_sample_2
+        elif prev_time_2 < current_time_2 == prev_time_1 < current_time_1:
+            i2 = i2 + 1
         # Case 12: interval 1 is overlapped with interval 2
         #         [ interval 1  ]
         # [ interval 2      ]
-        elif prev_in_sample_2[0] < prev_in_sample_1[0] < current_in_sample_2[0] < current_in_sample_1[0]:
-            out_value = method(prev_in_sample_1[1], prev_in_sample_2[1])
-            _append(out_samples, [prev_in_sample_1[0], out_value])
-            in_samples_2.pop(0)
-            prev_in_sample_2 = current_in_sample_2
+        elif prev_time_2 < prev_time_1 < current_time_2 < current_time_1:
+            out_value = method(values_1[i1], values_2[i2])
+            _append(out_times, out_values, prev_time_1, out_value)
+            i2 = i2 + 1
         # Case 13: input interval 1 is preceded by interval 2
         #                 [ interval 1 ]
         # [ interval 2 ]
-        elif prev_in_sample_1[0] > current_in_sample_2[0]:
-            in_samples_2.pop(0)
-            prev_in_sample_2 = current_in_sample_2
+        elif prev_time_1 > current_time_2:
+            i2 = i2 + 1
         else:
             raise RTAMTException('Dense time offline evaluation: Unexpected case in the intersection.')
 
     last = list()
-    return out_samples, last, in_samples_1, in_samples_2
+    out_samples = _samples(out_times, out_values, columnar)
+    remainder_1 = _samples(times_1[i1:], values_1[i1:], columnar)
+    remainder_2 = _samples(times_2[i2:], values_2[i2:], columnar)
+    return out_samples, last, remainder_1, remainder_2
 
 
 def disjunction(a, b):
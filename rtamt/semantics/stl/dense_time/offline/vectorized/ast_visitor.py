@@ -0,0 +1,383 @@
+import operator
+
+import numpy as np
+
+from rtamt.semantics.dense_time_signal import DenseTimeSignal
+from rtamt.semantics.stl.dense_time.offline.ast_visitor import StlDenseTimeOfflineAstVisitor
+from rtamt.semantics.stl.discrete_time.offline.vectorized.ast_visitor import since
+from rtamt.semantics.enumerations.comp_oper import StlComparisonOperator
+from rtamt.exception.exception import RTAMTException
+
+
+def changes(values):
+    keep = np.empty(len(values), dtype=bool)
+    keep[:1] = True
+    keep[1:] = values[1:] != values[:-1]
+    return keep
+
+
+def compact(times, values, keep_last=True):
+    """Drops the breakpoints that do not change the value of the signal
+
+        The last breakpoint is kept unless keep_last is False, as in the output of the intersection.
+    """
+    keep = changes(values)
+    if keep_last:
+        keep[-1:] = True
+    return DenseTimeSignal(times[keep], values[keep])
+
+
+def merge(sample_left, sample_right):
+    """Merges the breakpoints of two signals
+
+        Returns the union of the breakpoints from the later start of the two signals,
+        and the values of both signals on it. The last value of a signal holds forever,
+        and the breakpoints where neither signal changes are dropped.
+    """
+    if len(sample_left) == 0 or len(sample_right) == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+    start = max(sample_left.times[0], sample_right.times[0])
+    times = np.union1d(sample_left.times, sample_right.times)
+    times = times[(times >= start) & (times < float("inf"))]
+    left = sample_left.values[np.searchsorted(sample_left.times, times, side='right') - 1]
+    right = sample_right.values[np.searchsorted(sample_right.times, times, side='right') - 1]
+    keep = changes(left) | changes(right)
+    return times[keep], left[keep], right[keep]
+
+
+def binary_operation(sample_left, sample_right, method):
+    times, left, right = merge(sample_left, sample_right)
+    return compact(times, method(left, right), keep_last=False)
+
+
+def range_select(values, lo, hi, better, later):
+    """Returns the index of the best value in values[lo[j]:hi[j]+1] for every j, -1 where the range is empty
+
+        better(x, y) is True if the value x is strictly better than y, equal values are
+        won by the later index if later is True, by the earlier one otherwise. Uses a
+        sparse table: level k holds the selections of the ranges of length 2^k, and
+        a range is covered by two overlapping ranges of the largest fitting length. The
+        levels are built one at a time, each answering its queries, so the memory stays O(n).
+    """
+    def select(first, second):
+        first_value = values[first]
+        second_value = values[second]
+        if later:
+            take = better(second_value, first_value) | ((second_value == first_value) & (second > first))
+        else:
+            take = better(second_value, first_value) | ((second_value == first_value) & (second < first))
+        return np.where(take, second, first)
+
+    out = np.full(len(lo), -1, dtype=int)
+    valid = lo <= hi
+    lo = lo[valid]
+    hi = hi[valid]
+    if len(lo) == 0:
+        return out
+    levels = np.log2(hi - lo + 1).astype(int)
+    selected = np.empty(len(lo), dtype=int)
+    table = np.arange(len(values))
+    k = 0
+    top = levels.max()
+    while True:
+        query = levels == k
+        if query.any():
+            selected[query] = select(table[lo[query]], table[hi[query] - (1 << k) + 1])
+        if k == top:
+            break
+        table = select(table[:-(1 << k)], table[(1 << k):])
+        k = k + 1
+    out[valid] = selected
+    return out
+
+
+def past_window(sample, begin, end, better, identity):
+    """The segment i contributes at t in [times[i] + begin, times[i+1] + end)
+
+        The breakpoints are those of the Python interpreter: where the value changes, and
+        where the last segment starts deciding the output, equal values won by the earlier segment.
+    """
+    if len(sample) == 0:
+        return sample
+    starts = sample.times + begin
+    ends = sample.times[1:] + end
+    origin = 0 if begin > 0 else sample.times[0]
+    times = np.union1d(np.union1d(starts, ends), [origin])
+    times = times[(times >= origin) & (times < float("inf"))]
+    hi = np.searchsorted(starts, times, side='right') - 1
+    lo = np.searchsorted(ends, times, side='right')
+    index = range_select(sample.values, lo, hi, better, False)
+    values = np.where(index >= 0, sample.values[index], identity)
+    keep = changes(values)
+    keep[np.flatnonzero(index == len(sample) - 1)[:1]] = True
+    return DenseTimeSignal(times[keep], values[keep])
+
+
+def future_window(sample, begin, end, better):
+    """The segment i contributes at t in [times[i] - end, times[i+1] - begin)
+
+        The breakpoints are those of the Python interpreter: where the segment deciding
+        the output changes, equal values won by the later segment.
+    """
+    if len(sample) == 0:
+        return sample
+    starts = sample.times - end
+    ends = sample.times[1:] - begin
+    origin = max(0, sample.times[0] - end)
+    times = np.union1d(np.union1d(starts, ends), [origin])
+    times = times[(times >= origin) & (times < float("inf"))]
+    hi = np.searchsorted(starts, times, side='right') - 1
+    lo = np.searchsorted(ends, times, side='right')
+    index = range_select(sample.values, lo, hi, better, True)
+    keep = changes(index)
+    return DenseTimeSignal(times[keep], sample.values[index[keep]])
+
+
+def since_operation(sample_left, sample_right):
+    # out = max(min(left, right), min(left, out)) on the merged breakpoints
+    times, left, right = merge(sample_left, sample_right)
+    values = since(left, np.minimum(left, right))
+    keep = changes(values)
+    # as in the Python interpreter, a leading -inf is not a breakpoint
+    keep[:1] = values[:1] != -float("inf")
+    keep[-1:] = True
+    return DenseTimeSignal(times[keep], values[keep])
+
+
+def until_operation(sample_left, sample_right):
+    times, left, right = merge(sample_left, sample_right)
+    return compact(times, since(left[::-1], np.minimum(left, right)[::-1])[::-1])
+
+
+def and_operation(sample_left, sample_right):
+    return binary_operation(sample_left, sample_right, np.minimum)
+
+
+def timed_since(sample_left, sample_right, begin, end):
+    out1 = past_window(sample_right, begin, end, np.greater, -float("inf"))
+    out2 = since_operation(sample_left, sample_right)
+    if begin > 0:
+        out2 = past_window(out2, 0, begin, np.less, float("inf"))
+    return and_operation(out1, out2)
+
+
+def timed_until(sample_left, sample_right, begin, end):
+    out1 = future_window(sample_right, begin, end, np.greater)
+    out2 = until_operation(sample_left, sample_right)
+    if begin > 0:
+        out2 = future_window(out2, 0, begin, np.less)
+    return and_operation(out1, out2)
+
+
+def log(sample_left, sample_right):
+    return np.log(sample_left) / np.log(sample_right)
+
+
+class StlDenseTimeOfflineAstVisitorNumpy(StlDenseTimeOfflineAstVisitor):
+    """Offline dense-time visitor evaluating every node on NumPy breakpoint arrays
+
+        Every result is a DenseTimeSignal with NumPy columns. Binary operators merge
+        the breakpoints of their inputs and evaluate on the merged breakpoints at once.
+    """
+
+    def visitPredicate(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+
+        times, left, right = merge(sample_left, sample_right)
+        difference = compact(times, left - right, keep_last=False)
+        if node.operator.value == StlComparisonOperator.EQ.value:
+            values = -np.abs(difference.values)
+        elif node.operator.value == StlComparisonOperator.NEQ.value:
+            values = np.abs(difference.values)
+        elif node.operator.value == StlComparisonOperator.LEQ.value or node.operator.value == StlComparisonOperator.LESS.value:
+            values = -difference.values
+        elif node.operator.value == StlComparisonOperator.GEQ.value or node.operator.value == StlComparisonOperator.GREATER.value:
+            values = difference.values
+        else:
+            raise RTAMTException('Unknown predicate operation')
+        return compact(difference.times, values)
+
+
+    def visitVariable(self, node, *args, **kwargs):
+        var = self.ast.var_object_dict[node.var]
+        if not node.field and not isinstance(var, DenseTimeSignal):
+            # a list of [time, value] samples converts to an (n, 2) array in one call
+            samples = np.asarray(var, dtype=float).reshape(-1, 2)
+            return DenseTimeSignal(samples[:, 0], samples[:, 1])
+        var = DenseTimeSignal.from_samples(var)
+        times = np.asarray(var.times, dtype=float)
+        if node.field:
+            values = np.array([operator.attrgetter(node.field)(v) for v in var.values], dtype=float)
+        else:
+            values = np.asarray(var.values, dtype=float)
+        return DenseTimeSignal(times, values)
+
+
+    def visitAbs(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return DenseTimeSignal(sample.times, np.abs(sample.values))
+
+    def visitSqrt(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        if (sample.values < 0).any():
+            raise Exception('sqrt: the input is smaller than 0.')
+        return DenseTimeSignal(sample.times, np.sqrt(sample.values))
+
+    def visitExp(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return DenseTimeSignal(sample.times, np.exp(sample.values))
+
+    def visitLn(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        if (sample.values < 0).any():
+            raise Exception('ln: the input is smaller than 0.')
+        return DenseTimeSignal(sample.times, np.log(sample.values))
+
+    def visitPow(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, np.power)
+
+    def visitLog(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, log)
+
+
+    def visitAddition(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, np.add)
+
+
+    def visitSubtraction(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, np.subtract)
+
+
+    def visitMultiplication(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, np.multiply)
+
+
+    def visitDivision(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, np.divide)
+
+
+    def visitNot(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return DenseTimeSignal(sample.times, -sample.values)
+
+
+    def visitNegate(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return DenseTimeSignal(sample.times, -sample.values)
+
+
+    def visitAnd(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return and_operation(sample_left, sample_right)
+
+
+    def visitOr(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, np.maximum)
+
+
+    def visitImplies(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, lambda a, b: np.maximum(-a, b))
+
+
+    def visitIff(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, lambda a, b: -np.abs(a - b))
+
+
+    def visitXor(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return binary_operation(sample_left, sample_right, lambda a, b: np.abs(a - b))
+
+
+    def visitEventually(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return compact(sample.times, np.maximum.accumulate(sample.values[::-1])[::-1])
+
+
+    def visitAlways(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return compact(sample.times, np.minimum.accumulate(sample.values[::-1])[::-1])
+
+
+    def visitUntil(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return until_operation(sample_left, sample_right)
+
+
+    def visitOnce(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return compact(sample.times, np.maximum.accumulate(sample.values))
+
+
+    def visitHistorically(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return compact(sample.times, np.minimum.accumulate(sample.values))
+
+
+    def visitSince(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return since_operation(sample_left, sample_right)
+
+
+    def visitConstant(self, node, *args, **kwargs):
+        return DenseTimeSignal(np.array([0, float("inf")]), np.full(2, node.val, dtype=float))
+
+
+    def visitTimedOnce(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return past_window(sample, begin, end, np.greater, -float("inf"))
+
+
+    def visitTimedHistorically(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return past_window(sample, begin, end, np.less, float("inf"))
+
+
+    def visitTimedSince(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_since(sample_left, sample_right, begin, end)
+
+
+    def visitTimedAlways(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return future_window(sample, begin, end, np.less)
+
+
+    def visitTimedEventually(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return future_window(sample, begin, end, np.greater)
+
+
+    def visitTimedUntil(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_until(sample_left, sample_right, begin, end)
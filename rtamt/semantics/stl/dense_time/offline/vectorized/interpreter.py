@@ -0,0 +1,6 @@
+from rtamt.semantics.stl.dense_time.offline.vectorized.ast_visitor import StlDenseTimeOfflineAstVisitorNumpy
+from rtamt.semantics.abstract_dense_time_offline_interpreter import dense_time_offline_interpreter_factory
+
+def StlDenseTimeOfflineInterpreterNumpy():
+    stlDenseTimeOfflineInterpreterNumpy = dense_time_offline_interpreter_factory(StlDenseTimeOfflineAstVisitorNumpy)()
+    return stlDenseTimeOfflineInterpreterNumpy
@@ -58,17 +58,17 @@ def _append(in_list, item):
 
 
 def intersection(in_samples_1, in_samples_2, method):
-    in_samples_1 = list(in_samples_1)
-    in_samples_2 = list(in_samples_2)
-
     out_samples = list()
     last = list()
 
     # If either list of inputs is empty, the output list out_samples is empty
     # And the remainder lists correspond to the input lists (since they were not consumed)
     if len(in_samples_1) == 0 or len(in_samples_2) == 0:
-        return out_samples, last, in_samples_1, in_samples_2
+        return out_samples, last, list(in_samples_1), list(in_samples_2)
 
+    # the samples before the cursors i1 and i2 are consumed
+    i1 = 0
+    i2 = 0
     prev_in_sample_1 = in_samples_1[0]
     prev_in_sample_2 = in_samples_2[0]
 
@@ -76,23 +76,23 @@ def intersection(in_samples_1, in_samples_2, method):
         out_val = method(prev_in_sample_1[1], prev_in_sample_2[1])
         last = [prev_in_sample_1[0], out_val]
 
-    while in_samples_1[1:] and in_samples_2[1:]:
-        current_in_sample_1 = in_samples_1[1]
-        current_in_sample_2 = in_samples_2[1]
+    while i1 + 1 < len(in_samples_1) and i2 + 1 < len(in_samples_2):
+        current_in_sample_1 = in_samples_1[i1 + 1]
+        current_in_sample_2 = in_samples_2[i2 + 1]
         # The output is computed according to 13 Allen relations between intervals
         # Case 1: input interval 1 precedes interval 2
         # [ interval 1 ]
         #                [ interval 2 ]
         # Move the index of the interval 1
         if current_in_sample_1[0] < prev_in_sample_2[0]:
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
             last = float('nan')
         # Case 2: input interval 1 meets input interval 2
         # [ interval 1 ]
         #              [ interval 2 ]
         elif prev_in_sample_1[0] < current_in_sample_1[0] == prev_in_sample_2[0] < current_in_sample_2[0]:
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
             last_val = method(current_in_sample_1[1], prev_in_sample_2[1])
             last = [prev_in_sample_2[0], last_val]
@@ -104,7 +104,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_2[0], out_value])
             last_val = method(current_in_sample_1[1], prev_in_sample_2[1])
             last = [current_in_sample_1[0], last_val]
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
         # Case 4: interval 1 is finished by interval 2
         # [  interval 1      ]
@@ -114,7 +114,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_2[0], out_value])
             last_val = method(current_in_sample_1[1], current_in_sample_2[1])
             last = [current_in_sample_2[0], last_val]
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
         # Case 5: interval 1 finishes interval 2
         #       [ interval 1 ]
@@ -124,7 +124,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_1[0], out_value])
             last_val = method(current_in_sample_1[1], current_in_sample_2[1])
             last = [current_in_sample_2[0], last_val]
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
         # Case 6: interval 1 contains interval 2
         # [         interval 1     ]
@@ -134,7 +134,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_2[0], out_value])
             last_val = method(prev_in_sample_1[1], current_in_sample_2[1])
             last = [current_in_sample_2[0], last_val]
-            in_samples_2.pop(0)
+            i2 = i2 + 1
             prev_in_sample_2 = current_in_sample_2
         # Case 7: interval 1 is started by interval 2
         # [ interval 1      ]
@@ -144,7 +144,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_2[0], out_value])
             last_val = method(prev_in_sample_1[1], current_in_sample_2[1])
             last = [current_in_sample_2[0], last_val]
-            in_samples_2.pop(0)
+            i2 = i2 + 1
             prev_in_sample_2 = current_in_sample_2
         # Case 8: interval 1 is equal to interval 2
         # [ interval 1 ]
@@ -154,7 +154,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_2[0], out_value])
             last_val = method(current_in_sample_1[1], current_in_sample_2[1])
             last = [current_in_sample_2[0], last_val]
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
         # Case 9: interval 1 starts interval 2
         # [ interval 1 ]
@@ -164,7 +164,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_1[0], out_value])
             last_val = method(current_in_sample_1[1], prev_in_sample_2[1])
             last = [current_in_sample_1[0], last_val]
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
         # Case 10: interval 1 is contained in interval 2
         #    [ interval 1 ]
@@ -174,7 +174,7 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_1[0], out_value])
             last_val = method(current_in_sample_1[1], prev_in_sample_2[1])
             last = [current_in_sample_1[0], last_val]
-            in_samples_1.pop(0)
+            i1 = i1 + 1
             prev_in_sample_1 = current_in_sample_1
         # Case 11: interval 1 is met by interval 2
         #              [ interval 1 ]
@@ -182,7 +182,7 @@ def intersection(in_samples_1, in_samples_2, method):
         elif prev_in_sample_2[0] < current_in_sample_2[0] == prev_in_sample_1[0] < current_in_sample_1[0]:
             last_val = method(prev_in_sample_1[1], current_in_sample_2[1])
             last = [current_in_sample_2[0], last_val]
-            in_samples_2.pop(0)
+            i2 = i2 + 1
             prev_in_sample_2 = current_in_sample_2
         # Case 12: interval 1 is overlapped with interval 2
         #         [ interval 1  ]
@@ -192,23 +192,23 @@ def intersection(in_samples_1, in_samples_2, method):
             _append(out_samples, [prev_in_sample_1[0], out_value])
             last_val = method(prev_in_sample_1[1], current_in_sample_2[1])
             last = [current_in_sample_2[0], last_val]
-            in_samples_2.pop(0)
+            i2 = i2 + 1
             prev_in_sample_2 = current_in_sample_2
         # Case 13: input interval 1 is preceded by interval 2
         #                 [ interval 1 ]
         # [ interval 2 ]
         elif prev_in_sample_1[0] > current_in_sample_2[0]:
-            in_samples_2.pop(0)
+            i2 = i2 + 1
             prev_in_sample_2 = current_in_sample_2
         else:
             raise RTAMTException('Dense time online evaluation: Unexpected case in the intersection.')
 
-    remainder_samples_1 = in_samples_1.copy()
-    remainder_samples_2 = in_samples_2.copy()
+    remainder_samples_1 = in_samples_1[i1:]
+    remainder_samples_2 = in_samples_2[i2:]
 
-    if len(in_samples_1) > 1:
-        while in_samples_1[1:]:
-            current_in_sample_1 = in_samples_1[1]
+    if len(in_samples_1) - i1 > 1:
+        while i1 + 1 < len(in_samples_1):
+            current_in_sample_1 = in_samples_1[i1 + 1]
             if prev_in_sample_1[0] > prev_in_sample_2[0]:
                 break
             elif prev_in_sample_1[0] == prev_in_sample_2[0]:
@@ -219,21 +219,21 @@ def intersection(in_samples_1, in_samples_2, method):
                 last_val = method(prev_in_sample_1[1], prev_in_sample_2[1])
                 last = [prev_in_sample_2[0], last_val]
                 _append(out_samples, last)
-                in_samples_1.pop(0)
+                i1 = i1 + 1
                 prev_in_sample_1 = current_in_sample_1
             elif prev_in_sample_1[0] < prev_in_sample_2[0] == current_in_sample_1[0]:
                 last_val = method(current_in_sample_1[1], prev_in_sample_2[1])
                 last = [prev_in_sample_2[0], last_val]
                 _append(out_samples, last)
-                in_samples_1.pop(0)
+                i1 = i1 + 1
                 prev_in_sample_1 = current_in_sample_1
             elif prev_in_sample_2[0] > current_in_sample_1[0]:
                 last = []
-                in_samples_1.pop(0)
+                i1 = i1 + 1
                 prev_in_sample_1 = current_in_sample_1
-    elif len(in_samples_2) > 1:
-        while in_samples_2[1:]:
-            current_in_sample_2 = in_samples_2[1]
+    elif len(in_samples_2) - i2 > 1:
+        while i2 + 1 < len(in_samples_2):
+            current_in_sample_2 = in_samples_2[i2 + 1]
             if prev_in_sample_2[0] > prev_in_sample_1[0]:
                 break
             elif prev_in_sample_2[0] == prev_in_sample_1[0]:
@@ -244,17 +244,17 @@ def intersection(in_samples_1, in_samples_2, method):
                 last_val = method(prev_in_sample_1[1], prev_in_sample_2[1])
                 last = [prev_in_sample_1[0], last_val]
                 _append(out_samples, last)
-                in_samples_2.pop(0)
+                i2 = i2 + 1
                 prev_in_sample_2 = current_in_sample_2
             elif prev_in_sample_2[0] < prev_in_sample_1[0] == current_in_sample_2[0]:
                 last_val = method(prev_in_sample_1[1], current_in_sample_2[1])
                 last = [prev_in_sample_1[0], last_val]
                 _append(out_samples, last)
-                in_samples_2.pop(0)
+                i2 = i2 + 1
                 prev_in_sample_2 = current_in_sample_2
             elif prev_in_sample_1[0] > current_in_sample_2[0]:
                 last = []
-                in_samples_2.pop(0)
+                i2 = i2 + 1
                 prev_in_sample_2 = current_in_sample_2
 
     return out_samples, last, remainder_samples_1, remainder_samples_2
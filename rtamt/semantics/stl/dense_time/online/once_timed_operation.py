@@ -3,6 +3,8 @@ import rtamt.semantics.stl.dense_time.online.intersection as intersect
 
 
 class OnceTimedOperation(AbstractDenseTimeOnlineOperation):
+    residuals = ('prev',)
+
     def __init__(self, begin, end):
         self.prev = []
         self.residual_start = -float("inf")
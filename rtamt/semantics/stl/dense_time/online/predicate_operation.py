@@ -5,6 +5,8 @@ from rtamt.exception.exception import RTAMTException
 
 
 class PredicateOperation(AbstractDenseTimeOnlineOperation):
+    operations = ('sub',)
+
     def __init__(self, comparison_op):
         self.sub = SubtractionOperation()
         self.comparison_op = comparison_op
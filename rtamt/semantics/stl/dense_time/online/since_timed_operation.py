@@ -5,9 +5,9 @@ from rtamt.semantics.stl.dense_time.online.historically_timed_operation import H
 from rtamt.semantics.stl.dense_time.online.and_operation import AndOperation
 
 class SinceTimedOperation(AbstractDenseTimeOnlineOperation):
+    operations = ('since', 'hist', 'once', 'andop')
+
     def __init__(self, begin, end):
-        self.sample_left_buf = []
-        self.sample_right_buf = []
         self.begin = begin
         self.end = end
 
@@ -20,9 +20,6 @@ class SinceTimedOperation(AbstractDenseTimeOnlineOperation):
         pass
 
     def update(self, sample_left, sample_right, *args, **kargs):
-        self.sample_left_buf = self.sample_left_buf + sample_left
-        self.sample_right_buf = self.sample_right_buf + sample_right
-
         out1 = self.once.update(sample_right)
         out2 = self.since.update(sample_left, sample_right)
         out3 = self.hist.update(out2)
@@ -31,9 +28,6 @@ class SinceTimedOperation(AbstractDenseTimeOnlineOperation):
         return sample_result
 
     def update_final(self, sample_left, sample_right, *args, **kargs):
-        self.sample_left_buf = self.sample_left_buf + sample_left
-        self.sample_right_buf = self.sample_right_buf + sample_right
-
         out1 = self.once.update_final(sample_right)
         out2 = self.since.update_final(sample_left, sample_right)
         out3 = self.hist.update_final(out2)
@@ -1,8 +1,10 @@
 import math
 import operator
-import collections
 
 from rtamt.syntax.ast.visitor.stl.ast_visitor import StlAstVisitor
+from rtamt.semantics.stl.discrete_time.online.once_timed_operation import OnceTimedOperation
+from rtamt.semantics.stl.discrete_time.online.historically_timed_operation import HistoricallyTimedOperation
+from rtamt.semantics.stl.discrete_time.online.since_timed_operation import SinceTimedOperation
 from rtamt.semantics.enumerations.comp_oper import StlComparisonOperator
 from rtamt.exception.exception import RTAMTException
 
@@ -322,8 +324,8 @@ class StlDiscreteTimeOfflineAstVisitor(StlAstVisitor):
         sample = self.visit(node.children[0], *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
 
-        sample = [-float("inf") for j in range(end)] + sample
-        sample_return = [max(sample[j - end:j - begin+ 1]) for j in range(end, len(sample))]
+        oper = OnceTimedOperation(begin, end)
+        sample_return = [oper.update(i) for i in sample]
         return sample_return
 
 
@@ -331,8 +333,8 @@ class StlDiscreteTimeOfflineAstVisitor(StlAstVisitor):
         sample = self.visit(node.children[0], *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
 
-        sample = [float("inf") for j in range(end)] + sample
-        sample_return = [min(sample[j - end:j - begin + 1]) for j in range(end, len(sample))]
+        oper = HistoricallyTimedOperation(begin, end)
+        sample_return = [oper.update(i) for i in sample]
         return sample_return
 
     def visitTimedSince(self, node, *args, **kwargs):
@@ -340,62 +342,29 @@ class StlDiscreteTimeOfflineAstVisitor(StlAstVisitor):
         sample_right = self.visit(node.children[1], *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
 
-        sample_return = []
-        buffer_left = collections.deque(maxlen=(end + 1))
-        buffer_right = collections.deque(maxlen=(end + 1))
-
-        for i in range(end + 1):
-            s_left = float("inf")
-            s_right = - float("inf")
-            buffer_left.append(s_left)
-            buffer_right.append(s_right)
-
-        for i in range(len(sample_left)):
-            buffer_left.append(sample_left[i])
-            buffer_right.append(sample_right[i])
-            out_sample = - float("inf")
-            
-
-            for j in range(end-begin+1):
-                c_left = float("inf")
-                c_right = buffer_right[j]
-                for k in range(j+1, end+1):
-                    c_left = min(c_left, buffer_left[k])
-                out_sample = max(out_sample, min(c_left, c_right))
-            sample_return.append(out_sample)
+        oper = SinceTimedOperation(begin, end)
+        sample_return = [oper.update(l, r) for l, r in zip(sample_left, sample_right)]
         return sample_return
 
 
+    # the bounded future operators are their past counterparts evaluated on the reversed trace
     def visitTimedAlways(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
-        sample_len = len(sample)
-        if sample_len <= end:
-            sample += [float('inf')] * (end - sample_len + 1)
-
-        diff = end - begin
-        sample_return  = [min(sample[j:j+diff+1]) for j in range(begin, end+1)]
-        tmp  = [min(sample[j:j+diff+1]) for j in range(end+1,len(sample))]
-        sample_return += tmp
-        tmp  = [float("inf") for j in range(len(sample)-len(sample_return))]
-        sample_return += tmp
-        return sample_return[0:sample_len]
+
+        oper = HistoricallyTimedOperation(begin, end)
+        sample_return = [oper.update(i) for i in reversed(sample)]
+        sample_return.reverse()
+        return sample_return
 
     def visitTimedEventually(self, node, *args, **kwargs):
         sample = self.visit(node.children[0], *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
-        sample_len = len(sample)
-
-        if sample_len <= end:
-            sample += [-float('inf')] * (end - sample_len + 1)
 
-        diff = end - begin
-        sample_return  = [max(sample[j:j+diff+1]) for j in range(begin, end+1)]
-        tmp = [max(sample[j:j+diff+1]) for j in range(end+1,len(sample))]
-        sample_return += tmp
-        tmp = [-float("inf") for j in range(len(sample)-len(sample_return))]
-        sample_return += tmp
-        return sample_return[0:sample_len]
+        oper = OnceTimedOperation(begin, end)
+        sample_return = [oper.update(i) for i in reversed(sample)]
+        sample_return.reverse()
+        return sample_return
 
 
     def visitTimedUntil(self, node, *args, **kwargs):
@@ -403,26 +372,7 @@ class StlDiscreteTimeOfflineAstVisitor(StlAstVisitor):
         sample_right = self.visit(node.children[1], *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
 
-        sample_return = []
-        buffer_left = collections.deque(maxlen=(end + 1))
-        buffer_right = collections.deque(maxlen=(end + 1))
-
-        for i in range(end + 1):
-            s_left = float("inf")
-            s_right = - float("inf")
-            buffer_left.append(s_left)
-            buffer_right.append(s_right)
-        for i in range(len(sample_left)-1, -1, -1):
-            buffer_left.append(sample_left[i])
-            buffer_right.append(sample_right[i])
-            out_sample = - float("inf")
-
-            for j in range(end-begin+1):
-                c_left = float("inf")
-                c_right = buffer_right[j]
-                for k in range(j+1, end+1):
-                    c_left = min(c_left, buffer_left[k])
-                out_sample = max(out_sample, min(c_left, c_right))
-            sample_return.append(out_sample)
+        oper = SinceTimedOperation(begin, end)
+        sample_return = [oper.update(l, r) for l, r in zip(reversed(sample_left), reversed(sample_right))]
         sample_return.reverse()
         return sample_return
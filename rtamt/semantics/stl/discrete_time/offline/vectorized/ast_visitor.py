@@ -0,0 +1,326 @@
+import operator
+
+import numpy as np
+
+from rtamt.semantics.stl.discrete_time.offline.ast_visitor import StlDiscreteTimeOfflineAstVisitor
+from rtamt.semantics.enumerations.comp_oper import StlComparisonOperator
+from rtamt.exception.exception import RTAMTException
+
+
+def sliding_window(sample, width, ufunc, identity):
+    """Sliding window reduction (van Herk/Gil-Werman)
+
+        Returns out[i] = ufunc.reduce(sample[i:i+width]) for every window that fits
+        in sample, using two block-wise accumulations, i.e. O(n) independently of width.
+    """
+    n = len(sample)
+    if n < width:
+        return np.empty(0)
+    blocks = -(-n // width)
+    padded = np.full(blocks * width, identity)
+    padded[:n] = sample
+    padded = padded.reshape(blocks, width)
+    prefix = ufunc.accumulate(padded, axis=1).ravel()
+    suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[:n - width + 1], prefix[width - 1:n])
+
+
+# The arithmetic raises the exceptions of the math module and of the float division,
+# as the Python interpreter does, instead of returning NaN or inf with a warning.
+
+def division(sample_left, sample_right):
+    if np.any(sample_right == 0):
+        raise ZeroDivisionError('float division by zero')
+    with np.errstate(invalid='ignore'):
+        return np.true_divide(sample_left, sample_right)
+
+
+def sqrt(sample):
+    if np.any(sample < 0):
+        raise ValueError('math domain error')
+    return np.sqrt(sample)
+
+
+def exp(sample):
+    with np.errstate(over='ignore'):
+        sample_return = np.exp(sample)
+    if np.any(np.isinf(sample_return) & np.isfinite(sample)):
+        raise OverflowError('math range error')
+    return sample_return
+
+
+def power(sample_1, sample_2):
+    finite = np.isfinite(sample_2)
+    if np.any(finite & (((sample_1 == 0) & (sample_2 < 0)) |
+                        ((sample_1 < 0) & np.isfinite(sample_1) & (sample_2 != np.floor(sample_2))))):
+        raise ValueError('math domain error')
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        sample_return = np.power(sample_1, sample_2)
+    if np.any(np.isinf(sample_return) & finite & np.isfinite(sample_1)):
+        raise OverflowError('math range error')
+    return sample_return
+
+
+def since(sample_left, sample_right):
+    """Unbounded since out[i] = max(right[i], min(left[i], out[i-1])) with out[-1] = -inf
+
+        Every step is the clamp x -> max(a, min(b, x)), and clamps compose into clamps,
+        so the recurrence is evaluated as a prefix scan in log2(n) vectorized steps.
+    """
+    a = np.array(sample_right, dtype=float)
+    b = np.array(sample_left, dtype=float)
+    k = 1
+    while k < len(a):
+        a[k:], b[k:] = np.maximum(a[k:], np.minimum(b[k:], a[:-k])), np.minimum(b[k:], b[:-k])
+        k = k * 2
+    return a
+
+
+def timed_since(sample_left, sample_right, begin, end):
+    # left since[begin,end] right at t is the minimum of
+    # - left over the last begin samples [t-begin+1, t]
+    # - left since right at t-begin
+    # - once[0,end-begin] right at t-begin
+    n = len(sample_left)
+    shifted = n - begin
+    if shifted <= 0:
+        return np.full(n, -float("inf"))
+    sample_return = np.minimum(since(sample_left[:shifted], sample_right[:shifted]),
+                               timed_once(sample_right[:shifted], 0, end - begin))
+    if begin > 0:
+        sample_return = np.minimum(sample_return, sliding_window(sample_left, begin, np.minimum, float("inf"))[1:])
+    return np.concatenate((np.full(begin, -float("inf")), sample_return))
+
+
+def timed_once(sample, begin, end):
+    padded = np.concatenate((np.full(end, -float("inf")), sample))
+    return sliding_window(padded, end - begin + 1, np.maximum, -float("inf"))[:len(sample)]
+
+
+def timed_historically(sample, begin, end):
+    padded = np.concatenate((np.full(end, float("inf")), sample))
+    return sliding_window(padded, end - begin + 1, np.minimum, float("inf"))[:len(sample)]
+
+
+def timed_eventually(sample, begin, end):
+    padded = np.concatenate((sample, np.full(end, -float("inf"))))[begin:]
+    return sliding_window(padded, end - begin + 1, np.maximum, -float("inf"))
+
+
+def timed_always(sample, begin, end):
+    padded = np.concatenate((sample, np.full(end, float("inf"))))[begin:]
+    return sliding_window(padded, end - begin + 1, np.minimum, float("inf"))
+
+
+class StlDiscreteTimeOfflineAstVisitorNumpy(StlDiscreteTimeOfflineAstVisitor):
+    """Offline discrete-time visitor evaluating every node on whole NumPy arrays"""
+
+    def visitAst(self, ast, *args, **kwargs):
+        # sub-formula results stay arrays, the spec results are returned as lists
+        out = super(StlDiscreteTimeOfflineAstVisitorNumpy, self).visitAst(ast, *args, **kwargs)
+        return [rob.tolist() for rob in out]
+
+    def visitPredicate(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+
+        if node.operator.value == StlComparisonOperator.EQ.value:
+            sample_return = -np.abs(sample_left - sample_right)
+        elif node.operator.value == StlComparisonOperator.NEQ.value:
+            sample_return = np.abs(sample_left - sample_right)
+        elif node.operator.value == StlComparisonOperator.LEQ.value or node.operator.value == StlComparisonOperator.LESS.value:
+            sample_return = sample_right - sample_left
+        elif node.operator.value == StlComparisonOperator.GEQ.value or node.operator.value == StlComparisonOperator.GREATER.value:
+            sample_return = sample_left - sample_right
+        else:
+            raise RTAMTException('Unknown predicate operation')
+        return sample_return
+
+
+    def visitVariable(self, node, *args, **kwargs):
+        var = self.ast.var_object_dict[node.var]
+        if node.field:
+            sample_return = np.array([operator.attrgetter(node.field)(v) for v in var], dtype=float)
+        else:
+            sample_return = np.asarray(var, dtype=float)
+        return sample_return
+
+
+    def visitAbs(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.abs(sample)
+
+    def visitSqrt(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return sqrt(sample)
+
+    def visitExp(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return exp(sample)
+
+    def visitPow(self, node, *args, **kwargs):
+        sample_1 = self.visit(node.children[0], *args, **kwargs)
+        sample_2 = self.visit(node.children[1], *args, **kwargs)
+        return power(sample_1, sample_2)
+
+
+    def visitAddition(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return sample_left + sample_right
+
+
+    def visitSubtraction(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return sample_left - sample_right
+
+
+    def visitMultiplication(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return sample_left * sample_right
+
+
+    def visitDivision(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return division(sample_left, sample_right)
+
+
+    def visitNot(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return -sample
+
+
+    def visitAnd(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return np.minimum(sample_left, sample_right)
+
+
+    def visitOr(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return np.maximum(sample_left, sample_right)
+
+
+    def visitImplies(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return np.maximum(-sample_left, sample_right)
+
+
+    def visitIff(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return -np.abs(sample_left - sample_right)
+
+
+    def visitXor(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return np.abs(sample_left - sample_right)
+
+
+    def visitEventually(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.maximum.accumulate(sample[::-1])[::-1]
+
+
+    def visitAlways(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.minimum.accumulate(sample[::-1])[::-1]
+
+
+    def visitUntil(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return since(sample_left[::-1], sample_right[::-1])[::-1]
+
+
+    def visitOnce(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.maximum.accumulate(sample)
+
+
+    def visitHistorically(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.minimum.accumulate(sample)
+
+
+    def visitSince(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        return since(sample_left, sample_right)
+
+
+    def visitRise(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        prev = np.concatenate(([-float("inf")], sample[:-1]))
+        return np.minimum(-prev, sample)
+
+
+    def visitFall(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        prev = np.concatenate(([float("inf")], sample[:-1]))
+        return np.minimum(prev, -sample)
+
+
+    def visitConstant(self, node, *args, **kwargs):
+        length = args[0]
+        return np.full(length, node.val, dtype=float)
+
+
+    def visitPrevious(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.concatenate(([float("inf")], sample[:-1]))
+
+    def visitStrongPrevious(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.concatenate(([-float("inf")], sample[:-1]))
+
+
+    def visitNext(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.concatenate((sample[1:], [float("inf")]))
+
+    def visitStrongNext(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        return np.concatenate((sample[1:], [-float("inf")]))
+
+
+    def visitTimedOnce(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_once(sample, begin, end)
+
+
+    def visitTimedHistorically(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_historically(sample, begin, end)
+
+    def visitTimedSince(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_since(sample_left, sample_right, begin, end)
+
+
+    def visitTimedAlways(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_always(sample, begin, end)
+
+    def visitTimedEventually(self, node, *args, **kwargs):
+        sample = self.visit(node.children[0], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_eventually(sample, begin, end)
+
+
+    def visitTimedUntil(self, node, *args, **kwargs):
+        sample_left  = self.visit(node.children[0], *args, **kwargs)
+        sample_right = self.visit(node.children[1], *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return timed_since(sample_left[::-1], sample_right[::-1], begin, end)[::-1]
@@ -0,0 +1,6 @@
+from rtamt.semantics.stl.discrete_time.offline.vectorized.ast_visitor import StlDiscreteTimeOfflineAstVisitorNumpy
+from rtamt.semantics.abstract_discrete_time_offline_interpreter import discrete_time_offline_interpreter_factory
+
+def StlDiscreteTimeOfflineInterpreterNumpy():
+    stlDiscreteTimeOfflineInterpreterNumpy = discrete_time_offline_interpreter_factory(StlDiscreteTimeOfflineAstVisitorNumpy)()
+    return stlDiscreteTimeOfflineInterpreterNumpy
@@ -0,0 +1,36 @@
+from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+
+
+class AlignedOperation(AbstractOnlineOperation):
+    """A binary operation whose operands are delayed to refer to the same sample
+
+        Without pastification, the output of a node at sample n is its value at
+        sample n - latency, the latency adding up the ends of the bounded future
+        operators below it. The operand with the smaller latency is delayed by
+        the difference, a delay is None for the other operand.
+        """
+    def __init__(self, operation, delay_left, delay_right):
+        self.operation = operation
+        self.delay_left = delay_left
+        self.delay_right = delay_right
+
+    def reset(self):
+        self.operation.reset()
+        if self.delay_left is not None:
+            self.delay_left.reset()
+        if self.delay_right is not None:
+            self.delay_right.reset()
+
+    def update(self, sample_left, sample_right):
+        if self.delay_left is not None:
+            sample_left = self.delay_left.update(sample_left)
+        if self.delay_right is not None:
+            sample_right = self.delay_right.update(sample_right)
+        return self.operation.update(sample_left, sample_right)
+
+    def bounds(self, sample_left, sample_right):
+        if self.delay_left is not None:
+            sample_left = self.delay_left.bounds(sample_left)
+        if self.delay_right is not None:
+            sample_right = self.delay_right.bounds(sample_right)
+        return self.operation.bounds(sample_left, sample_right)
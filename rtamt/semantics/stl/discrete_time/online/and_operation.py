@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import minimum
 
 class AndOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -10,3 +11,6 @@ class AndOperation(AbstractOnlineOperation):
     def update(self, sample_left, sample_right):
         sample_return = min(sample_left, sample_right)
         return sample_return
+
+    def bounds(self, sample_left, sample_right):
+        return minimum(sample_left, sample_right)
@@ -1,6 +1,10 @@
 from rtamt.semantics.stl.discrete_time.online.strong_previous_operation import StrongPreviousOperation
 from rtamt.semantics.stl.discrete_time.online.variable_operation import VariableOperation
 from rtamt.syntax.ast.visitor.stl.ast_visitor import StlAstVisitor
+from rtamt.syntax.node.unary_node import UnaryNode
+from rtamt.syntax.node.stl.timed_always import TimedAlways
+from rtamt.syntax.node.stl.timed_eventually import TimedEventually
+from rtamt.syntax.node.stl.timed_until import TimedUntil
 
 from rtamt.semantics.arithmetic.discrete_time.online.addition_operation import AdditionOperation
 from rtamt.semantics.arithmetic.discrete_time.online.multiplication_operation import MultiplicationOperation
@@ -31,11 +35,48 @@ from rtamt.semantics.stl.discrete_time.online.once_timed_operation import OnceTi
 from rtamt.semantics.stl.discrete_time.online.historically_timed_operation import HistoricallyTimedOperation
 from rtamt.semantics.stl.discrete_time.online.since_timed_operation import SinceTimedOperation
 from rtamt.semantics.stl.discrete_time.online.precedes_timed_operation import PrecedesTimedOperation
+from rtamt.semantics.stl.discrete_time.online.delay_line import DelayLine
+from rtamt.semantics.stl.discrete_time.online.aligned_operation import AlignedOperation
 
 from rtamt.exception.exception import RTAMTException
 
 class StlDiscreteTimeOnlineAstVisitor(StlAstVisitor):
 
+    def visitAst(self, ast, *args, **kwargs):
+        # the delayed occurrences of a subformula share one delay line, keyed by its name
+        self.delay_lines = dict()
+        # number of samples the output of every subformula lags behind the input
+        self.latencies = dict()
+        out = super(StlDiscreteTimeOnlineAstVisitor, self).visitAst(ast, *args, **kwargs)
+        self.latency = self.latencies[ast.specs[-1].name] if ast.specs else 0
+        return out
+
+    def visit(self, node, *args, **kwargs):
+        # a sub-formula shared by several specs gets a single operator
+        if node.name in self.latencies:
+            return
+        super(StlDiscreteTimeOnlineAstVisitor, self).visit(node, *args, **kwargs)
+        self.align(node)
+
+    def align(self, node):
+        # some nodes register their children twice, only the first ones are operands
+        arity = 1 if isinstance(node, UnaryNode) else 2
+        latencies = [self.latencies[child.name] for child in node.children[:arity]]
+        latency = max(latencies) if latencies else 0
+        if len(latencies) == 2 and latencies[0] != latencies[1]:
+            delays = [self.delay(child, latency - child_latency) if child_latency < latency else None
+                      for child, child_latency in zip(node.children, latencies)]
+            self.online_operator_dict[node.name] = AlignedOperation(self.online_operator_dict[node.name], *delays)
+        if isinstance(node, (TimedEventually, TimedAlways, TimedUntil)):
+            begin, end = self.time_unit_transformer(node)
+            latency = latency + end
+        self.latencies[node.name] = latency
+
+    def delay(self, node, delay):
+        if node.name not in self.delay_lines:
+            self.delay_lines[node.name] = DelayLine()
+        return self.delay_lines[node.name].reader(delay)
+
     def visitVariable(self, node, *args, **kwargs):
         self.visitChildren(node, *args, **kwargs)
         self.online_operator_dict[node.name] = VariableOperation()
@@ -163,7 +204,10 @@ class StlDiscreteTimeOnlineAstVisitor(StlAstVisitor):
     def visitTimedOnce(self, node, *args, **kwargs):
         self.visitChildren(node, *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
-        self.online_operator_dict[node.name] = OnceTimedOperation(begin, end)
+        if begin == end:
+            self.online_operator_dict[node.name] = self.delay(node.children[0], begin)
+        else:
+            self.online_operator_dict[node.name] = OnceTimedOperation(begin, end)
 
     def visitTimedHistorically(self, node, *args, **kwargs):
         self.visitChildren(node, *args, **kwargs)
@@ -175,11 +219,21 @@ class StlDiscreteTimeOnlineAstVisitor(StlAstVisitor):
         begin, end = self.time_unit_transformer(node)
         self.online_operator_dict[node.name] = SinceTimedOperation(begin, end)
 
+    # The bounded future operators emit at sample n their verdict for sample
+    # n - end, which only depends on the last end - begin + 1 samples of the
+    # child, so they are the past operators over that window
+
     def visitTimedAlways(self, node, *args, **kwargs):
-        raise RTAMTException('Bounded always operator not implemented in STL online monitor.')
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = HistoricallyTimedOperation(0, end - begin)
 
     def visitTimedEventually(self, node, *args, **kwargs):
-        raise RTAMTException('Bounded eventually operator not implemented in STL online monitor.')
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = OnceTimedOperation(0, end - begin)
 
     def visitTimedUntil(self, node, *args, **kwargs):
-        raise RTAMTException('Bounded until operator not implemented in STL online monitor.')
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = PrecedesTimedOperation(begin, end)
@@ -1,170 +1,206 @@
+import operator
+
+from rtamt.syntax.node.unary_node import UnaryNode
+from rtamt.syntax.node.stl.timed_always import TimedAlways
+from rtamt.syntax.node.stl.timed_eventually import TimedEventually
+from rtamt.syntax.node.stl.timed_until import TimedUntil
 from rtamt.syntax.ast.visitor.stl.ast_visitor import StlAstVisitor
 
 from rtamt.semantics.enumerations.comp_op import StlComparisonOperator as CompOp
-from rtamt.lib.rtamt_stl_library_wrapper.stl_combinatorial_binary_node import CombinatorialBinaryOperation
 from rtamt.lib.rtamt_stl_library_wrapper.stl_comp_op import StlComparisonOperator
-from rtamt.lib.rtamt_stl_library_wrapper.stl_not_node import NotOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_addition_node import AdditionOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_predicate_node import PredicateOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_multiplication_node import MultiplicationOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_subtraction_node import SubtractionOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_division_node import DivisionOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_and_node import AndOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_or_node import OrOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_implies_node import ImpliesOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_iff_node import IffOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_xor_node import XorOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_since_node import SinceOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_abs_node import AbsOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_exp_node import ExpOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_pow_node import PowOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_sqrt_node import SqrtOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_rise_node import RiseOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_fall_node import FallOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_once_node import OnceOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_historically_node import HistoricallyOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_always_node import AlwaysOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_eventually_node import EventuallyOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_previous_node import PreviousOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_constant_node import ConstantOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_once_bounded_node import OnceBoundedOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_historically_bounded_node import HistoricallyBoundedOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_since_bounded_node import SinceBoundedOperation
-from rtamt.lib.rtamt_stl_library_wrapper.stl_precedes_bounded_node import PrecedesBoundedOperation
 
 from rtamt.exception.exception import RTAMTException
 
 
 class StlDiscreteTimeOnlineAstVisitorCpp(StlAstVisitor):
+    """Compiles the spec forest into a native StlMonitor
+
+        Every visit adds the node to self.monitor and returns its value slot.
+        The visitor expects the attributes
+            monitor : StlMonitor
+            slots : dict(str, int) - slot of every sub-formula name
+            node_slots : dict(AbstractNode, int) - slot of every node
+            latencies : dict(int, int) - number of samples every slot lags behind the input
+            variables : list of (var name, getter) - input variables in slot order
+    """
+
+    def visit(self, node, *args, **kwargs):
+        # a sub-formula shared by several specs is compiled (and updated) once
+        try:
+            slot = self.slots[node.name]
+        except KeyError:
+            slot = super(StlDiscreteTimeOnlineAstVisitorCpp, self).visit(node, *args, **kwargs)
+            self.slots[node.name] = slot
+            self.latencies[slot] = self.latency_of(node)
+        self.node_slots[node] = slot
+        return slot
+
+    def visitOperands(self, node, *args, **kwargs):
+        # some nodes register their children twice, only the first ones are operands
+        arity = 1 if isinstance(node, UnaryNode) else 2
+        slots = [self.visit(child, *args, **kwargs) for child in node.children[:arity]]
+        # without pastification, the operand lagging less is delayed to the same sample
+        latency = max(self.latencies[slot] for slot in slots)
+        return [slot if self.latencies[slot] == latency else self.monitor.add_delay(slot, latency - self.latencies[slot])
+                for slot in slots]
+
+    def latency_of(self, node):
+        arity = 1 if isinstance(node, UnaryNode) else 2
+        latency = max([self.latencies[self.slots[child.name]] for child in node.children[:arity]] + [0])
+        if isinstance(node, (TimedEventually, TimedAlways, TimedUntil)):
+            begin, end = self.time_unit_transformer(node)
+            latency = latency + end
+        return latency
+
+    def visitVariable(self, node, *args, **kwargs):
+        if node.field:
+            self.variables.append((node.var, operator.attrgetter(node.field)))
+        else:
+            self.variables.append((node.var, None))
+        return self.monitor.add_variable()
+
+    def visitConstant(self, node, *args, **kwargs):
+        return self.monitor.add_constant(node.val)
 
     def visitPredicate(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = PredicateOperation(self.op_cpp(node.operator))
+        left, right = self.visitOperands(node, *args, **kwargs)
+        return self.monitor.add_predicate(self.op_cpp(node.operator), left, right)
 
     def visitAbs(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = AbsOperation()
+        return self.add_unary('abs', node, *args, **kwargs)
 
     def visitPow(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = PowOperation()
+        return self.add_binary('pow', node, *args, **kwargs)
 
     def visitExp(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = ExpOperation()
+        return self.add_unary('exp', node, *args, **kwargs)
 
     def visitSqrt(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = SqrtOperation()
+        return self.add_unary('sqrt', node, *args, **kwargs)
+
+    def visitLog(self, node, *args, **kwargs):
+        raise RTAMTException('Log operator is not implemented in the STL C++ online monitor.')
+
+    def visitLn(self, node, *args, **kwargs):
+        raise RTAMTException('Ln operator is not implemented in the STL C++ online monitor.')
+
+    def visitNegate(self, node, *args, **kwargs):
+        child, = self.visitOperands(node, *args, **kwargs)
+        return self.monitor.add_binary('subtraction', self.monitor.add_constant(0), child)
 
     def visitAddition(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = AdditionOperation()
+        return self.add_binary('addition', node, *args, **kwargs)
 
     def visitSubtraction(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = SubtractionOperation()
+        return self.add_binary('subtraction', node, *args, **kwargs)
 
     def visitMultiplication(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = MultiplicationOperation()
+        return self.add_binary('multiplication', node, *args, **kwargs)
 
     def visitDivision(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = DivisionOperation()
+        return self.add_binary('division', node, *args, **kwargs)
 
     def visitNot(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = NotOperation()
+        return self.add_unary('not', node, *args, **kwargs)
 
     def visitAnd(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = AndOperation()
+        return self.add_binary('and', node, *args, **kwargs)
 
     def visitOr(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = OrOperation()
+        return self.add_binary('or', node, *args, **kwargs)
 
     def visitImplies(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = ImpliesOperation()
+        return self.add_binary('implies', node, *args, **kwargs)
 
     def visitIff(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = IffOperation()
+        return self.add_binary('iff', node, *args, **kwargs)
 
     def visitXor(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = XorOperation()
+        return self.add_binary('xor', node, *args, **kwargs)
 
     def visitEventually(self, node, *args, **kwargs):
-        #self.visitChildren(node, *args, **kwargs)
-        #self.online_operator_dict[node.name] = EventuallyOperation()
         raise RTAMTException('Eventually operator is not implemented in the STL online monitor.')
 
     def visitAlways(self, node, *args, **kwargs):
-        #self.visitChildren(node, *args, **kwargs)
-        #self.online_operator_dict[node.name] = AlwaysOperation()
         raise RTAMTException('Always operator is not implemented in the STL online monitor.')
 
     def visitUntil(self, node, *args, **kwargs):
         raise RTAMTException('Until operator is not implemented in the STL online monitor.')
 
     def visitOnce(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = OnceOperation()
+        return self.add_unary('once', node, *args, **kwargs)
 
     def visitHistorically(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = HistoricallyOperation()
+        return self.add_unary('historically', node, *args, **kwargs)
 
     def visitSince(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = SinceOperation()
+        return self.add_binary('since', node, *args, **kwargs)
 
     def visitRise(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = RiseOperation()
+        return self.add_unary('rise', node, *args, **kwargs)
 
     def visitFall(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = FallOperation()
+        return self.add_unary('fall', node, *args, **kwargs)
 
     def visitPrevious(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
-        self.online_operator_dict[node.name] = PreviousOperation()
+        return self.add_unary('previous', node, *args, **kwargs)
+
+    def visitStrongPrevious(self, node, *args, **kwargs):
+        raise RTAMTException('Strong previous operator is not implemented in the STL C++ online monitor.')
 
     def visitNext(self, node, *args, **kwargs):
         raise RTAMTException('Next operator not implemented in STL online monitor.')
 
+    def visitStrongNext(self, node, *args, **kwargs):
+        raise RTAMTException('Strong next operator not implemented in STL online monitor.')
+
     def visitTimedPrecedes(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
+        left, right = self.visitOperands(node, *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
-        self.online_operator_dict[node.name] = PrecedesBoundedOperation(begin, end)
+        return self.monitor.add_binary_bounded('precedes', left, right, begin, end)
 
     def visitTimedOnce(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
+        child, = self.visitOperands(node, *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
-        self.online_operator_dict[node.name] = OnceBoundedOperation(begin, end)
+        if begin == end:
+            # the delays of the same subformula share one history in the monitor
+            return self.monitor.add_delay(child, begin)
+        return self.monitor.add_unary_bounded('once', child, begin, end)
 
     def visitTimedHistorically(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
+        child, = self.visitOperands(node, *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
-        self.online_operator_dict[node.name] = HistoricallyBoundedOperation(begin, end)
+        return self.monitor.add_unary_bounded('historically', child, begin, end)
 
     def visitTimedSince(self, node, *args, **kwargs):
-        self.visitChildren(node, *args, **kwargs)
+        left, right = self.visitOperands(node, *args, **kwargs)
         begin, end = self.time_unit_transformer(node)
-        self.online_operator_dict[node.name] = SinceBoundedOperation(begin, end)
+        return self.monitor.add_binary_bounded('since', left, right, begin, end)
+
+    # the bounded future operators emit at sample n their verdict for sample n - end
 
     def visitTimedAlways(self, node, *args, **kwargs):
-        raise RTAMTException('Bounded always operator not implemented in STL online monitor.')
+        child, = self.visitOperands(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return self.monitor.add_unary_bounded('historically', child, 0, end - begin)
 
     def visitTimedEventually(self, node, *args, **kwargs):
-        raise RTAMTException('Bounded eventually operator not implemented in STL online monitor.')
+        child, = self.visitOperands(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return self.monitor.add_unary_bounded('once', child, 0, end - begin)
 
     def visitTimedUntil(self, node, *args, **kwargs):
-        raise RTAMTException('Bounded until operator not implemented in STL online monitor.')
+        left, right = self.visitOperands(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        return self.monitor.add_binary_bounded('precedes', left, right, begin, end)
+
+    def add_unary(self, op, node, *args, **kwargs):
+        child, = self.visitOperands(node, *args, **kwargs)
+        return self.monitor.add_unary(op, child)
+
+    def add_binary(self, op, node, *args, **kwargs):
+        left, right = self.visitOperands(node, *args, **kwargs)
+        return self.monitor.add_binary(op, left, right)
 
     def op_cpp(self, op):
         if op == CompOp.GEQ:
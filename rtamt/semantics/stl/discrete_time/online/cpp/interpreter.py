@@ -1,6 +1,139 @@
+import array
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from rtamt.lib.rtamt_stl_library_wrapper.stl_monitor import StlMonitor, count_sampling_violations
 from rtamt.semantics.stl.discrete_time.online.cpp.ast_visitor import StlDiscreteTimeOnlineAstVisitorCpp
-from rtamt.semantics.abstract_discrete_time_online_interpreter import discrete_time_online_interpreter_factory
+from rtamt.semantics.abstract_online_interpreter import AbstractOnlineInterpreter
+from rtamt.semantics.abstract_discrete_time_online_interpreter import AbstractDiscreteTimeOnlineInterpreter
+
+
+class StlDiscreteTimeOnlineInterpreterCpp(AbstractDiscreteTimeOnlineInterpreter, StlDiscreteTimeOnlineAstVisitorCpp):
+    """Discrete-time online interpreter evaluating the spec forest in a native StlMonitor
+
+        The whole node graph lives in C++, so every update crosses the
+        Python/C++ boundary once, whatever the size of the spec.
+    """
+    early_verdicts = False
+
+    def clone(self, ast=None):
+        # the native monitor cannot be copied, the clone compiles the spec again
+        return super(AbstractOnlineInterpreter, self).clone(ast)
+
+    def set_ast(self, ast):
+        self.monitor = StlMonitor()
+        self.slots = dict()
+        self.node_slots = dict()
+        self.latencies = dict()
+        self.variables = []
+
+        # compiles the spec forest into the monitor
+        super(AbstractDiscreteTimeOnlineInterpreter, self).set_ast(ast)
+        for spec in self.ast.specs:
+            self.monitor.set_out(self.slots[spec.name])
+        self.latency = self.latencies[self.slots[self.ast.specs[-1].name]] if self.ast.specs else 0
+
+        self.results = StlMonitorResults(self.monitor, self.node_slots)
+        return
+
+    def evaluate_sample(self, timestamp):
+        var_object_dict = self.ast.var_object_dict
+        inputs = [var_object_dict[var] if getter is None else getter(var_object_dict[var])
+                  for var, getter in self.variables]
+        rob = self.monitor.update(timestamp, inputs)
+        self.ast.results = self.results
+        return rob
+
+    # timestamps - buffer or list of floats
+    # dataset - list of [var name, buffer or list of var values] pairs
+    # out - optional writable buffer of doubles receiving the robustness
+    # Example:
+    # update_batch(array('d', [1, 2]), [['a', array('d', [2.2, 2.3])], ['b', array('d', [3.3, 3.4])]])
+    # Contiguous buffers of doubles (NumPy arrays, array.array('d'), memoryviews) are
+    # read by the monitor without copying, other sequences are converted first.
+    def update_batch(self, timestamps, dataset, out=None):
+        self.exist_ast()
+
+        length = len(timestamps)
+        columns = dict()
+        for data in dataset:
+            if data[0] in self.ast.free_vars:
+                columns[data[0]] = data[1]
+
+        var_object_dict = self.ast.var_object_dict
+        inputs = []
+        for var, getter in self.variables:
+            if var in columns:
+                column = columns[var]
+            else:
+                column = [var_object_dict[var]] * length
+            if getter is not None:
+                column = [getter(v) for v in column]
+            inputs.append(double_buffer(column))
+
+        timestamps = double_buffer(timestamps)
+        rob = out if out is not None else array.array('d', [0.0]) * length
+        self.monitor.update_batch(timestamps, inputs, rob)
+        if length == 0:
+            return rob if out is not None else []
+        self.ast.results = self.results
+
+        # the variables keep the last sample of the chunk, as after repeated update
+        for var_name in columns:
+            var_object_dict[var_name] = columns[var_name][length - 1]
+
+        output = var_object_dict[self.ast.out_var]
+        if self.ast.out_var_field:
+            setattr(output, self.ast.out_var_field, rob[length - 1])
+
+        tolerance = self.sampling_period * self.sampling_tolerance
+        previous = self.previous_time if self.update_counter > 0 else float('nan')
+        self.sampling_violation_counter = self.sampling_violation_counter + count_sampling_violations(
+            timestamps, previous, self.normalize, self.sampling_period - tolerance, self.sampling_period + tolerance)
+        self.previous_time = timestamps[length - 1]
+        self.update_counter = self.update_counter + length
+
+        return rob if out is not None else rob.tolist()
+
+    def reset(self):
+        self.monitor.reset()
+
+        self.update_counter = int(0)
+        self.previous_time = float(0.0)
+        self.sampling_violation_counter = int(0)
+        return
+
+    def set_variable_to_ast_from_dataset(self, dataset):
+        for data in dataset:
+            if data[0] in self.ast.free_vars:
+                self.ast.var_object_dict[data[0]] = data[1]
+
+
+class StlMonitorResults(Mapping):
+    """The value of every node after the last update, read from the monitor on access"""
+    def __init__(self, monitor, node_slots):
+        self.monitor = monitor
+        self.node_slots = node_slots
+
+    def __getitem__(self, node):
+        return self.monitor.value(self.node_slots[node])
+
+    def __iter__(self):
+        return iter(self.node_slots)
+
+    def __len__(self):
+        return len(self.node_slots)
+
 
-def StlDiscreteTimeOnlineInterpreterCpp():
-    stlDiscreteTimeOnlineInterpreterCpp = discrete_time_online_interpreter_factory(StlDiscreteTimeOnlineAstVisitorCpp)()
-    return stlDiscreteTimeOnlineInterpreterCpp
+def double_buffer(column):
+    """Returns column if it is a contiguous buffer of doubles, otherwise a copy as array('d')"""
+    try:
+        view = memoryview(column)
+    except TypeError:
+        return array.array('d', column)
+    if view.format in ('d', '@d', '=d') and view.c_contiguous:
+        return column
+    return array.array('d', view.tolist())
@@ -0,0 +1,87 @@
+from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point
+
+
+class DelayLine(object):
+    """A ring of the past samples of one subformula, shared by all its delayed occurrences
+
+        The pastifier shifts the predicates and variables under future operators
+        by the remaining horizon h, turning them into once[h,h](phi), and the
+        native future operators delay the operands they align. All the delays h
+        of the same phi are served from one ring, sized by the longest delay,
+        instead of one buffer of size h + 1 per delay.
+
+        Samples are stored by their index. Every reader keeps its own index and
+        stores the sample only if it is the first one to reach it, so the readers
+        may also advance column by column (update_batch). The ring grows when a
+        reader lags behind by more than its capacity.
+
+        Attributes
+        --------------
+        buffer : list
+            the samples, the sample of index i is at buffer[i & (len(buffer) - 1)]
+        end : int
+            index of the next sample to store
+        low : int
+            lower bound of the oldest index still needed by a reader
+        readers : list of DelayedVariableOperation
+        """
+    def __init__(self):
+        self.buffer = [None] * 16
+        self.readers = []
+        self.reset()
+
+    def reset(self):
+        self.end = 0
+        self.low = 0
+
+    def reader(self, delay):
+        reader = DelayedVariableOperation(self, delay)
+        self.readers.append(reader)
+        return reader
+
+    def store(self, index, sample):
+        if index < self.end:
+            return
+        # the sample of index end - capacity is overwritten, make sure nobody still needs it
+        if self.end - len(self.buffer) >= self.low:
+            self.low = min(reader.counter - reader.delay for reader in self.readers)
+            while self.end - len(self.buffer) >= self.low:
+                self.grow()
+        self.buffer[self.end & (len(self.buffer) - 1)] = sample
+        self.end = self.end + 1
+
+    def get(self, index):
+        if index < 0:
+            return -float("inf")
+        return self.buffer[index & (len(self.buffer) - 1)]
+
+    def grow(self):
+        capacity = len(self.buffer)
+        buffer = [None] * (2 * capacity)
+        for index in range(max(self.end - capacity, 0), self.end):
+            buffer[index & (2 * capacity - 1)] = self.buffer[index & (capacity - 1)]
+        self.buffer = buffer
+
+
+class DelayedVariableOperation(AbstractOnlineOperation):
+    """once[delay,delay](phi) reading from the delay line of phi"""
+    def __init__(self, line, delay):
+        self.line = line
+        self.delay = delay
+        self.counter = 0
+
+    def reset(self):
+        self.counter = 0
+        self.line.reset()
+
+    def update(self, sample):
+        self.line.store(self.counter, sample)
+        out = self.line.get(self.counter - self.delay)
+        self.counter = self.counter + 1
+        return out
+
+    def bounds(self, sample):
+        if self.delay == 0:
+            return sample
+        return point(self.line.get(self.counter - self.delay))
@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point, negate, minimum
 
 class FallOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -11,3 +12,6 @@ class FallOperation(AbstractOnlineOperation):
         sample_return = min(self.prev, - sample)
         self.prev = sample
         return sample_return
+
+    def bounds(self, sample):
+        return minimum(point(self.prev), negate(sample))
@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point, minimum
 class HistoricallyOperation(AbstractOnlineOperation):
     def __init__(self):
         self.prev_out = float("inf")
@@ -10,3 +11,6 @@ class HistoricallyOperation(AbstractOnlineOperation):
         sample_return = min(sample, self.prev_out)
         self.prev_out = sample_return
         return sample_return
+
+    def bounds(self, sample):
+        return minimum(sample, point(self.prev_out))
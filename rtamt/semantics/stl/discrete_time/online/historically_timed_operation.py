@@ -1,21 +1,36 @@
 import collections
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.stl.discrete_time.online.monotonic_wedge import MinWedge
+from rtamt.semantics.bounds import point, minimum
 class HistoricallyTimedOperation(AbstractOnlineOperation):
     def __init__(self, begin, end):
         self.begin = begin
         self.end = end
-        self.buffer = collections.deque(maxlen=(self.end + 1))
+        # samples younger than begin are not yet visible in the window
+        self.buffer = collections.deque()
+        self.wedge = MinWedge()
 
         self.reset()
 
     def reset(self):
-        for i in range(self.end + 1):
-            val = float("inf")
-            self.buffer.append(val)
+        self.counter = 0
+        self.buffer.clear()
+        self.wedge.reset()
 
     def update(self, sample):
         self.buffer.append(sample)
-        sample_return = float("inf")
-        for i in range(self.end-self.begin+1):
-            sample_return = min(sample_return, self.buffer[i])
-        return sample_return
+        if len(self.buffer) > self.begin:
+            self.wedge.push(self.counter - self.begin, self.buffer.popleft())
+        self.wedge.evict(self.counter - self.end)
+        self.counter = self.counter + 1
+        return self.wedge.front()
+
+    def bounds(self, sample):
+        # the next window loses the sample of index counter - end - 1 and gains
+        # the one of index counter - begin, known unless begin is 0
+        out = point(self.wedge.front_from(self.counter - self.end))
+        if self.begin == 0:
+            return minimum(out, sample)
+        if len(self.buffer) == self.begin:
+            return minimum(out, point(self.buffer[0]))
+        return out
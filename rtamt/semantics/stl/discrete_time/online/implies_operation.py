@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import negate, maximum
 
 class ImpliesOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -10,3 +11,6 @@ class ImpliesOperation(AbstractOnlineOperation):
     def update(self, sample_left, sample_right):
         sample_return = max(-sample_left, sample_right)
         return sample_return
+
+    def bounds(self, sample_left, sample_right):
+        return maximum(negate(sample_left), sample_right)
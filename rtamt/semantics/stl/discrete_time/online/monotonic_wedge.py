@@ -0,0 +1,71 @@
+import collections
+import operator
+
+
+class MonotonicWedge(object):
+    """Streaming sliding-window extremum (Lemire's monotonic wedge)
+
+        Samples are pushed together with their (increasing) index. The wedge only
+        keeps the samples that can still become the extremum of the window, so
+        push, evict and front are amortized O(1) regardless of the window length.
+
+        Attributes
+        --------------
+        dominates : function
+            dominates(new, old) is True if old can never again be the extremum
+            once new has been pushed (operator.ge for max, operator.le for min)
+        default : float
+            value returned by front when the window is empty
+        """
+    def __init__(self, dominates, default):
+        self.dominates = dominates
+        self.default = default
+        self.wedge = collections.deque()
+
+    def reset(self):
+        self.wedge.clear()
+
+    def push(self, index, value):
+        wedge = self.wedge
+        dominates = self.dominates
+        while wedge and dominates(value, wedge[-1][1]):
+            wedge.pop()
+        wedge.append((index, value))
+
+    def evict(self, index):
+        # drop all samples with index strictly smaller than index
+        wedge = self.wedge
+        while wedge and wedge[0][0] < index:
+            wedge.popleft()
+
+    def clip(self, value):
+        # replace every sample v in the window by the extremum-opposite of v and
+        # value, i.e. min(v, value) for a max wedge and max(v, value) for a min
+        # wedge - the clipped samples collapse into the youngest of them
+        wedge = self.wedge
+        dominates = self.dominates
+        index = None
+        while wedge and dominates(wedge[0][1], value):
+            index = wedge.popleft()[0]
+        if index is not None:
+            wedge.appendleft((index, value))
+
+    def front(self):
+        if self.wedge:
+            return self.wedge[0][1]
+        return self.default
+
+    def front_from(self, index):
+        # extremum of the samples with index at least index, without evicting
+        for sample_index, value in self.wedge:
+            if sample_index >= index:
+                return value
+        return self.default
+
+
+def MaxWedge():
+    return MonotonicWedge(operator.ge, -float("inf"))
+
+
+def MinWedge():
+    return MonotonicWedge(operator.le, float("inf"))
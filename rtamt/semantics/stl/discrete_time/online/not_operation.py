@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import negate
 
 class NotOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -10,3 +11,6 @@ class NotOperation(AbstractOnlineOperation):
     def update(self, sample):
         sample_return = - sample
         return sample_return
+
+    def bounds(self, sample):
+        return negate(sample)
@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point, maximum
 
 class OnceOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -11,3 +12,6 @@ class OnceOperation(AbstractOnlineOperation):
         sample_return = max(sample, self.prev_out)
         self.prev_out = sample_return
         return sample_return
+
+    def bounds(self, sample):
+        return maximum(sample, point(self.prev_out))
@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import maximum
 class OrOperation(AbstractOnlineOperation):
     def __init__(self):
         pass
@@ -9,3 +10,6 @@ class OrOperation(AbstractOnlineOperation):
     def update(self, sample_left, sample_right):
         sample_return = max(sample_left, sample_right)
         return sample_return
+
+    def bounds(self, sample_left, sample_right):
+        return maximum(sample_left, sample_right)
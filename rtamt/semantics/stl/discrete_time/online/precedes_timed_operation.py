@@ -1,33 +1,55 @@
-import collections
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.stl.discrete_time.online.monotonic_wedge import MinWedge
+
+# The segment [t-end+begin, t] is summarized by the pair
+# (max_s min(right(s), min left[t-end+begin..s-1]), min left[t-end+begin..t])
+# which composes associatively, so it is maintained with a two-stack queue.
+IDENTITY = (-float("inf"), float("inf"))
+
+def compose(first, second):
+    return max(first[0], min(first[1], second[0])), min(first[1], second[1])
+
 class PrecedesTimedOperation(AbstractOnlineOperation):
     def __init__(self, begin, end):
         self.begin = begin
         self.end = end
 
-        self.buffer = []
-        self.buffer.append(collections.deque(maxlen=(self.end + 1)))
-        self.buffer.append(collections.deque(maxlen=(self.end + 1)))
+        # back stack holds samples, front stack holds (index, left, suffix summary)
+        self.back = []
+        self.back_summary = IDENTITY
+        self.front = []
+        # min of left over [t-end, t-end+begin-1]
+        self.wedge_left = MinWedge()
 
         self.reset()
 
     def reset(self):
-        for i in range(self.end + 1):
-            s_sample_left = float("inf")
-            s_sample_right = - float("inf")
-            self.buffer[0].append(s_sample_left)
-            self.buffer[1].append(s_sample_right)
+        self.counter = 0
+        del self.back[:]
+        self.back_summary = IDENTITY
+        del self.front[:]
+        self.wedge_left.reset()
 
     def update(self, sample_left, sample_right):
-        self.buffer[0].append(sample_left)
-        self.buffer[1].append(sample_right)
-        sample_return = - float("inf")
-
-        for i in range(self.begin, self.end+1):
-            sample_left = float("inf")
-            sample_right = self.buffer[1][i]
-            for j in range(0, i):
-                sample_left = min(sample_left, self.buffer[0][j])
-            sample_return = max(sample_return, min(sample_left, sample_right))
-
-        return sample_return
+        self.back.append((self.counter, sample_left, sample_right))
+        self.back_summary = compose(self.back_summary, (sample_right, sample_left))
+
+        if len(self.back) + len(self.front) > self.end - self.begin + 1:
+            if not self.front:
+                summary = IDENTITY
+                while self.back:
+                    index, left, right = self.back.pop()
+                    summary = compose((right, left), summary)
+                    self.front.append((index, left, summary))
+                self.back_summary = IDENTITY
+            index, left, summary = self.front.pop()
+            self.wedge_left.push(index, left)
+        self.wedge_left.evict(self.counter - self.end)
+
+        if self.front:
+            summary = compose(self.front[-1][2], self.back_summary)
+        else:
+            summary = self.back_summary
+
+        self.counter = self.counter + 1
+        return min(self.wedge_left.front(), summary[0])
@@ -1,6 +1,7 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
 from rtamt.semantics.enumerations.comp_oper import StlComparisonOperator
 from rtamt.exception.exception import RTAMTException
+from rtamt.semantics.bounds import negate, absolute, subtract
 
 
 class PredicateOperation(AbstractOnlineOperation):
@@ -41,3 +42,15 @@ class PredicateOperation(AbstractOnlineOperation):
             raise RTAMTException('Unknown predicate operation')
 
         return sample_return
+
+    def bounds(self, sample_left, sample_right):
+        if self.comparison_op.value == StlComparisonOperator.EQ.value:
+            return negate(absolute(subtract(sample_left, sample_right)))
+        elif self.comparison_op.value == StlComparisonOperator.NEQ.value:
+            return absolute(subtract(sample_left, sample_right))
+        elif self.comparison_op.value == StlComparisonOperator.LEQ.value or self.comparison_op.value == StlComparisonOperator.LESS.value:
+            return subtract(sample_right, sample_left)
+        elif self.comparison_op.value == StlComparisonOperator.GEQ.value or self.comparison_op.value == StlComparisonOperator.GREATER.value:
+            return subtract(sample_left, sample_right)
+        else:
+            raise RTAMTException('Unknown predicate operation')
@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point
 
 class PreviousOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -12,3 +13,6 @@ class PreviousOperation(AbstractOnlineOperation):
         self.prev = sample
 
         return sample_return
+
+    def bounds(self, sample):
+        return point(self.prev)
@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point, minimum
 
 class RiseOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -11,4 +12,7 @@ class RiseOperation(AbstractOnlineOperation):
         sample_return = min(- self.prev, sample)
         self.prev = sample
 
-        return sample_return
\ No newline at end of file
+        return sample_return
+
+    def bounds(self, sample):
+        return minimum(point(- self.prev), sample)
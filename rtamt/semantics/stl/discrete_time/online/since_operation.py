@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point, minimum, maximum
 
 class SinceOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -12,3 +13,6 @@ class SinceOperation(AbstractOnlineOperation):
         sample_return = max(sample_return, sample_right)
         self.prev_out = sample_return
         return sample_return
+
+    def bounds(self, sample_left, sample_right):
+        return maximum(minimum(sample_left, point(self.prev_out)), sample_right)
@@ -1,34 +1,38 @@
 import collections
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.stl.discrete_time.online.monotonic_wedge import MaxWedge, MinWedge
 
 class SinceTimedOperation(AbstractOnlineOperation):
     def __init__(self, begin, end):
         self.begin = begin
         self.end = end
 
-        self.buffer_sample_left = collections.deque(maxlen=(self.end + 1))
-        self.buffer_sample_right = collections.deque(maxlen=(self.end + 1))
+        # right samples younger than begin are not yet candidates
+        self.buffer_sample_right = collections.deque()
+        # min of the last begin left samples
+        self.wedge_left = MinWedge()
+        # candidates min(right(s), left(s+1..t)) for s in [t-end, t-begin]
+        self.wedge_candidates = MaxWedge()
 
         self.reset()
 
     def reset(self):
-        for i in range(self.end + 1):
-            s_sample_left = float("inf")
-            s_sample_right = - float("inf")
-            self.buffer_sample_left.append(s_sample_left)
-            self.buffer_sample_right.append(s_sample_right)
+        self.counter = 0
+        self.buffer_sample_right.clear()
+        self.wedge_left.reset()
+        self.wedge_candidates.reset()
 
     def update(self, sample_left, sample_right):
-        self.buffer_sample_left.append(sample_left)
-        self.buffer_sample_right.append(sample_right)
-        sample_return = - float("inf")
+        self.wedge_candidates.clip(sample_left)
 
-        for i in range(self.end-self.begin+1):
-            sample_left = float("inf")
-            sample_right = self.buffer_sample_right[i]
-            for j in range(i+1,self.end+1):
-                sample_left = min(sample_left, self.buffer_sample_left[j])
-            sample_return = max(sample_return, min(sample_left, sample_right))
+        self.wedge_left.push(self.counter, sample_left)
+        self.wedge_left.evict(self.counter - self.begin + 1)
 
-        return sample_return
+        self.buffer_sample_right.append(sample_right)
+        if len(self.buffer_sample_right) > self.begin:
+            candidate = min(self.buffer_sample_right.popleft(), self.wedge_left.front())
+            self.wedge_candidates.push(self.counter - self.begin, candidate)
+        self.wedge_candidates.evict(self.counter - self.end)
 
+        self.counter = self.counter + 1
+        return self.wedge_candidates.front()
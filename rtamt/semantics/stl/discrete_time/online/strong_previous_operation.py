@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import point
 
 class StrongPreviousOperation(AbstractOnlineOperation):
     def __init__(self):
@@ -12,3 +13,6 @@ class StrongPreviousOperation(AbstractOnlineOperation):
         self.prev = sample
 
         return sample_return
+
+    def bounds(self, sample):
+        return point(self.prev)
@@ -0,0 +1,111 @@
+from rtamt.semantics.stl.discrete_time.online.ast_visitor import StlDiscreteTimeOnlineAstVisitor
+from rtamt.semantics.stl.discrete_time.online.vectorized.operations import SqrtOperation, ExpOperation, \
+    PowOperation, LogOperation, LnOperation, AndOperation, OrOperation, ImpliesOperation, RiseOperation, \
+    FallOperation, PreviousOperation, OnceOperation, HistoricallyOperation, SinceOperation, OnceTimedOperation, \
+    HistoricallyTimedOperation, SinceTimedOperation, PrecedesTimedOperation, DelayOperation
+
+
+class StlDiscreteTimeOnlineAstVisitorNumpy(StlDiscreteTimeOnlineAstVisitor):
+    """Online discrete-time visitor creating operations over N independent streams
+
+        The operations that are not overridden (predicates, negation, iff, xor and
+        the arithmetic operators) apply unchanged to NumPy arrays.
+    """
+
+    def visitSqrt(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = SqrtOperation()
+
+    def visitExp(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = ExpOperation()
+
+    def visitPow(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = PowOperation()
+
+    def visitLog(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = LogOperation()
+
+    def visitLn(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = LnOperation()
+
+    def visitAnd(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = AndOperation()
+
+    def visitOr(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = OrOperation()
+
+    def visitImplies(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = ImpliesOperation()
+
+    def visitOnce(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = OnceOperation()
+
+    def visitHistorically(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = HistoricallyOperation()
+
+    def visitSince(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = SinceOperation()
+
+    def visitRise(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = RiseOperation()
+
+    def visitFall(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = FallOperation()
+
+    def visitPrevious(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = PreviousOperation(float("inf"))
+
+    def visitStrongPrevious(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        self.online_operator_dict[node.name] = PreviousOperation(-float("inf"))
+
+    def visitTimedPrecedes(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = PrecedesTimedOperation(begin, end)
+
+    def visitTimedOnce(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = OnceTimedOperation(begin, end)
+
+    def visitTimedHistorically(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = HistoricallyTimedOperation(begin, end)
+
+    def visitTimedSince(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = SinceTimedOperation(begin, end)
+
+    def visitTimedAlways(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = HistoricallyTimedOperation(0, end - begin)
+
+    def visitTimedEventually(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = OnceTimedOperation(0, end - begin)
+
+    def visitTimedUntil(self, node, *args, **kwargs):
+        self.visitChildren(node, *args, **kwargs)
+        begin, end = self.time_unit_transformer(node)
+        self.online_operator_dict[node.name] = PrecedesTimedOperation(begin, end)
+
+    def delay(self, node, delay):
+        return DelayOperation(delay)
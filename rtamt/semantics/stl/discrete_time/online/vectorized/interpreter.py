@@ -0,0 +1,21 @@
+import numpy as np
+
+from rtamt.semantics.stl.discrete_time.online.vectorized.ast_visitor import StlDiscreteTimeOnlineAstVisitorNumpy
+from rtamt.semantics.abstract_discrete_time_online_interpreter import discrete_time_online_interpreter_factory
+
+
+class StlDiscreteTimeOnlineInterpreterNumpy(discrete_time_online_interpreter_factory(StlDiscreteTimeOnlineAstVisitorNumpy)):
+    """Online discrete-time interpreter advancing N independent streams in lockstep
+
+        Every update takes one sample per stream for each variable, i.e. a sequence
+        of length N, and returns the robustness of the N streams as a NumPy array.
+    """
+    early_verdicts = False
+
+    def set_variable_to_ast_from_dataset(self, dataset):
+        dataset = [[data[0], np.array(data[1], dtype=float)] for data in dataset]
+        super(StlDiscreteTimeOnlineInterpreterNumpy, self).set_variable_to_ast_from_dataset(dataset)
+
+    def update_batch(self, timestamps, dataset, out=None):
+        dataset = [[data[0], [np.array(sample, dtype=float) for sample in data[1]]] for data in dataset]
+        return super(StlDiscreteTimeOnlineInterpreterNumpy, self).update_batch(timestamps, dataset, out)
@@ -0,0 +1,365 @@
+import numpy as np
+
+from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+
+
+# Online operations over N independent streams: every sample is an array of
+# shape (N,), holding one value per stream, and every state is an array with
+# a trailing axis of size N, allocated from the shape of the first sample.
+
+
+class DelayLine(object):
+    """Ring buffer returning the sample pushed delay updates ago, or fill before"""
+    def __init__(self, delay, fill):
+        self.delay = delay
+        self.fill = fill
+        self.reset()
+
+    def reset(self):
+        self.buffer = None
+        self.index = 0
+
+    def push(self, sample):
+        if self.delay == 0:
+            return sample
+        if self.buffer is None:
+            self.buffer = np.full((self.delay,) + np.shape(sample), self.fill)
+        out = self.buffer[self.index].copy()
+        self.buffer[self.index] = sample
+        self.index = (self.index + 1) % self.delay
+        return out
+
+
+class DelayOperation(AbstractOnlineOperation):
+    """Returns the sample pushed delay updates ago, used to align the operands of a node"""
+    def __init__(self, delay):
+        self.delay = DelayLine(delay, -float("inf"))
+
+    def reset(self):
+        self.delay.reset()
+
+    def update(self, sample):
+        return self.delay.push(sample)
+
+
+class SlidingWindow(object):
+    """Online van Herk/Gil-Werman reduction over the last width samples
+
+        The samples are split into blocks of width samples. The window ending at
+        position j of the current block is the prefix reduction of the current block
+        up to j combined with the suffix reduction of the previous block from j+1,
+        and the suffixes are computed once per block, i.e. O(1) amortized per stream.
+    """
+    def __init__(self, width, ufunc, identity):
+        self.width = width
+        self.ufunc = ufunc
+        self.identity = identity
+        self.reset()
+
+    def reset(self):
+        self.block = None
+        self.suffix = None
+        self.prefix = None
+        self.index = 0
+
+    def push(self, sample):
+        if self.block is None:
+            self.block = np.full((self.width,) + np.shape(sample), self.identity)
+            self.suffix = np.full((self.width + 1,) + np.shape(sample), self.identity)
+            self.prefix = np.full(np.shape(sample), self.identity)
+
+        self.block[self.index] = sample
+        self.prefix = self.ufunc(self.prefix, sample)
+        out = self.ufunc(self.suffix[self.index + 1], self.prefix)
+
+        self.index = self.index + 1
+        if self.index == self.width:
+            self.suffix[:self.width] = self.ufunc.accumulate(self.block[::-1], axis=0)[::-1]
+            self.prefix = np.full(np.shape(sample), self.identity)
+            self.index = 0
+        return out
+
+
+class SqrtOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample):
+        return np.sqrt(sample)
+
+
+class ExpOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample):
+        return np.exp(sample)
+
+
+class PowOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample_left, sample_right):
+        return np.power(sample_left, sample_right)
+
+
+class LogOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample_left, sample_right):
+        return np.log(sample_left) / np.log(sample_right)
+
+
+class LnOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample):
+        return np.log(sample)
+
+
+class AndOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample_left, sample_right):
+        return np.minimum(sample_left, sample_right)
+
+
+class OrOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample_left, sample_right):
+        return np.maximum(sample_left, sample_right)
+
+
+class ImpliesOperation(AbstractOnlineOperation):
+    def __init__(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def update(self, sample_left, sample_right):
+        return np.maximum(-sample_left, sample_right)
+
+
+class RiseOperation(AbstractOnlineOperation):
+    def __init__(self):
+        self.prev = -float("inf")
+
+    def reset(self):
+        self.__init__()
+
+    def update(self, sample):
+        sample_return = np.minimum(-self.prev, sample)
+        self.prev = np.array(sample, dtype=float)
+        return sample_return
+
+
+class FallOperation(AbstractOnlineOperation):
+    def __init__(self):
+        self.prev = float("inf")
+
+    def reset(self):
+        self.__init__()
+
+    def update(self, sample):
+        sample_return = np.minimum(self.prev, -sample)
+        self.prev = np.array(sample, dtype=float)
+        return sample_return
+
+
+class PreviousOperation(AbstractOnlineOperation):
+    def __init__(self, fill=float("inf")):
+        self.fill = fill
+        self.prev = None
+
+    def reset(self):
+        self.prev = None
+
+    def update(self, sample):
+        if self.prev is None:
+            self.prev = np.full(np.shape(sample), self.fill)
+        sample_return = self.prev
+        self.prev = np.array(sample, dtype=float)
+        return sample_return
+
+
+class OnceOperation(AbstractOnlineOperation):
+    def __init__(self):
+        self.prev_out = -float("inf")
+
+    def reset(self):
+        self.__init__()
+
+    def update(self, sample):
+        self.prev_out = np.maximum(sample, self.prev_out)
+        return self.prev_out
+
+
+class HistoricallyOperation(AbstractOnlineOperation):
+    def __init__(self):
+        self.prev_out = float("inf")
+
+    def reset(self):
+        self.__init__()
+
+    def update(self, sample):
+        self.prev_out = np.minimum(sample, self.prev_out)
+        return self.prev_out
+
+
+class SinceOperation(AbstractOnlineOperation):
+    def __init__(self):
+        self.prev_out = -float("inf")
+
+    def reset(self):
+        self.__init__()
+
+    def update(self, sample_left, sample_right):
+        self.prev_out = np.maximum(np.minimum(sample_left, self.prev_out), sample_right)
+        return self.prev_out
+
+
+class OnceTimedOperation(AbstractOnlineOperation):
+    def __init__(self, begin, end):
+        self.delay = DelayLine(begin, -float("inf"))
+        self.window = SlidingWindow(end - begin + 1, np.maximum, -float("inf"))
+
+    def reset(self):
+        self.delay.reset()
+        self.window.reset()
+
+    def update(self, sample):
+        return self.window.push(self.delay.push(sample))
+
+
+class HistoricallyTimedOperation(AbstractOnlineOperation):
+    def __init__(self, begin, end):
+        self.delay = DelayLine(begin, float("inf"))
+        self.window = SlidingWindow(end - begin + 1, np.minimum, float("inf"))
+
+    def reset(self):
+        self.delay.reset()
+        self.window.reset()
+
+    def update(self, sample):
+        return self.window.push(self.delay.push(sample))
+
+
+class SinceTimedOperation(AbstractOnlineOperation):
+    """left since[begin,end] right at t is the minimum of
+        - left over the last begin samples [t-begin+1, t]
+        - left since right at t-begin
+        - once[0,end-begin] right at t-begin
+    """
+    def __init__(self, begin, end):
+        self.begin = begin
+        self.since = SinceOperation()
+        self.delay_since = DelayLine(begin, -float("inf"))
+        self.delay_right = DelayLine(begin, -float("inf"))
+        self.window_right = SlidingWindow(end - begin + 1, np.maximum, -float("inf"))
+        self.window_left = SlidingWindow(begin, np.minimum, float("inf"))
+
+    def reset(self):
+        self.since.reset()
+        self.delay_since.reset()
+        self.delay_right.reset()
+        self.window_right.reset()
+        self.window_left.reset()
+
+    def update(self, sample_left, sample_right):
+        sample_since = self.since.update(sample_left, sample_right)
+        sample_return = np.minimum(self.delay_since.push(sample_since),
+                                   self.window_right.push(self.delay_right.push(sample_right)))
+        if self.begin > 0:
+            sample_return = np.minimum(sample_return, self.window_left.push(sample_left))
+        return sample_return
+
+
+class PrecedesTimedOperation(AbstractOnlineOperation):
+    """max over i in [begin, end] of min(right(t-end+i), left over [t-end, t-end+i-1])
+
+        The last end-begin+1 samples are summarized by the pair
+        (max_s min(right(s), left over [t-end+begin, s-1]), left over [t-end+begin, t])
+        which composes associatively but not commutatively. As in SlidingWindow, the
+        window is the suffix summary of the previous block combined with the prefix
+        summary of the current block, and the suffixes are composed once per block,
+        i.e. O(1) amortized vectorized steps per update. The left samples over
+        [t-end, t-end+begin-1] are reduced by a delayed SlidingWindow.
+    """
+    def __init__(self, begin, end):
+        self.begin = begin
+        self.width = end - begin + 1
+        self.delay_left = DelayLine(self.width, float("inf"))
+        self.window_left = SlidingWindow(begin, np.minimum, float("inf")) if begin > 0 else None
+        self.reset()
+
+    def reset(self):
+        self.block_left = None
+        self.block_right = None
+        self.suffix_left = None
+        self.suffix_right = None
+        self.prefix_left = None
+        self.prefix_right = None
+        self.index = 0
+        self.delay_left.reset()
+        if self.window_left is not None:
+            self.window_left.reset()
+
+    def update(self, sample_left, sample_right):
+        if self.block_left is None:
+            shape = np.shape(sample_left)
+            self.block_left = np.full((self.width,) + shape, float("inf"))
+            self.block_right = np.full((self.width,) + shape, -float("inf"))
+            self.suffix_left = np.full((self.width + 1,) + shape, float("inf"))
+            self.suffix_right = np.full((self.width + 1,) + shape, -float("inf"))
+            self.prefix_left = np.full(shape, float("inf"))
+            self.prefix_right = np.full(shape, -float("inf"))
+
+        self.block_left[self.index] = sample_left
+        self.block_right[self.index] = sample_right
+        self.prefix_right = np.maximum(self.prefix_right, np.minimum(self.prefix_left, sample_right))
+        self.prefix_left = np.minimum(self.prefix_left, sample_left)
+        out = np.maximum(self.suffix_right[self.index + 1],
+                         np.minimum(self.suffix_left[self.index + 1], self.prefix_right))
+
+        self.index = self.index + 1
+        if self.index == self.width:
+            for j in range(self.width - 1, -1, -1):
+                self.suffix_right[j] = np.maximum(self.block_right[j],
+                                                  np.minimum(self.block_left[j], self.suffix_right[j + 1]))
+                self.suffix_left[j] = np.minimum(self.block_left[j], self.suffix_left[j + 1])
+            self.prefix_left = np.full(np.shape(sample_left), float("inf"))
+            self.prefix_right = np.full(np.shape(sample_left), -float("inf"))
+            self.index = 0
+
+        sample_left = self.delay_left.push(sample_left)
+        if self.window_left is not None:
+            out = np.minimum(out, self.window_left.push(sample_left))
+        return out
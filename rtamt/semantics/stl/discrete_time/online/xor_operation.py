@@ -1,4 +1,5 @@
 from rtamt.semantics.abstract_online_operation import AbstractOnlineOperation
+from rtamt.semantics.bounds import absolute, subtract
 class XorOperation(AbstractOnlineOperation):
     def __init__(self):
         pass
@@ -9,3 +10,6 @@ class XorOperation(AbstractOnlineOperation):
     def update(self, sample_left, sample_right):
         sample_return = abs(sample_left - sample_right)
         return sample_return
+
+    def bounds(self, sample_left, sample_right):
+        return absolute(subtract(sample_left, sample_right))
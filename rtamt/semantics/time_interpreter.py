@@ -9,6 +9,13 @@ class TimeInterpreter(object):
     def __init__(self):
         pass
 
+    def clone(self, ast=None):
+        # a fresh interpreter of the same type and configuration, set to ast if given
+        interpreter = type(self)()
+        if ast is not None:
+            interpreter.set_ast(ast)
+        return interpreter
+
     @abstractmethod
     def dataset_check(self, data):
         pass
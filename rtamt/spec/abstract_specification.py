@@ -1,4 +1,5 @@
 import os
+import copy
 from abc import ABCMeta
 
 from rtamt.semantics.abstract_discrete_time_online_interpreter import AbstractDiscreteTimeOnlineInterpreter
@@ -49,6 +50,14 @@ class AbstractSpecification(object):
     def spec(self, spec):
         self.ast.spec = spec
 
+    @property
+    def parser_type(self):
+        return self.ast.parser_type
+
+    @parser_type.setter
+    def parser_type(self, parser_type):
+        self.ast.parser_type = parser_type
+
     # forwarding to ast
     def add_var(self, var):
         self.ast.vars.add(var)
@@ -136,6 +145,30 @@ class AbstractSpecification(object):
     def parse(self):
         self.ast.parse()
 
+    # A clone shares the parsed (and pastified) formulas of this specification.
+    # The interpreters are set up once, on this specification, and the clone gets
+    # copies of their operators in the reset state.
+    def clone(self):
+        if self.set_ast_flag != True:
+            if hasattr(self, 'online_interpreter'):
+                self.online_interpreter.set_ast(self.ast)
+            if hasattr(self, 'offline_interpreter'):
+                self.offline_interpreter.set_ast(self.ast)
+            self.set_ast_flag = True
+
+        spec = copy.copy(self)
+        spec.ast = self.ast.clone()
+
+        if hasattr(self, 'online_interpreter'):
+            spec.online_interpreter = self.online_interpreter.clone(spec.ast)
+        if hasattr(self, 'offline_interpreter'):
+            spec.offline_interpreter = self.offline_interpreter.clone(spec.ast)
+        if getattr(self, 'explainer', None) is not None:
+            spec.explainer = type(self.explainer)()
+        if getattr(self, 'pastifier', None) is not None:
+            spec.pastifier = type(self.pastifier)()
+        return spec
+
     # forwarding to interpreter
     def set_sampling_period(self, sampling_period=int(1), unit='s', tolerance=float(0.1)):
         if hasattr(self, 'online_interpreter'):
@@ -175,6 +208,33 @@ class AbstractSpecification(object):
             else:
                 RTAMTException('only discrete time has sampling_violation_counter')
 
+    @property
+    def compaction_counter(self):
+        if hasattr(self, 'online_interpreter') and isinstance(self.online_interpreter, AbstractDenseTimeOnlineInterpreter):
+            return self.online_interpreter.compaction_counter
+        raise RTAMTException('only dense time online monitors have compaction_counter')
+
+    @property
+    def blocked_counter(self):
+        if hasattr(self, 'online_interpreter') and isinstance(self.online_interpreter, AbstractDenseTimeOnlineInterpreter):
+            return self.online_interpreter.blocked_counter
+        raise RTAMTException('only dense time online monitors have blocked_counter')
+
+    def set_buffer_limit(self, limit=None, policy=None):
+        if hasattr(self, 'online_interpreter') and isinstance(self.online_interpreter, AbstractDenseTimeOnlineInterpreter):
+            if policy is None:
+                self.online_interpreter.set_buffer_limit(limit)
+            else:
+                self.online_interpreter.set_buffer_limit(limit, policy)
+        else:
+            raise RTAMTException('set_buffer_limit() allowed only for dense time online monitors')
+
+    @property
+    def buffer_high_water(self):
+        if hasattr(self, 'online_interpreter') and isinstance(self.online_interpreter, AbstractDenseTimeOnlineInterpreter):
+            return self.online_interpreter.buffer_high_water
+        raise RTAMTException('only dense time online monitors have buffer_high_water')
+
     @property
     def sampling_tolerance(self):
         if hasattr(self, 'online_interpreter'):
@@ -288,6 +348,7 @@ class AbstractOnlineSpecification(AbstractSpecification):
     # forwarding pastify
     def pastify(self):
         self.ast = self.pastifier.pastify(self.ast)
+        self.ast.share_subformulas()
 
     # forwarding to interpreter
     def update(self, *args, **kwargs):
@@ -297,6 +358,8 @@ class AbstractOnlineSpecification(AbstractSpecification):
 
         #TODO we may make it consistent with interpreter class.
         if isinstance(self.online_interpreter, AbstractDenseTimeOnlineInterpreter):
+            if kwargs.get('early'):
+                raise RTAMTException('early verdicts allowed only for discrete time')
             if len(args) == 0:
                 raise Exception()
             elif len(args) == 1:
@@ -309,7 +372,16 @@ class AbstractOnlineSpecification(AbstractSpecification):
         elif isinstance(self.online_interpreter, AbstractDiscreteTimeOnlineInterpreter):
             i = args[0]
             dataset = args[1]
-            return self.online_interpreter.update(i, dataset)
+            return self.online_interpreter.update(i, dataset, **kwargs)
+
+    def update_batch(self, timestamps, dataset, out=None):
+        if self.set_ast_flag != True:
+            self.online_interpreter.set_ast(self.ast)
+            self.set_ast_flag = True
+
+        if not isinstance(self.online_interpreter, AbstractDiscreteTimeOnlineInterpreter):
+            raise RTAMTException('update_batch() allowed only for discrete time')
+        return self.online_interpreter.update_batch(timestamps, dataset, out)
 
     def final_update(self, *args, **kwargs):
         if self.set_ast_flag != True:
@@ -41,8 +41,15 @@ def StlDenseTimeSpecification(semantics=Semantics.STANDARD, language=Language.PY
 
     return spec
 
-def StlDenseTimeOfflineSpecification():
-    spec = AbstractOfflineSpecification(StlAst(), StlDenseTimeOfflineInterpreter())
+def StlDenseTimeOfflineSpecification(language=Language.PYTHON):
+    if language == Language.PYTHON:
+        interpreter = StlDenseTimeOfflineInterpreter()
+    elif language == Language.NUMPY:
+        from rtamt.semantics.stl.dense_time.offline.vectorized.interpreter import StlDenseTimeOfflineInterpreterNumpy
+        interpreter = StlDenseTimeOfflineInterpreterNumpy()
+    else:
+        raise Exception()
+    spec = AbstractOfflineSpecification(StlAst(), interpreter)
     return spec
 
 def StlDenseTimeOnlineSpecification():
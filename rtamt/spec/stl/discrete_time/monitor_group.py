@@ -0,0 +1,72 @@
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+
+from rtamt.exception.exception import RTAMTException
+
+
+class MonitorGroup(object):
+    """Advances a group of discrete-time online monitors in parallel
+
+        The monitors are split into one chunk per worker thread, and every
+        update advances the chunks in a thread pool. The C++ monitors
+        (StlDiscreteTimeOnlineSpecificationCpp) release the GIL while they
+        evaluate, so they run truly in parallel; the Python monitors are
+        serialized by the GIL. The group works best with update_batch, where
+        the native part of the work dominates.
+
+        Parameters
+        --------------
+        specs : list of specifications
+            parsed (and pastified) discrete-time online specifications
+        workers : int
+            number of worker threads, one per CPU core if None
+    """
+    def __init__(self, specs, workers=None):
+        self.specs = list(specs)
+        if len(self.specs) == 0:
+            raise RTAMTException('A monitor group needs at least one specification')
+        if workers is None:
+            workers = cpu_count()
+        self.pool = ThreadPool(workers)
+        size = (len(self.specs) + workers - 1) // workers
+        self.chunks = [range(i, min(i + size, len(self.specs))) for i in range(0, len(self.specs), size)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def map(self, function):
+        results = self.pool.map(lambda chunk: [function(i) for i in chunk], self.chunks)
+        return [out for chunk in results for out in chunk]
+
+    # timestamp - float
+    # datasets - one dataset (list of [var name, var value] pairs) per spec
+    # returns the robustness of every spec
+    def update(self, timestamp, datasets):
+        self.check(datasets)
+        return self.map(lambda i: self.specs[i].update(timestamp, datasets[i]))
+
+    # timestamps - list or buffer of floats, common to all specs
+    # datasets - one dataset (list of [var name, list or buffer of var values] pairs) per spec
+    # outs - optional list of output buffers, one per spec
+    # returns the robustness of every spec
+    def update_batch(self, timestamps, datasets, outs=None):
+        self.check(datasets)
+        if outs is None:
+            return self.map(lambda i: self.specs[i].update_batch(timestamps, datasets[i]))
+        self.check(outs)
+        return self.map(lambda i: self.specs[i].update_batch(timestamps, datasets[i], outs[i]))
+
+    def reset(self):
+        for spec in self.specs:
+            spec.reset()
+
+    def check(self, items):
+        if len(items) != len(self.specs):
+            raise RTAMTException('Expected {} inputs, one per specification, got {}'.format(len(self.specs), len(items)))
@@ -47,13 +47,26 @@ def StlDiscreteTimeSpecification(semantics=Semantics.STANDARD, language=Language
 
 
 
-def StlDiscreteTimeOfflineSpecification():
-    spec = AbstractOfflineSpecification(StlAst(), StlDiscreteTimeOfflineInterpreter(), explainer=STLExplainer())
+def StlDiscreteTimeOfflineSpecification(language=Language.PYTHON):
+    if language == Language.PYTHON:
+        interpreter = StlDiscreteTimeOfflineInterpreter()
+    elif language == Language.NUMPY:
+        from rtamt.semantics.stl.discrete_time.offline.vectorized.interpreter import StlDiscreteTimeOfflineInterpreterNumpy
+        interpreter = StlDiscreteTimeOfflineInterpreterNumpy()
+    else:
+        raise Exception()
+    spec = AbstractOfflineSpecification(StlAst(), interpreter, explainer=STLExplainer())
     return spec
 
-def StlDiscreteTimeOnlineSpecification():
-    spec = AbstractOnlineSpecification(StlAst(), StlDiscreteTimeOnlineInterpreter(),
-                                       pastifier=StlPastifier())
+def StlDiscreteTimeOnlineSpecification(language=Language.PYTHON):
+    if language == Language.PYTHON:
+        interpreter = StlDiscreteTimeOnlineInterpreter()
+    elif language == Language.NUMPY:
+        from rtamt.semantics.stl.discrete_time.online.vectorized.interpreter import StlDiscreteTimeOnlineInterpreterNumpy
+        interpreter = StlDiscreteTimeOnlineInterpreterNumpy()
+    else:
+        raise Exception()
+    spec = AbstractOnlineSpecification(StlAst(), interpreter, pastifier=StlPastifier())
     return spec
 
 
@@ -1,4 +1,5 @@
 from abc import ABCMeta
+import copy
 import logging
 import importlib
 from antlr4 import *
@@ -6,8 +7,16 @@ from antlr4.InputStream import InputStream
 from antlr4.error.ErrorListener import ErrorListener
 
 from rtamt.syntax.ast.parser.stl.parser_visitor import StlAstParserVisitor
+from rtamt.syntax.ast.parser.ast_cache import ast_cache
+from rtamt.semantics.enumerations.options import ParserType
 from rtamt.exception.exception import RTAMTException
 
+# attributes of the AST that are the outcome of parse
+PARSE_STATE = ('name', 'specs', 'phi_name_to_node_dict', 'var_subspec_dict', 'out_var', 'out_var_field',
+               'vars', 'in_vars', 'out_vars', 'free_vars', 'var_object_dict', 'var_type_dict', 'var_io_dict',
+               'const_type_dict', 'const_val_dict', 'var_topic_dict')
+
+
 class AbstractAst:
     """An abstract class for AST parser
 
@@ -16,6 +25,7 @@ class AbstractAst:
 
         modular_spec : String - specification text
         spec : String - specification text
+        parser_type : ParserType - front end used by parse, the ANTLR parser or the hand-written Pratt parser
 
         vars : set(String) - set of variable names
         free_vars : set(String) - set of free variable names
@@ -31,7 +41,9 @@ class AbstractAst:
         ast : Node - pointer to the specification parse tree
 
     Methods
-        parse - parse the specification
+        parse - parse the specification, or clone it from the ast_cache if it was already parsed
+        share_subformulas - merge structurally identical sub-formulas into a DAG
+        clone - copy the AST, sharing its (immutable) nodes
 
         declare_var - declare variable in spec
         declare_const - declare const variable in spec
@@ -42,13 +54,15 @@ class AbstractAst:
 
     __metaclass__ = ABCMeta
 
-    def __init__(self, antrlLexerType, antrlParserType, parserErrorListenerType = None):
+    def __init__(self, antrlLexerType, antrlParserType, parserErrorListenerType = None, prattParserType = None):
 
         # Class of lexser, parser, paserVisitor
         #TODO we need class check which inherits expected abstract class.
         self.antrlLexerType = antrlLexerType
         self.antrlParserType = antrlParserType
         self.parserErrorListenerType = parserErrorListenerType
+        self.prattParserType = prattParserType
+        self.parser_type = ParserType.ANTLR
 
         # Attributes
         self.name = 'Abstract Specification'
@@ -123,7 +137,29 @@ class AbstractAst:
         
         if entire_spec[-1] != ';':
             entire_spec += ';'
-        
+
+        if ast_cache.enabled:
+            key = ast_cache.key(self, entire_spec)
+            data = ast_cache.get(key)
+            if data is not None:
+                self.set_parse_state(ast_cache.loads(data))
+                return
+
+        if self.parser_type == ParserType.PRATT:
+            if self.prattParserType is None:
+                raise RTAMTException('{} has no Pratt parser'.format(self.__class__.__name__))
+            self.prattParserType(self).parse(entire_spec)
+        else:
+            self.parse_antlr(entire_spec)
+        self.share_subformulas()
+
+        if ast_cache.enabled:
+            data = ast_cache.dumps(self.get_parse_state())
+            if data is not None:
+                ast_cache.put(key, data)
+        return
+
+    def parse_antlr(self, entire_spec):
         input_stream = InputStream(entire_spec)
         lexer = self.antrlLexerType(input_stream)
         if not isinstance(lexer, Lexer):
@@ -140,6 +176,62 @@ class AbstractAst:
         self.visit(ctx.specification())
         return
 
+    def clone(self):
+        ast = copy.copy(self)
+
+        # the nodes are shared, the containers and the variable values are private
+        ast.specs = list(self.specs)
+        ast.phi_name_to_node_dict = dict(self.phi_name_to_node_dict)
+        ast.var_subspec_dict = dict(self.var_subspec_dict)
+        ast.vars = set(self.vars)
+        ast.in_vars = set(self.in_vars)
+        ast.out_vars = set(self.out_vars)
+        ast.free_vars = set(self.free_vars)
+        ast.var_object_dict = copy.deepcopy(self.var_object_dict)
+        ast.var_type_dict = dict(self.var_type_dict)
+        ast.var_io_dict = dict(self.var_io_dict)
+        ast.const_type_dict = dict(self.const_type_dict)
+        ast.const_val_dict = dict(self.const_val_dict)
+        ast.var_topic_dict = dict(self.var_topic_dict)
+        ast.modules = dict(self.modules)
+        ast.results = dict()
+        return ast
+
+    def get_parse_state(self):
+        state = dict((attr, getattr(self, attr)) for attr in PARSE_STATE)
+        # modules are not picklable, they are imported again by name
+        state['modules'] = dict((name, module.__name__) for name, module in self.modules.items())
+        return state
+
+    def set_parse_state(self, state):
+        for attr in PARSE_STATE:
+            setattr(self, attr, state[attr])
+        for name, module_name in state['modules'].items():
+            self.import_module(module_name, name)
+
+    def share_subformulas(self):
+        # The name of a node is its sub-formula text, hence two nodes with the same
+        # name are structurally identical. Every occurrence is replaced by a single
+        # canonical node, so that specs and sub-specs form a DAG in which each
+        # sub-formula is evaluated once.
+        canonical = dict()
+
+        def share(node):
+            try:
+                return canonical[node.name]
+            except KeyError:
+                pass
+            node.children = [share(child) for child in node.children]
+            canonical[node.name] = node
+            return node
+
+        self.specs = [share(spec) for spec in self.specs]
+        for key in self.var_subspec_dict:
+            self.var_subspec_dict[key] = share(self.var_subspec_dict[key])
+        for key in self.phi_name_to_node_dict:
+            self.phi_name_to_node_dict[key] = share(self.phi_name_to_node_dict[key])
+        return
+
     @property
     def out_var(self):
         return self.__out_var
@@ -307,7 +399,7 @@ class AbstractAst:
 
 def ast_factory(AstParserVisitor):
     class Ast(AbstractAst, AstParserVisitor):
-        def __init__(self, antrlLexerType, antrlParserType, parserErrorListenerType=None):
-            AbstractAst.__init__(self, antrlLexerType, antrlParserType, parserErrorListenerType)
+        def __init__(self, antrlLexerType, antrlParserType, parserErrorListenerType=None, prattParserType=None):
+            AbstractAst.__init__(self, antrlLexerType, antrlParserType, parserErrorListenerType, prattParserType)
             AstParserVisitor.__init__(self)
     return Ast
\ No newline at end of file
@@ -0,0 +1,109 @@
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+
+
+class AstCache(object):
+    """A process-wide cache of parsed specifications
+
+    Attributes:
+        enabled : bool - the cache is used by AbstractAst.parse only if enabled
+        path : String - optional directory in which the entries are also pickled,
+            so that they survive the process. The entries are unpickled when read,
+            so the directory must be trusted: a crafted entry runs arbitrary code
+        max_entries : int - the least recently used in-memory entries are removed
+            beyond max_entries, None for no limit
+        entries : OrderedDict(String, bytes) - dictionary that maps keys to pickled parse states
+
+    Methods
+        key - compute the key of a specification text and the declarations of an AST
+        get - fetch a pickled parse state, None if missing
+        put - store a pickled parse state
+        clear - remove all the in-memory entries
+
+    """
+
+    def __init__(self, path=None, max_entries=256):
+        self.enabled = True
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def key(self, ast, spec):
+        # the exact text, a newline ends a comment
+        content = (
+            type(ast).__module__, type(ast).__name__,
+            ast.antrlLexerType.__module__, ast.antrlLexerType.__name__,
+            ast.antrlParserType.__module__, ast.antrlParserType.__name__,
+            str(ast.parser_type),
+            spec,
+            ast.name, ast.out_var, ast.out_var_field,
+            sorted(ast.vars), sorted(ast.free_vars), sorted(ast.in_vars), sorted(ast.out_vars),
+            sorted(ast.var_type_dict.items()), sorted(ast.var_io_dict.items()),
+            sorted(ast.const_type_dict.items()), sorted(ast.const_val_dict.items()),
+            sorted(ast.var_topic_dict.items()), sorted(ast.var_subspec_dict),
+            sorted((name, module.__name__) for name, module in ast.modules.items()),
+            [spec.name for spec in ast.specs],
+            ast.unit, ast.sampling_period, ast.sampling_period_unit
+        )
+        return hashlib.sha256(repr(content).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        try:
+            data = self.entries.pop(key)
+        except KeyError:
+            pass
+        else:
+            self.entries[key] = data
+            return data
+
+        if self.path is None:
+            return None
+
+        try:
+            with open(os.path.join(self.path, key + '.pickle'), 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+
+        self.store(key, data)
+        return data
+
+    def put(self, key, data):
+        self.store(key, data)
+
+        if self.path is not None:
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path)
+            # write to a temporary file first, so that concurrent readers never see a partial entry
+            file_name = os.path.join(self.path, key + '.pickle')
+            tmp_file_name = file_name + '.' + str(os.getpid())
+            with open(tmp_file_name, 'wb') as f:
+                f.write(data)
+            os.rename(tmp_file_name, file_name)
+
+    def store(self, key, data):
+        self.entries.pop(key, None)
+        self.entries[key] = data
+        if self.max_entries is not None:
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries = OrderedDict()
+
+    @staticmethod
+    def dumps(state):
+        try:
+            return pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. variables of a type defined locally, they are parsed every time
+            return None
+
+    @staticmethod
+    def loads(data):
+        return pickle.loads(data)
+
+
+ast_cache = AstCache()
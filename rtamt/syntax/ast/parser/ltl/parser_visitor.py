@@ -54,8 +54,9 @@ class LtlAstParserVisitor(LtlParserVisitor):
         return node
 
     def visitExprId(self, ctx):
-        id = ctx.Identifier().getText();
+        return self.id_to_node(ctx.Identifier().getText())
 
+    def id_to_node(self, id):
         # Identifier is a constant
         if id in self.const_val_dict:
             val = self.const_val_dict[id]
@@ -350,13 +351,18 @@ class LtlAstParserVisitor(LtlParserVisitor):
 
     def visitAssertion(self, ctx):
         out = self.visit(ctx.expression())
+        if not ctx.Identifier():
+            self.add_assertion(None, out)
+        else:
+            self.add_assertion(ctx.Identifier().getText(), out)
+        return
 
+    # id - name of the assigned variable, None for an implicit out
+    def add_assertion(self, id, out):
         implicit = False
-        if not ctx.Identifier():
+        if id is None:
             id = 'out'
             implicit = True
-        else:
-            id = ctx.Identifier().getText()
         self.phi_name_to_node_dict[id] = out
 
         self.var_subspec_dict[id] = out
@@ -403,11 +409,14 @@ class LtlAstParserVisitor(LtlParserVisitor):
 
     def visitSpecification(self, ctx):
         self.visitChildren(ctx)
+        self.end_specification()
+        return
+
+    def end_specification(self):
         try:
             del self.var_subspec_dict[self.out_var + self.out_var_field]
         except KeyError:
             pass
-        return
 
     def visitSpecificationId(self, ctx):
         self.visitChildren(ctx)
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+import re
+
+from rtamt.syntax.node.ltl.predicate import Predicate
+from rtamt.syntax.node.ltl.previous import Previous
+from rtamt.syntax.node.ltl.next import Next
+from rtamt.syntax.node.ltl.neg import Neg
+from rtamt.syntax.node.ltl.until import Until
+from rtamt.syntax.node.ltl.conjunction import Conjunction
+from rtamt.syntax.node.ltl.disjunction import Disjunction
+from rtamt.syntax.node.ltl.implies import Implies
+from rtamt.syntax.node.ltl.iff import Iff
+from rtamt.syntax.node.ltl.strong_next import StrongNext
+from rtamt.syntax.node.ltl.strong_previous import StrongPrevious
+from rtamt.syntax.node.ltl.xor import Xor
+from rtamt.syntax.node.ltl.always import Always
+from rtamt.syntax.node.ltl.eventually import Eventually
+from rtamt.syntax.node.ltl.once import Once
+from rtamt.syntax.node.ltl.historically import Historically
+from rtamt.syntax.node.ltl.since import Since
+from rtamt.syntax.node.arithmetic.abs import Abs
+from rtamt.syntax.node.arithmetic.sqrt import Sqrt
+from rtamt.syntax.node.arithmetic.exp import Exp
+from rtamt.syntax.node.arithmetic.pow import Pow
+from rtamt.syntax.node.arithmetic.log import Log
+from rtamt.syntax.node.arithmetic.ln import Ln
+from rtamt.syntax.node.arithmetic.addition import Addition
+from rtamt.syntax.node.arithmetic.subtraction import Subtraction
+from rtamt.syntax.node.arithmetic.negate import Negate
+from rtamt.syntax.node.arithmetic.multiplication import Multiplication
+from rtamt.syntax.node.arithmetic.division import Division
+from rtamt.syntax.node.ltl.fall import Fall
+from rtamt.syntax.node.ltl.rise import Rise
+from rtamt.syntax.node.ltl.constant import Constant
+from rtamt.syntax.node.ltl.variable import Variable
+
+from rtamt.exception.exception import RTAMTException
+
+# Tokens of rtamt/antlr/grammar/tl/LtlLexer.g4. Every match skips the whitespace
+# and comments before one token. Identifiers, integer and real literals are
+# matched first and keywords are the identifiers listed in KEYWORDS, which gives
+# the longest match of the ANTLR lexer.
+DIGITS = r'[0-9](?:[0-9_]*[0-9])?'
+EXPONENT = r'[eE][+-]?[0-9]+'
+TOKEN = re.compile(r'''
+    (?:[ \t\r\n\f]+|/\*.*?\*/|//[^\r\n]*)*
+    (?:(?P<Identifier>[A-Za-z_$][A-Za-z_$0-9./]*)
+    |(?P<RealLiteral>{digits}\.(?:{digits})?(?:{exponent})?|\.{digits}(?:{exponent})?|{digits}{exponent})
+    |(?P<IntegerLiteral>0[xX][0-9a-fA-F](?:[0-9a-fA-F_]*[0-9a-fA-F])?|0[bB][01](?:[01_]*[01])?|0|[1-9](?:[0-9_]*[0-9])?)
+    |(?P<operator><->|->|<=|>=|!==|==|[-+*/()\[\]{{}};:,.@<>=!|&])
+    |(?P<EOF>\Z)
+    |(?P<error>.))
+'''.format(digits=DIGITS, exponent=EXPONENT), re.VERBOSE | re.DOTALL)
+
+KEYWORDS = {
+    'abs': 'ABS', 'sqrt': 'SQRT', 'exp': 'EXP', 'pow': 'POW', 'log': 'LOG', 'ln': 'LN',
+    's': 'SEC', 'ms': 'MSEC', 'us': 'USEC', 'ns': 'NSEC', 'ps': 'PSEC',
+    'topic': 'ROS_Topic', 'import': 'Import', 'input': 'Input', 'output': 'Output', 'internal': 'Internal',
+    'const': 'Constant', 'real': 'DomainTypeReal', 'float': 'DomainTypeFloat', 'long': 'DomainTypeLong',
+    'complex': 'DomainTypeComplex', 'int': 'DomainTypeInt', 'bool': 'DomainTypeBool',
+    'assertion': 'Assertion', 'specification': 'Specification', 'from': 'From',
+    'not': 'NotOperator', 'or': 'OrOperator', 'and': 'AndOperator', 'iff': 'IffOperator',
+    'implies': 'ImpliesOperator', 'xor': 'XorOperator', 'rise': 'RiseOperator', 'fall': 'FallOperator',
+    'always': 'AlwaysOperator', 'G': 'AlwaysOperator', 'eventually': 'EventuallyOperator', 'F': 'EventuallyOperator',
+    'until': 'UntilOperator', 'U': 'UntilOperator', 'unless': 'UnlessOperator', 'W': 'UnlessOperator',
+    'historically': 'HistoricallyOperator', 'H': 'HistoricallyOperator', 'once': 'OnceOperator', 'O': 'OnceOperator',
+    'since': 'SinceOperator', 'S': 'SinceOperator', 'next': 'NextOperator', 'X': 'NextOperator',
+    'prev': 'PreviousOperator', 'Y': 'PreviousOperator', 's_next': 'StrongNextOperator', 'sX': 'StrongNextOperator',
+    's_prev': 'StrongPreviousOperator', 'sY': 'StrongPreviousOperator',
+    'true': 'BooleanLiteral', 'TRUE': 'BooleanLiteral', 'false': 'BooleanLiteral', 'FALSE': 'BooleanLiteral'
+}
+
+OPERATORS = {
+    '-': 'MINUS', '+': 'PLUS', '*': 'TIMES', '/': 'DIVIDE', '(': 'LPAREN', ')': 'RPAREN', '{': 'LBRACE',
+    '}': 'RBRACE', '[': 'LBRACK', ']': 'RBRACK', ';': 'SEMICOLON', ':': 'COLON', ',': 'COMMA', '.': 'DOT',
+    '@': 'AT', '!': 'NotOperator', '|': 'OrOperator', '&': 'AndOperator', '<->': 'IffOperator',
+    '->': 'ImpliesOperator', '==': 'EqualOperator', '!==': 'NotEqualOperator', '>=': 'GreaterOrEqualOperator',
+    '<=': 'LesserOrEqualOperator', '>': 'GreaterOperator', '<': 'LesserOperator', '=': 'EQUAL'
+}
+
+# Precedence of the binary operators in the ANTLR expression rule, the
+# right operand of an operator of precedence p is parsed at precedence p + 1
+INFIX_PRECEDENCE = {
+    'TIMES': 24, 'DIVIDE': 24,
+    'PLUS': 23, 'MINUS': 23,
+    'LesserOrEqualOperator': 22, 'GreaterOrEqualOperator': 22, 'LesserOperator': 22, 'GreaterOperator': 22,
+    'EqualOperator': 22, 'NotEqualOperator': 22,
+    'UntilOperator': 12, 'UnlessOperator': 11, 'SinceOperator': 10,
+    'AndOperator': 9, 'OrOperator': 8, 'ImpliesOperator': 7, 'IffOperator': 6, 'XorOperator': 5
+}
+
+# Precedence at which the operand of a prefix operator is parsed
+PREFIX_PRECEDENCE = {
+    'MINUS': 31, 'NotOperator': 21,
+    'AlwaysOperator': 20, 'EventuallyOperator': 19, 'HistoricallyOperator': 18, 'OnceOperator': 17,
+    'PreviousOperator': 16, 'NextOperator': 15, 'StrongPreviousOperator': 14, 'StrongNextOperator': 13
+}
+
+DOMAIN_TYPES = ('DomainTypeFloat', 'DomainTypeInt', 'DomainTypeLong', 'DomainTypeComplex', 'Identifier')
+
+
+def tokenize(text):
+    """Splits text into a list of (type, text, position) tokens ending with an EOF token"""
+    tokens = []
+    append = tokens.append
+    keywords = KEYWORDS
+    for m in TOKEN.finditer(text):
+        kind = m.lastgroup
+        if kind == 'Identifier':
+            value = m.group(kind)
+            append((keywords.get(value, kind), value, m.start(kind)))
+        elif kind == 'operator':
+            value = m.group(kind)
+            append((OPERATORS[value], value, m.start(kind)))
+        elif kind == 'EOF':
+            append((kind, '<EOF>', len(text)))
+            break
+        elif kind == 'error':
+            line, column = position(text, m.start(kind))
+            raise RTAMTException('{}:{}: Syntax ERROR, token recognition error at: \'{}\''.format(line, column, m.group(kind)))
+        else:
+            append((kind, m.group(kind), m.start(kind)))
+    return tokens
+
+
+def position(text, pos):
+    """line (from 1) and column (from 0) of the character at pos"""
+    line = text.count('\n', 0, pos) + 1
+    column = pos - (text.rfind('\n', 0, pos) + 1)
+    return line, column
+
+
+class LtlPrattParser(object):
+    """Hand-written parser for the LTL grammar of rtamt/antlr/grammar/tl
+
+        A recursive-descent parser for the specification, declarations and
+        assertions, and a Pratt (precedence climbing) parser for expressions,
+        with the operator precedence of the ANTLR expression rule. It builds
+        the same nodes as LtlAstParserVisitor, directly into the ast, without
+        the ANTLR runtime and parse tree.
+
+        Attributes
+        --------------
+        ast : AbstractAst
+            the ast filled by parse
+        tokens : list of (type, text, position)
+        pos : int
+            index of the next token
+        deferred_error : Exception
+            the first error of the ast helpers, raised once the whole text is parsed
+        """
+    def __init__(self, ast):
+        self.ast = ast
+        self.prefix = {
+            'LPAREN': self.paren,
+            'MINUS': self.negate,
+            'ABS': self.function, 'SQRT': self.function, 'EXP': self.function, 'LN': self.function,
+            'RiseOperator': self.function, 'FallOperator': self.function,
+            'POW': self.binary_function, 'LOG': self.binary_function,
+            'NotOperator': self.unary,
+            'AlwaysOperator': self.temporal, 'EventuallyOperator': self.temporal,
+            'HistoricallyOperator': self.temporal, 'OnceOperator': self.temporal,
+            'PreviousOperator': self.unary, 'NextOperator': self.unary,
+            'StrongPreviousOperator': self.unary, 'StrongNextOperator': self.unary,
+            'Identifier': self.identifier,
+            'IntegerLiteral': self.literal, 'RealLiteral': self.literal
+        }
+        self.functions = {
+            'ABS': Abs, 'SQRT': Sqrt, 'EXP': Exp, 'LN': Ln, 'RiseOperator': Rise, 'FallOperator': Fall,
+            'POW': Pow, 'LOG': Log, 'NotOperator': Neg, 'PreviousOperator': Previous, 'NextOperator': Next,
+            'StrongPreviousOperator': StrongPrevious, 'StrongNextOperator': StrongNext,
+            'AlwaysOperator': Always, 'EventuallyOperator': Eventually,
+            'HistoricallyOperator': Historically, 'OnceOperator': Once,
+            'TIMES': Multiplication, 'DIVIDE': Division, 'PLUS': Addition, 'MINUS': Subtraction,
+            'AndOperator': Conjunction, 'OrOperator': Disjunction, 'ImpliesOperator': Implies,
+            'IffOperator': Iff, 'XorOperator': Xor
+        }
+        self.infix = {
+            'UntilOperator': self.until, 'UnlessOperator': self.unless, 'SinceOperator': self.since
+        }
+        for op_type in ('LesserOrEqualOperator', 'GreaterOrEqualOperator', 'LesserOperator', 'GreaterOperator',
+                        'EqualOperator', 'NotEqualOperator'):
+            self.infix[op_type] = self.predicate
+        for op_type in ('TIMES', 'DIVIDE', 'PLUS', 'MINUS', 'AndOperator', 'OrOperator', 'ImpliesOperator',
+                        'IffOperator', 'XorOperator'):
+            self.infix[op_type] = self.binary
+
+    def parse(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+        self.deferred_error = None
+        self.specification()
+
+    # Helpers
+
+    def peek(self, offset=0):
+        if offset == 0:
+            return self.tokens[self.pos][0]
+        return self.tokens[min(self.pos + offset, len(self.tokens) - 1)][0]
+
+    def next(self):
+        token = self.tokens[self.pos]
+        if token[0] != 'EOF':
+            self.pos = self.pos + 1
+        return token
+
+    def expect(self, token_type):
+        token = self.tokens[self.pos]
+        if token[0] != token_type:
+            self.error(token, 'expecting {}'.format(token_type))
+        self.pos = self.pos + 1
+        return token[1]
+
+    def error(self, token, expected=None):
+        line, column = position(self.text, token[2])
+        msg = '{}:{}: Syntax ERROR, {} input \'{}\''.format(line, column, 'mismatched' if expected else 'extraneous',
+                                                           token[1])
+        if expected:
+            msg = msg + ' ' + expected
+        raise RTAMTException(msg)
+
+    def defer(self, default, function, *args):
+        # ANTLR reports the syntax errors of the whole text before the visitor resolves
+        # the identifiers, the errors of the ast helpers are raised at the end of the text
+        try:
+            return function(*args)
+        except Exception as err:
+            if self.deferred_error is None:
+                self.deferred_error = err
+            return default
+
+    def add(self, node):
+        self.ast.phi_name_to_node_dict[node.name] = node
+        return node
+
+    # Specification
+
+    def specification(self):
+        ast = self.ast
+        if self.peek() == 'Specification':
+            self.next()
+            ast.name = self.expect('Identifier')
+
+        while self.peek() == 'From':
+            self.next()
+            module_name = self.expect('Identifier')
+            self.expect('Import')
+            var_type = self.expect('Identifier')
+            ast.import_module(module_name, var_type)
+
+        while True:
+            token_type = self.peek()
+            if token_type == 'AT':
+                self.annotation()
+            elif token_type == 'Constant':
+                self.constant_declaration()
+            elif token_type in ('Input', 'Output') or token_type in DOMAIN_TYPES and (
+                    token_type != 'Identifier' or self.peek(1) == 'Identifier'):
+                self.variable_declaration()
+            else:
+                break
+
+        self.assertion()
+        while self.peek() != 'EOF':
+            self.assertion()
+        if self.deferred_error is not None:
+            raise self.deferred_error
+        ast.end_specification()
+
+    def annotation(self):
+        self.expect('AT')
+        self.expect('ROS_Topic')
+        self.expect('LPAREN')
+        var_name = self.expect('Identifier')
+        self.expect('COMMA')
+        topic_name = self.expect('Identifier')
+        self.expect('RPAREN')
+        self.ast.set_var_topic(var_name, topic_name)
+
+    def domain_type(self):
+        token = self.next()
+        if token[0] not in DOMAIN_TYPES:
+            self.error(token, 'expecting a domain type')
+        return token[1]
+
+    def variable_declaration(self):
+        var_iotype = None
+        if self.peek() in ('Input', 'Output'):
+            var_iotype = self.next()[1]
+        var_type = self.domain_type()
+        var_name = self.expect('Identifier')
+
+        self.ast.declare_var(var_name, var_type)
+        self.ast.var_io_dict[var_name] = 'output'
+        if var_iotype is not None:
+            self.ast.set_var_io_type(var_name, var_iotype)
+
+        if self.peek() == 'EQUAL':
+            self.next()
+            # a lone literal is not an expression (AsgnLiteral)
+            if self.peek() in ('IntegerLiteral', 'RealLiteral') and self.peek(1) not in INFIX_PRECEDENCE:
+                self.next()
+            else:
+                self.expression()
+
+    def constant_declaration(self):
+        self.expect('Constant')
+        const_type = self.domain_type()
+        const_name = self.expect('Identifier')
+        self.expect('EQUAL')
+        token = self.next()
+        if token[0] not in ('IntegerLiteral', 'RealLiteral'):
+            self.error(token, 'expecting a literal')
+        self.ast.declare_const(const_name, const_type, token[1])
+
+    def assertion(self):
+        id = None
+        if self.peek() == 'Identifier' and self.peek(1) == 'EQUAL':
+            id = self.next()[1]
+            self.next()
+        out = self.expression()
+        self.expect('SEMICOLON')
+        self.ast.add_assertion(id, out)
+
+    # Expressions
+
+    def expression(self, precedence=0):
+        token = self.next()
+        try:
+            prefix = self.prefix[token[0]]
+        except KeyError:
+            self.error(token, 'expecting an expression')
+        left = prefix(token)
+
+        tokens = self.tokens
+        while True:
+            token = tokens[self.pos]
+            token_precedence = INFIX_PRECEDENCE.get(token[0])
+            if token_precedence is None or token_precedence < precedence:
+                return left
+            self.pos = self.pos + 1
+            left = self.infix[token[0]](token, left, token_precedence + 1)
+
+    def paren(self, token):
+        node = self.expression()
+        self.expect('RPAREN')
+        return node
+
+    def negate(self, token):
+        return self.add(Negate(self.expression(PREFIX_PRECEDENCE['MINUS'])))
+
+    def function(self, token):
+        self.expect('LPAREN')
+        child = self.expression()
+        self.expect('RPAREN')
+        return self.add(self.functions[token[0]](child))
+
+    def binary_function(self, token):
+        self.expect('LPAREN')
+        child1 = self.expression()
+        self.expect('COMMA')
+        child2 = self.expression()
+        self.expect('RPAREN')
+        return self.add(self.functions[token[0]](child1, child2))
+
+    def unary(self, token):
+        child = self.expression(PREFIX_PRECEDENCE[token[0]])
+        return self.add(self.functions[token[0]](child))
+
+    def temporal(self, token):
+        return self.unary(token)
+
+    def identifier(self, token):
+        return self.defer(Variable(token[1], '', 'output'), self.ast.id_to_node, token[1])
+
+    def literal(self, token):
+        return self.add(Constant(float(token[1])))
+
+    def binary(self, token, left, precedence):
+        right = self.expression(precedence)
+        return self.add(self.functions[token[0]](left, right))
+
+    def predicate(self, token, left, precedence):
+        right = self.expression(precedence)
+        return self.add(Predicate(left, right, self.ast.str_to_op_type(token[1])))
+
+    def until(self, token, left, precedence):
+        right = self.expression(precedence)
+        return self.add(Until(left, right))
+
+    def unless(self, token, left, precedence):
+        right = self.expression(precedence)
+        return self.add(Disjunction(Always(left), Until(left, right)))
+
+    def since(self, token, left, precedence):
+        right = self.expression(precedence)
+        return self.add(Since(left, right))
@@ -4,6 +4,7 @@ from rtamt.antlr.parser.ltl.LtlLexer import LtlLexer
 from rtamt.antlr.parser.ltl.LtlParser import LtlParser
 from rtamt.antlr.parser.ltl.error.parser_error_listener import LTLParserErrorListener
 from rtamt.syntax.ast.parser.ltl.parser_visitor import LtlAstParserVisitor
+from rtamt.syntax.ast.parser.ltl.pratt_parser import LtlPrattParser
 from rtamt.syntax.ast.parser.abstract_ast_parser import ast_factory
 
 
@@ -12,5 +13,5 @@ def LtlAst():
     antrlLexerType = globals()['LtlLexer']
     antrlParserType = globals()['LtlParser']
     parserErrorListenerType = globals()['LTLParserErrorListener']   #optional
-    ltLAst = ast_factory(LtlAstParserVisitor)(antrlLexerType, antrlParserType, parserErrorListenerType)
+    ltLAst = ast_factory(LtlAstParserVisitor)(antrlLexerType, antrlParserType, parserErrorListenerType, LtlPrattParser)
     return ltLAst
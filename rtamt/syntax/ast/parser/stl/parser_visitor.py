@@ -111,6 +111,14 @@ class StlAstParserVisitor(LtlAstParserVisitor, StlParserVisitor):
     def visitConstantTimeLiteral(self, ctx):
         const_name = ctx.Identifier().getText()
 
+        if ctx.unit() is None:
+            unit = 'default'
+        else:
+            unit = ctx.unit().getText()
+
+        return self.const_time_bound(const_name, unit)
+
+    def const_time_bound(self, const_name, unit):
         if const_name not in self.const_val_dict:
             raise RTAMTException('Bound {} not declared'.format(const_name))
 
@@ -118,11 +126,6 @@ class StlAstParserVisitor(LtlAstParserVisitor, StlParserVisitor):
 
         out = Fraction(Decimal(val))
 
-        if ctx.unit() is None:
-            unit = 'default'
-        else:
-            unit = ctx.unit().getText()
-
         return out, unit
 
 
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from decimal import Decimal
+from fractions import Fraction
+
+from rtamt.syntax.ast.parser.ltl.pratt_parser import LtlPrattParser, PREFIX_PRECEDENCE
+from rtamt.semantics.interval.interval import Interval
+
+from rtamt.syntax.node.ltl.disjunction import Disjunction
+from rtamt.syntax.node.ltl.always import Always
+from rtamt.syntax.node.ltl.until import Until
+from rtamt.syntax.node.ltl.since import Since
+from rtamt.syntax.node.stl.timed_always import TimedAlways
+from rtamt.syntax.node.stl.timed_eventually import TimedEventually
+from rtamt.syntax.node.stl.timed_historically import TimedHistorically
+from rtamt.syntax.node.stl.timed_once import TimedOnce
+from rtamt.syntax.node.stl.timed_since import TimedSince
+from rtamt.syntax.node.stl.timed_until import TimedUntil
+
+UNITS = ('SEC', 'MSEC', 'USEC', 'NSEC')
+
+
+class StlPrattParser(LtlPrattParser):
+    """Hand-written parser for the STL grammar, the LTL grammar with optional
+        intervals after the temporal operators, builds the nodes of StlAstParserVisitor"""
+    def __init__(self, ast):
+        super(StlPrattParser, self).__init__(ast)
+        self.timed_functions = {
+            'AlwaysOperator': TimedAlways, 'EventuallyOperator': TimedEventually,
+            'HistoricallyOperator': TimedHistorically, 'OnceOperator': TimedOnce
+        }
+
+    def interval(self):
+        if self.tokens[self.pos][0] != 'LBRACK':
+            return None
+        self.pos = self.pos + 1
+        begin, begin_unit = self.interval_time()
+        token = self.next()
+        if token[0] not in ('COLON', 'COMMA'):
+            self.error(token, 'expecting {\':\', \',\'}')
+        end, end_unit = self.interval_time()
+        self.expect('RBRACK')
+        return Interval(begin, end, begin_unit, end_unit)
+
+    def interval_time(self):
+        token = self.next()
+        unit = None
+        if self.peek() in UNITS:
+            unit = self.next()[1]
+        if token[0] in ('IntegerLiteral', 'RealLiteral'):
+            return Fraction(Decimal(token[1])), '' if unit is None else unit
+        elif token[0] == 'Identifier':
+            return self.defer((Fraction(0), ''), self.ast.const_time_bound, token[1], 'default' if unit is None else unit)
+        self.error(token, 'expecting a time bound')
+
+    def temporal(self, token):
+        interval = self.interval()
+        if interval is None:
+            return super(StlPrattParser, self).temporal(token)
+        child = self.expression(PREFIX_PRECEDENCE[token[0]])
+        return self.add(self.timed_functions[token[0]](child, interval))
+
+    def until(self, token, left, precedence):
+        interval = self.interval()
+        right = self.expression(precedence)
+        if interval is None:
+            return self.add(Until(left, right))
+        return self.add(TimedUntil(left, right, interval))
+
+    def unless(self, token, left, precedence):
+        interval = self.interval()
+        right = self.expression(precedence)
+        if interval is None:
+            return self.add(Disjunction(Always(left), Until(left, right)))
+        interval_left = Interval(0, interval.end, interval.begin_unit, interval.end_unit)
+        return self.add(Disjunction(TimedAlways(left, interval_left), TimedUntil(left, right, interval)))
+
+    def since(self, token, left, precedence):
+        interval = self.interval()
+        right = self.expression(precedence)
+        if interval is None:
+            return self.add(Since(left, right))
+        return self.add(TimedSince(left, right, interval))
@@ -4,11 +4,12 @@ from rtamt.antlr.parser.stl.LtlLexer import LtlLexer
 from rtamt.antlr.parser.stl.StlParser import StlParser
 from rtamt.syntax.ast.parser.abstract_ast_parser import ast_factory
 from rtamt.antlr.parser.stl.error.parser_error_listener import STLParserErrorListener
+from rtamt.syntax.ast.parser.stl.pratt_parser import StlPrattParser
 
 
 def StlAst():
     antrlLexerType = globals()['LtlLexer']
     antrlParserType = globals()['StlParser']
     parserErrorListenerType = globals()['STLParserErrorListener']   #optional
-    stlAst = ast_factory(StlAstParserVisitor)(antrlLexerType, antrlParserType, parserErrorListenerType)
+    stlAst = ast_factory(StlAstParserVisitor)(antrlLexerType, antrlParserType, parserErrorListenerType, StlPrattParser)
     return stlAst
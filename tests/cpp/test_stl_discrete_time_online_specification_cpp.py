@@ -1,5 +1,6 @@
 import unittest
 import math
+import array
 import rtamt
 
 class TestStlDenseTimeOnlineSpecificationCpp(unittest.TestCase):
@@ -457,7 +458,19 @@ class TestStlDenseTimeOnlineSpecificationCpp(unittest.TestCase):
 
         spec.parse()
 
-        self.assertRaises(rtamt.RTAMTException, spec.update, 0, [('req', self.left1)])
+        # the verdict for sample i is emitted at sample i + 1, as after pastification
+        out1 = spec.update(0, [('req', self.left1)])
+        out2 = spec.update(1, [('req', self.left2)])
+        out3 = spec.update(2, [('req', self.left3)])
+        out4 = spec.update(3, [('req', self.left4)])
+        out5 = spec.update(4, [('req', self.left5)])
+
+        self.assertEqual(spec.online_interpreter.latency, 1, "latency")
+        self.assertEqual(out1, 100, "input 1")
+        self.assertEqual(out2, 100, "input 2")
+        self.assertEqual(out3, -1, "input 3")
+        self.assertEqual(out4, 5, "input 4")
+        self.assertEqual(out5, 5, "input 5")
 
     def test_eventually_0_1_with_pastify(self):
         spec = rtamt.StlDiscreteTimeOnlineSpecificationCpp()
@@ -528,7 +541,19 @@ class TestStlDenseTimeOnlineSpecificationCpp(unittest.TestCase):
 
         spec.parse()
 
-        self.assertRaises(rtamt.RTAMTException, spec.update, 0, [('req', self.left1)])
+        # the verdict for sample i is emitted at sample i + 1, as after pastification
+        out1 = spec.update(0, [('req', self.left1)])
+        out2 = spec.update(1, [('req', self.left2)])
+        out3 = spec.update(2, [('req', self.left3)])
+        out4 = spec.update(3, [('req', self.left4)])
+        out5 = spec.update(4, [('req', self.left5)])
+
+        self.assertEqual(spec.online_interpreter.latency, 1, "latency")
+        self.assertEqual(out1, 100, "input 1")
+        self.assertEqual(out2, -1, "input 2")
+        self.assertEqual(out3, -2, "input 3")
+        self.assertEqual(out4, -2, "input 4")
+        self.assertEqual(out5, -1, "input 5")
 
     def test_always_0_1_with_pastify(self):
         spec = rtamt.StlDiscreteTimeOnlineSpecificationCpp()
@@ -600,7 +625,18 @@ class TestStlDenseTimeOnlineSpecificationCpp(unittest.TestCase):
 
         spec.parse()
 
-        self.assertRaises(rtamt.RTAMTException, spec.update, 0, [('req', self.left1), ('gnt', self.right1)])
+        out1 = spec.update(0, [('req', self.left1), ('gnt', self.right1)])
+        out2 = spec.update(1, [('req', self.left2), ('gnt', self.right2)])
+        out3 = spec.update(2, [('req', self.left3), ('gnt', self.right3)])
+        out4 = spec.update(3, [('req', self.left4), ('gnt', self.right4)])
+        out5 = spec.update(4, [('req', self.left5), ('gnt', self.right5)])
+
+        self.assertEqual(spec.online_interpreter.latency, 1, "latency")
+        self.assertEqual(out1, 20, "input 1")
+        self.assertEqual(out2, 20, "input 2")
+        self.assertEqual(out3, -1, "input 3")
+        self.assertEqual(out4, 10, "input 4")
+        self.assertEqual(out5, 4, "input 5")
 
     def test_until_1_2_with_pastify(self):
         spec = rtamt.StlDiscreteTimeOnlineSpecificationCpp()
@@ -832,5 +868,114 @@ class TestStlDenseTimeOnlineSpecificationCpp(unittest.TestCase):
         self.assertEqual(out4, 1, "input 4")
         self.assertEqual(out5, 0, "input 5")
 
+    def test_native_monitor(self):
+        spec_text = 'out = ((req >= 3) implies once[1:3](gnt >= 3)) and historically[0:2](req + gnt > -5)'
+        specs = [rtamt.StlDiscreteTimeOnlineSpecification(), rtamt.StlDiscreteTimeOnlineSpecificationCpp()]
+        for spec in specs:
+            spec.declare_var('req', 'float')
+            spec.declare_var('gnt', 'float')
+            spec.declare_var('out', 'float')
+            spec.spec = spec_text
+            spec.parse()
+            spec.pastify()
+
+        for i, (req, gnt) in enumerate([(self.left1, self.right1), (self.left2, self.right2),
+                                        (self.left3, self.right3), (self.left4, self.right4),
+                                        (self.left5, self.right5)]):
+            expected = specs[0].update(i, [('req', req), ('gnt', gnt)])
+            out = specs[1].update(i, [('req', req), ('gnt', gnt)])
+            self.assertEqual(expected, out, "input {}".format(i + 1))
+
+        # the value of every node is read from the native monitor
+        expected = dict((node.name, value) for node, value in specs[0].ast.results.items())
+        results = dict((node.name, value) for node, value in specs[1].ast.results.items())
+        self.assertEqual(expected, results)
+
+    def test_shared_delay(self):
+        spec_text = 'out = (always[0,3](a >= 1) or eventually[1,5](a + b <= 0)) and eventually[2,2](a >= 1)'
+        specs = [rtamt.StlDiscreteTimeOnlineSpecification(), rtamt.StlDiscreteTimeOnlineSpecificationCpp()]
+        for spec in specs:
+            spec.declare_var('a', 'float')
+            spec.declare_var('b', 'float')
+            spec.declare_var('out', 'float')
+            spec.spec = spec_text
+            spec.parse()
+            spec.pastify()
+
+        for j in range(2):
+            for i in range(12):
+                a, b = (i * 7) % 5 - 2, (i * 3) % 4 - 1
+                expected = specs[0].update(i, [('a', a), ('b', b)])
+                out = specs[1].update(i, [('a', a), ('b', b)])
+                self.assertEqual(expected, out, "input {}".format(i))
+            for spec in specs:
+                spec.reset()
+
+        self.assertRaises(ValueError, specs[1].online_interpreter.monitor.add_delay,
+                          specs[1].online_interpreter.monitor.add_constant(1), -1)
+
+    def test_early_verdict(self):
+        spec = rtamt.StlDiscreteTimeOnlineSpecificationCpp()
+        spec.declare_var('a', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = always[0,3](a >= 1)'
+        spec.parse()
+
+        self.assertRaises(rtamt.RTAMTException, spec.update, 0, [('a', 1)], early=True)
+        self.assertEqual(spec.update(0, [('a', 1)]), 0, "early verdicts do not consume the sample")
+
+    def test_update_batch(self):
+        spec_text = 'out = always[0,2]((req >= 3) -> eventually[1,2](gnt >= 3))'
+        specs = [rtamt.StlDiscreteTimeOnlineSpecificationCpp(), rtamt.StlDiscreteTimeOnlineSpecificationCpp()]
+        for spec in specs:
+            spec.declare_var('req', 'float')
+            spec.declare_var('gnt', 'float')
+            spec.declare_var('out', 'float')
+            spec.spec = spec_text
+            spec.parse()
+            spec.pastify()
+
+        req = [self.left1, self.left2, self.left3, self.left4, self.left5]
+        gnt = [self.right1, self.right2, self.right3, self.right4, self.right5]
+        timestamps = [0, 1, 2, 4, 5]
+        expected = [specs[0].update(timestamps[i], [('req', req[i]), ('gnt', gnt[i])]) for i in range(5)]
+
+        out = array.array('d', [0.0] * 5)
+        rob = specs[1].update_batch(array.array('d', timestamps[:3]),
+                                    [('req', array.array('d', req[:3])), ('gnt', memoryview(array.array('d', gnt[:3])))],
+                                    out)
+        self.assertIs(rob, out)
+        rob = specs[1].update_batch(timestamps[3:], [('req', req[3:]), ('gnt', gnt[3:])])
+
+        self.assertListEqual(out.tolist()[:3] + rob, expected, "update batch")
+        self.assertEqual(specs[0].get_value('(req)>=(3.0)'), specs[1].get_value('(req)>=(3.0)'), "update batch subformula")
+        self.assertEqual(specs[1].sampling_violation_counter, 1, "update batch sampling violations")
+
+        self.assertRaises(TypeError, specs[1].update_batch, array.array('d', [6]),
+                          [('req', array.array('d', [1])), ('gnt', array.array('d', [1]))], array.array('f', [0]))
+
+    def test_monitor_group(self):
+        def create_spec():
+            spec = rtamt.StlDiscreteTimeOnlineSpecificationCpp()
+            spec.declare_var('req', 'float')
+            spec.declare_var('gnt', 'float')
+            spec.declare_var('out', 'float')
+            spec.spec = 'out = always[0,20]((req >= 3) -> eventually[1,5](gnt >= 3))'
+            spec.parse()
+            spec.pastify()
+            return spec
+
+        length = 500
+        timestamps = array.array('d', range(length))
+        datasets = [[('req', array.array('d', [(i * k) % 7 for k in range(length)])),
+                     ('gnt', array.array('d', [(i + k) % 5 for k in range(length)]))] for i in range(8)]
+        expected = [create_spec().update_batch(timestamps, dataset) for dataset in datasets]
+
+        # the monitors evaluate in parallel threads, without the GIL
+        outs = [array.array('d', [0.0] * length) for i in range(8)]
+        with rtamt.MonitorGroup([create_spec() for i in range(8)], workers=4) as group:
+            group.update_batch(timestamps, datasets, outs)
+        self.assertListEqual([out.tolist() for out in outs], expected)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import random
 from rtamt.lib.rtamt_stl_library_wrapper.stl_constant_node import ConstantOperation
 from rtamt.lib.rtamt_stl_library_wrapper.stl_comp_op import StlComparisonOperator
 from rtamt.lib.rtamt_stl_library_wrapper.stl_addition_node import AdditionOperation
@@ -24,6 +25,10 @@ from rtamt.lib.rtamt_stl_library_wrapper.stl_subtraction_node import Subtraction
 from rtamt.lib.rtamt_stl_library_wrapper.stl_multiplication_node import MultiplicationOperation
 from rtamt.lib.rtamt_stl_library_wrapper.stl_division_node import DivisionOperation
 from rtamt.lib.rtamt_stl_library_wrapper.stl_abs_node import AbsOperation
+from rtamt.semantics.stl.discrete_time.online.once_timed_operation import OnceTimedOperation
+from rtamt.semantics.stl.discrete_time.online.historically_timed_operation import HistoricallyTimedOperation
+from rtamt.semantics.stl.discrete_time.online.since_timed_operation import SinceTimedOperation
+from rtamt.semantics.stl.discrete_time.online.precedes_timed_operation import PrecedesTimedOperation
 
 class TestSTLEvaluationCPP(unittest.TestCase):
 
@@ -507,5 +512,22 @@ class TestSTLEvaluationCPP(unittest.TestCase):
         self.assertEqual(out4, 1, "input 4")
         self.assertEqual(out5, 0, "input 5")
 
+    def test_bounded_windows(self):
+        # the sliding windows of the bounded nodes against the Python operations
+        random.seed(0)
+        for begin, end in [(0, 0), (0, 1), (1, 1), (0, 5), (2, 5), (5, 5), (3, 40)]:
+            pairs = [(OnceBoundedOperation(begin, end), OnceTimedOperation(begin, end), 1),
+                     (HistoricallyBoundedOperation(begin, end), HistoricallyTimedOperation(begin, end), 1),
+                     (SinceBoundedOperation(begin, end), SinceTimedOperation(begin, end), 2),
+                     (PrecedesBoundedOperation(begin, end), PrecedesTimedOperation(begin, end), 2)]
+            for oper, expected_oper, arity in pairs:
+                for i in range(200):
+                    if i == 100:
+                        oper.reset()
+                        expected_oper.reset()
+                    samples = [random.randint(-5, 5) for _ in range(arity)]
+                    self.assertEqual(oper.update(*samples), expected_oper.update(*samples),
+                                     "{} [{},{}] input {}".format(type(oper).__name__, begin, end, i))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
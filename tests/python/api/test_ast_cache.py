@@ -0,0 +1,103 @@
+import os
+import unittest
+import shutil
+import tempfile
+import rtamt
+
+from rtamt.syntax.ast.parser.ast_cache import ast_cache
+
+
+class TestAstCache(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(TestAstCache, self).__init__(*args, **kwargs)
+
+    def setUp(self):
+        ast_cache.clear()
+
+    def tearDown(self):
+        ast_cache.path = None
+        ast_cache.clear()
+
+    def create_spec(self, text='out = once[0,2]((req >= 3) and (gnt >= 3))'):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = text
+        spec.parse()
+        return spec
+
+    def test_cache_hit(self):
+        spec1 = self.create_spec()
+        spec2 = self.create_spec()
+
+        self.assertEqual(len(ast_cache.entries), 1, "cache hit")
+        self.assertIsNot(spec1.ast.specs[0], spec2.ast.specs[0], "private copy")
+
+        out1 = [spec1.update(i, [('req', i), ('gnt', 4)]) for i in range(3)]
+        out2 = [spec2.update(i, [('req', 5), ('gnt', 4)]) for i in range(3)]
+
+        self.assertListEqual(out1, [-3, -2, -1], "cache hit")
+        self.assertListEqual(out2, [1, 1, 1], "cache hit")
+        self.assertEqual(spec2.get_value('(req)>=(3.0)'), 2, "cache hit")
+
+    def test_cache_declarations(self):
+        self.create_spec()
+
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'int')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = once[0,2]((req >= 3) and (gnt >= 3))'
+        spec.parse()
+
+        self.assertEqual(len(ast_cache.entries), 2, "cache declarations")
+        self.assertEqual(spec.ast.var_type_dict['gnt'], 'int', "cache declarations")
+
+    def test_cache_comments(self):
+        # a newline ends a comment, the texts differ only in whitespace but not in meaning
+        self.create_spec('out = (req >= 0) or // c\n (gnt >= 0) or (req <= 1)')
+        with self.assertRaises(Exception):
+            self.create_spec('out = (req >= 0) or // c (gnt >= 0)\n or (req <= 1)')
+
+        self.create_spec('out = (req >= 0) // note\n and (gnt >= 0)')
+        with self.assertRaises(Exception):
+            self.create_spec('out = (req >= 0) // note and (gnt >= 0)')
+        self.assertEqual(len(ast_cache.entries), 2, "cache comments")
+
+    def test_cache_max_entries(self):
+        max_entries = ast_cache.max_entries
+        try:
+            ast_cache.max_entries = 2
+            self.create_spec('out = req >= 1')
+            first = list(ast_cache.entries)[-1]
+            self.create_spec('out = req >= 2')
+            second = list(ast_cache.entries)[-1]
+            self.create_spec('out = req >= 1')
+            self.create_spec('out = req >= 3')
+            # the least recently used entry is removed
+            self.assertEqual(len(ast_cache.entries), 2, "cache max entries")
+            self.assertIn(first, ast_cache.entries, "cache max entries")
+            self.assertNotIn(second, ast_cache.entries, "cache max entries")
+        finally:
+            ast_cache.max_entries = max_entries
+
+    def test_cache_on_disk(self):
+        path = tempfile.mkdtemp()
+        try:
+            ast_cache.path = path
+            self.create_spec()
+            self.assertEqual(len(os.listdir(path)), 1, "cache on disk")
+            ast_cache.clear()
+
+            spec = self.create_spec()
+            self.assertEqual(len(ast_cache.entries), 1, "cache on disk")
+
+            out = [spec.update(i, [('req', i), ('gnt', 4)]) for i in range(3)]
+            self.assertListEqual(out, [-3, -2, -1], "cache on disk")
+        finally:
+            shutil.rmtree(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import rtamt
+
+
+class TestMonitorGroup(unittest.TestCase):
+
+    def create_spec(self):
+        spec = rtamt.StlDiscreteTimeOnlineSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = (req >= 3) implies once[0,2](gnt >= 3)'
+        spec.parse()
+        spec.pastify()
+        return spec
+
+    def test_update(self):
+        specs = [self.create_spec() for i in range(5)]
+        expected_specs = [self.create_spec() for i in range(5)]
+
+        with rtamt.MonitorGroup(specs, workers=2) as group:
+            for t in range(4):
+                datasets = [[('req', i + t), ('gnt', i - t)] for i in range(5)]
+                out = group.update(t, datasets)
+                expected = [spec.update(t, dataset) for spec, dataset in zip(expected_specs, datasets)]
+                self.assertListEqual(out, expected, "update {}".format(t))
+
+    def test_update_batch(self):
+        specs = [self.create_spec() for i in range(3)]
+        expected_specs = [self.create_spec() for i in range(3)]
+        datasets = [[('req', [i, i + 4, 1]), ('gnt', [1, i, 5])] for i in range(3)]
+
+        with rtamt.MonitorGroup(specs) as group:
+            out = group.update_batch([0, 1, 2], datasets)
+            expected = [spec.update_batch([0, 1, 2], dataset) for spec, dataset in zip(expected_specs, datasets)]
+            self.assertListEqual(out, expected, "update batch")
+
+            group.reset()
+            self.assertListEqual(group.update_batch([0, 1, 2], datasets), expected, "update batch after reset")
+
+    def test_wrong_number_of_datasets(self):
+        with rtamt.MonitorGroup([self.create_spec()]) as group:
+            self.assertRaises(rtamt.RTAMTException, group.update, 0, [])
+
+        self.assertRaises(rtamt.RTAMTException, rtamt.MonitorGroup, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+import rtamt
+
+from rtamt.syntax.ast.parser.ast_cache import ast_cache
+from rtamt.syntax.ast.parser.ltl.specification_parser import LtlAst
+from rtamt.syntax.ast.parser.ltl.pratt_parser import tokenize
+
+
+class TestPrattParser(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(TestPrattParser, self).__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.cache_enabled = ast_cache.enabled
+        ast_cache.enabled = False
+
+    def tearDown(self):
+        ast_cache.enabled = self.cache_enabled
+
+    def tree(self, node):
+        return type(node).__name__, node.name, [self.tree(child) for child in node.children]
+
+    def state(self, ast):
+        return (ast.name, [self.tree(spec) for spec in ast.specs], sorted(ast.phi_name_to_node_dict),
+                sorted(ast.var_subspec_dict), ast.out_var, ast.out_var_field, sorted(ast.vars),
+                sorted(ast.in_vars), sorted(ast.out_vars), sorted(ast.free_vars), sorted(ast.var_type_dict.items()),
+                sorted(ast.var_io_dict.items()), sorted(ast.const_val_dict.items()),
+                sorted(ast.var_topic_dict.items()), sorted(ast.modules))
+
+    def parse(self, text, parser_type, sub_spec=None):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.parser_type = parser_type
+        if sub_spec is not None:
+            spec.add_sub_spec(sub_spec)
+        spec.spec = text
+        spec.parse()
+        return spec
+
+    def assert_same(self, text, sub_spec=None):
+        expected = self.parse(text, rtamt.ParserType.ANTLR, sub_spec)
+        out = self.parse(text, rtamt.ParserType.PRATT, sub_spec)
+        self.assertEqual(self.state(out.ast), self.state(expected.ast), text)
+
+    def test_precedence(self):
+        for text in ['out = req + gnt * 2 - req / 3 - 1 >= (-gnt)',
+                     'out = - req * gnt',
+                     'out = req < gnt < 3',
+                     'out = not req >= 3 and gnt >= 3 or req <= 1',
+                     'out = req >= 1 -> gnt >= 2 <-> req >= 3 xor gnt >= 4',
+                     'out = (req >= 1) and (gnt >= 2) and (req <= 5) or (gnt <= 0) or (req == 3)',
+                     'out = always eventually req >= 3 + gnt',
+                     'out = prev req >= 1 until gnt >= 1 since req >= 2 and gnt !== 3',
+                     'out = s_prev next s_next req >= 1 since gnt >= 1',
+                     'out = G F H O X Y sX sY (req >= 1) U (gnt >= 1) S (req >= 2)',
+                     'out = ! req >= 1 & gnt >= 1 | req >= 2',
+                     'out = abs(req) + sqrt(gnt) + exp(req) + ln(gnt) + pow(req, 2) + log(gnt, 10) >= 0',
+                     'out = rise(req >= 3) and fall(gnt >= 3)',
+                     'req >= 3']:
+            self.assert_same(text)
+
+    def test_intervals(self):
+        for text in ['out = always[0,5](req >= 3) and eventually[1:2](gnt >= 3)',
+                     'out = historically[0s:2s](req >= 3) or once[1ms,2000us](gnt >= 3)',
+                     'out = (req >= 3) until[0.5, 1.5] (gnt >= 3)',
+                     'out = (req >= 3) since[0:1] (gnt >= 3) unless[1:2] (req >= 4)',
+                     'out = eventually[0,1] req >= 1 until[1,2] gnt >= 1',
+                     'out = always[0:2ns](req >= 1e-3)']:
+            self.assert_same(text)
+
+    def test_declarations(self):
+        self.assert_same('''specification spec_name
+            from rtamt.syntax.node.ltl.variable import Variable
+            input float x
+            output int y
+            float z
+            const float bound = 3
+            const int b = 2
+            @ topic(x, x_topic)
+            // line comment
+            /* block
+               comment */
+            a = x + bound >= y;
+            out = always[0:b](a) and z >= 0.5;''')
+
+    def test_unless(self):
+        # the ANTLR front end only supports unless with an interval
+        spec = self.parse('out = (req >= 1) unless (gnt >= 1)', rtamt.ParserType.PRATT)
+        self.assertEqual(spec.ast.specs[0].name, '(always((req)>=(1.0)))or(((req)>=(1.0))until((gnt)>=(1.0)))')
+
+    def test_syntax_error_before_identifiers(self):
+        # the syntax errors are reported before the undeclared identifiers x and u
+        for text in ['out = x rise', 'x + ;', 'out = (x', 'out = always[0:u](x) rise']:
+            for parser_type in [rtamt.ParserType.ANTLR, rtamt.ParserType.PRATT]:
+                self.assertRaises(rtamt.RTAMTException, self.parse, text, parser_type)
+
+    def test_cache(self):
+        # the parsers are cached separately, the choice of the parser is not masked by the cache
+        ast_cache.enabled = True
+        ast_cache.clear()
+        try:
+            self.assert_same('out = always[0,2](req >= 3)')
+            self.assertEqual(len(ast_cache.entries), 2)
+            self.parse('out = (req >= 1) unless (gnt >= 1)', rtamt.ParserType.PRATT)
+            self.assertRaises(Exception, self.parse, 'out = (req >= 1) unless (gnt >= 1)', rtamt.ParserType.ANTLR)
+        finally:
+            ast_cache.clear()
+
+    def test_sub_spec(self):
+        self.assert_same('out = always[0,2](sub and gnt >= 1)', sub_spec='sub = req >= 3;')
+
+    def test_same_monitor(self):
+        req = [(i * 7) % 11 - 5 for i in range(20)]
+        gnt = [(i * 5) % 7 - 3 for i in range(20)]
+        text = 'out = always[0,2]((req >= 2) -> eventually[0:3](gnt >= 0)) since[0,3] (req + gnt >= 1)'
+        expected = self.parse(text, rtamt.ParserType.ANTLR)
+        out = self.parse(text, rtamt.ParserType.PRATT)
+        dataset = {'time': list(range(20)), 'req': req, 'gnt': gnt}
+        self.assertListEqual(out.evaluate(dataset), expected.evaluate(dataset), text)
+
+    def test_ltl(self):
+        for text in ['out = always(a >= 1) until prev (b <= 2)', 'out = eventually(a + b >= 1) since s_prev(b)']:
+            states = []
+            for parser_type in [rtamt.ParserType.ANTLR, rtamt.ParserType.PRATT]:
+                ast = LtlAst()
+                ast.declare_var('a', 'float')
+                ast.declare_var('b', 'float')
+                ast.declare_var('out', 'float')
+                ast.parser_type = parser_type
+                ast.spec = text
+                ast.parse()
+                states.append(self.state(ast))
+            self.assertEqual(states[0], states[1], text)
+
+    def test_tokenize(self):
+        tokens = tokenize('a.b/c <-> !== 1.5e3 0x1F .5 /* comment */ always_ok G')
+        self.assertListEqual([token[0] for token in tokens],
+                             ['Identifier', 'IffOperator', 'NotEqualOperator', 'RealLiteral', 'IntegerLiteral',
+                              'RealLiteral', 'Identifier', 'AlwaysOperator', 'EOF'])
+
+    def test_syntax_error(self):
+        for text in ['out = req >= ', 'out = (req >= 3', 'out = req >= 3 gnt', 'out = always[0,](req)',
+                     'out = req # 3', 'float out = always(req)']:
+            spec = rtamt.StlDiscreteTimeSpecification()
+            spec.declare_var('req', 'float')
+            spec.parser_type = rtamt.ParserType.PRATT
+            spec.spec = text
+            self.assertRaises(rtamt.RTAMTException, spec.parse)
+
+
+if __name__ == '__main__':
+    unittest.main()
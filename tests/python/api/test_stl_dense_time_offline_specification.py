@@ -2,6 +2,11 @@ import unittest
 import math
 import rtamt
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class TestStlDenseTimeOfflineSpecification(unittest.TestCase):
 
     def __init__(self, *args, **kwargs):
@@ -611,5 +616,41 @@ class TestStlDenseTimeOfflineSpecification(unittest.TestCase):
 
         self.assertListEqual(expected, computed, "neq")
 
+    def _signal_spec(self):
+        spec = rtamt.StlDenseTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = once[0,1](abs(req) >= 1) and not(req + gnt <= 2)'
+        spec.parse()
+        return spec
+
+    def test_signal_input(self):
+        left = [[0, 1.3], [0.7, 3], [1.3, 0.1], [2.1, -2.2]]
+        right = [[0, 2.5], [0.7, 4], [1.3, -1.2], [2.1, 1.7]]
+
+        expected = self._signal_spec().evaluate(['req', left], ['gnt', right])
+
+        spec = self._signal_spec()
+        computed = spec.evaluate(['req', rtamt.DenseTimeSignal.from_samples(left)],
+                                 ['gnt', rtamt.DenseTimeSignal([0, 0.7, 1.3, 2.1], [2.5, 4, -1.2, 1.7])])
+
+        self.assertIsInstance(computed, rtamt.DenseTimeSignal)
+        self.assertListEqual(expected, computed.to_samples(), "signal input")
+        self.assertListEqual(expected, list(computed), "signal input")
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_input(self):
+        left = [[0, 1.3], [0.7, 3], [1.3, 0.1], [2.1, -2.2]]
+        right = [[0, 2.5], [0.7, 4], [1.3, -1.2], [2.1, 1.7]]
+
+        expected = self._signal_spec().evaluate(['req', left], ['gnt', right])
+
+        spec = self._signal_spec()
+        computed = spec.evaluate(['req', numpy.array(left)], ['gnt', numpy.array(right)])
+
+        self.assertIsInstance(computed, rtamt.DenseTimeSignal)
+        self.assertListEqual(expected, computed.to_samples(), "numpy input")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest
 import math
 import rtamt
+import rtamt.semantics.abstract_dense_time_online_interpreter as dense_time_online_interpreter
 
 class TestStlDenseTimeOnlineSpecification(unittest.TestCase):
 
@@ -36,6 +37,35 @@ class TestStlDenseTimeOnlineSpecification(unittest.TestCase):
                               "Problem with 1st example:\nExpected output: %s\nComputed output: %s" % (
                                   out_expected_2, out_computed_2))
 
+    def test_and_signal_input(self):
+        spec = rtamt.StlDenseTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = req and gnt'
+
+        spec.parse()
+
+        in_data_1_1 = rtamt.DenseTimeSignal([2, 3.3, 5.7], [2, 3, 4])
+        in_data_2_1 = rtamt.DenseTimeSignal([2.5, 4.7], [5, 6])
+
+        in_data_1_2 = rtamt.DenseTimeSignal([], [])
+        in_data_2_2 = rtamt.DenseTimeSignal([5.7], [1])
+
+        out_expected_1 = [[2.5, 2], [3.3, 3], [4.7, 3]]
+        out_expected_2 = [[5.7, 1]]
+
+        out_computed_1 = spec.update(['req', in_data_1_1], ['gnt', in_data_2_1])
+        out_computed_2 = spec.update(['req', in_data_1_2], ['gnt', in_data_2_2])
+
+        self.assertListEqual(out_expected_1, out_computed_1,
+                             "Problem with 1st example:\nExpected output: %s\nComputed output: %s" % (
+                                 out_expected_1, out_computed_1))
+
+        self.assertListEqual(out_expected_2, out_computed_2,
+                             "Problem with 1st example:\nExpected output: %s\nComputed output: %s" % (
+                                 out_expected_2, out_computed_2))
+
     def test_and_2(self):
         spec = rtamt.StlDenseTimeSpecification()
         spec.declare_var('req', 'float')
@@ -241,13 +271,104 @@ class TestStlDenseTimeOnlineSpecification(unittest.TestCase):
                                  out_expected, out_computed))
 
         in_data = [[6.5, 5], [6.75, 6], [9, 5], [9.25, 4], [10, 2]]
-        out_expected = [[6.5, 1], [6.75, 1], [9, 1], [9.25, 1], [10, 1]]
+        out_expected = [[6.5, 1], [10, 1]]
         out_computed = spec.update(['req', in_data])
 
         self.assertListEqual(out_expected, out_computed,
                              "Problem with 1st example:\nExpected output: %s\nComputed output: %s" % (
                                  out_expected, out_computed))
 
+    def test_compaction_counter(self):
+        spec = rtamt.StlDenseTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = once (req >= 0)'
+
+        spec.parse()
+
+        # once is 3 from time 3, the samples at 4 and 5 are dropped
+        in_data = [[0, 1], [1, 1], [2, 1], [3, 3], [4, 2], [5, 1], [6, 0]]
+        out_computed = spec.update(['req', in_data])
+
+        self.assertListEqual([[0, 1], [3, 3], [6, 3]], out_computed)
+        self.assertEqual(2, spec.compaction_counter)
+
+        spec.reset()
+        self.assertEqual(0, spec.compaction_counter)
+
+    def test_compaction_horizon(self):
+        chunks = [
+            (['a', [[0, 3]]], ['b', [[0, 3], [0.2, 1], [0.3, -3]]]),
+            (['a', [[3, -1], [3.7, 2], [4.9, 1], [5.1, 0]]], ['b', [[3, 2], [3.3, -3]]]),
+            (['a', [[7, 1], [7.4, 3], [8.7, 3], [8.9, 3]]], ['b', [[7, -1], [7.3, 2], [7.4, -1], [8.8, -2], [9.4, 1]]])
+        ]
+
+        def run():
+            spec = rtamt.StlDenseTimeSpecification()
+            spec.declare_var('a', 'float')
+            spec.declare_var('b', 'float')
+            spec.declare_var('out', 'float')
+            spec.spec = 'out = (once[1,2]((b <= 1)) since once((a * b >= 0)))'
+            spec.parse()
+            return [spec.update(*chunk) for chunk in chunks]
+
+        out_computed = run()
+        compact = dense_time_online_interpreter.compact
+        try:
+            dense_time_online_interpreter.compact = lambda samples: (samples, 0)
+            out_expected = run()
+        finally:
+            dense_time_online_interpreter.compact = compact
+
+        # the compaction drops redundant samples of the output, but the output is known as far
+        for expected, computed in zip(out_expected, out_computed):
+            self.assertListEqual(compact(expected)[0], computed)
+        self.assertListEqual([[3.3, 4.0], [8.8, 4.0]], out_computed[2])
+
+    def test_buffer_limit(self):
+        spec = rtamt.StlDenseTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = req and gnt'
+
+        spec.parse()
+
+        # gnt stalls, the samples of req are buffered until gnt catches up
+        stalled = [[t, t % 2] for t in range(10)]
+        spec.update(['req', stalled], ['gnt', [[0, 5]]])
+        self.assertEqual(11, spec.buffer_high_water['(req)and(gnt)'])
+
+        # the limit is checked before the samples are consumed, req is sent sample by sample
+        spec = spec.clone()
+        spec.set_buffer_limit(4, rtamt.BufferPolicy.DROP)
+        for sample in stalled:
+            spec.update(['req', [sample]], ['gnt', [[0, 5]] if sample[0] == 0 else []])
+        self.assertEqual(4, spec.buffer_high_water['(req)and(gnt)'])
+        out_computed = spec.update(['req', []], ['gnt', [[10, 5]]])
+        self.assertListEqual([[8, 0], [9, 1]], out_computed)
+
+        # the rejected samples of req are not consumed, the output stops where req is known
+        spec = spec.clone()
+        spec.set_buffer_limit(4, rtamt.BufferPolicy.BLOCK)
+        for sample in stalled:
+            spec.update(['req', [sample]], ['gnt', [[0, 5]] if sample[0] == 0 else []])
+        self.assertEqual(7, spec.blocked_counter)
+        # extending gnt lets the operator consume its residuals, it is accepted
+        out_computed = spec.update(['req', []], ['gnt', [[10, 5]]])
+        self.assertListEqual([[1, 1], [2, 0]], out_computed)
+        out_computed = spec.update(['req', stalled[3:]], ['gnt', []])
+        self.assertListEqual([[3, 1], [4, 0], [5, 1], [6, 0], [7, 1], [8, 0], [9, 1]], out_computed)
+
+        # the update is rejected before it is consumed, the monitor is left unchanged
+        spec = spec.clone()
+        spec.set_buffer_limit(4, rtamt.BufferPolicy.RAISE)
+        spec.update(['req', stalled[:4]], ['gnt', [[0, 5]]])
+        with self.assertRaises(rtamt.RTAMTException):
+            spec.update(['req', stalled[4:]], ['gnt', []])
+        out_computed = spec.update(['req', []], ['gnt', [[10, 5]]])
+        self.assertListEqual([[1, 1], [2, 0], [3, 1]], out_computed)
+
     def test_once(self):
         spec = rtamt.StlDenseTimeSpecification()
         spec.declare_var('req', 'float')
@@ -257,7 +378,7 @@ class TestStlDenseTimeOnlineSpecification(unittest.TestCase):
         spec.parse()
 
         in_data = [[5, 3], [5.3, 1], [5.75, 2]]
-        out_expected = [[5, 3], [5.3, 3], [5.75, 3]]
+        out_expected = [[5, 3], [5.75, 3]]
         out_computed = spec.update(['req', in_data])
 
         self.assertListEqual(out_expected, out_computed,
@@ -273,7 +394,7 @@ class TestStlDenseTimeOnlineSpecification(unittest.TestCase):
                                  out_expected, out_computed))
 
         in_data = [[9, 5], [9.25, 4], [10, 2]]
-        out_expected = [[9, 6], [9.25, 6], [10, 6]]
+        out_expected = [[9, 6], [10, 6]]
         out_computed = spec.update(['req', in_data])
 
         self.assertListEqual(out_expected, out_computed,
@@ -993,5 +1114,19 @@ class TestStlDenseTimeOnlineSpecification(unittest.TestCase):
 
 
 
+    def test_repeated_subformula(self):
+        spec = rtamt.StlDenseTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = ((req >= 1) and (gnt >= 1)) or ((req >= 1) and (gnt >= 1))'
+        spec.parse()
+
+        out_computed_1 = spec.update(['req', [[0, 1], [1, 3], [2, 0]]], ['gnt', [[0, 2], [1.5, 1]]])
+        out_computed_2 = spec.update(['req', [[3, 2], [4, 2]]], ['gnt', [[3, 5], [4, 1]]])
+
+        self.assertListEqual([[0, 0.0], [1, 1.0], [1.5, 0.0]], out_computed_1, "repeated subformula")
+        self.assertListEqual([[2, -1.0], [3, 1.0], [4, 0.0]], out_computed_2, "repeated subformula")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
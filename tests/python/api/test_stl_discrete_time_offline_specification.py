@@ -535,5 +535,17 @@ class TestStlDiscreteTimeOfflineSpecification(unittest.TestCase):
 
         self.assertListEqual(out, expected, "neq")
 
+    def test_clone(self):
+        spec = rtamt.StlDiscreteTimeOfflineSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = always(req >= gnt)'
+        spec.parse()
+
+        clone = spec.clone()
+        self.assertIsNot(clone.explainer, spec.explainer, "clone explainer")
+        self.assertListEqual(clone.evaluate(self.dataset), spec.evaluate(self.dataset), "clone")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -499,7 +499,19 @@ class TestStlDiscreteTimeOnlineSpecification(unittest.TestCase):
 
         spec.parse()
 
-        self.assertRaises(rtamt.RTAMTException, spec.update, 0, [('req', self.left1)])
+        # the verdict for sample i is emitted at sample i + 1, as after pastification
+        out1 = spec.update(0, [('req', self.left1)])
+        out2 = spec.update(1, [('req', self.left2)])
+        out3 = spec.update(2, [('req', self.left3)])
+        out4 = spec.update(3, [('req', self.left4)])
+        out5 = spec.update(4, [('req', self.left5)])
+
+        self.assertEqual(spec.online_interpreter.latency, 1, "latency")
+        self.assertEqual(out1, 100, "input 1")
+        self.assertEqual(out2, 100, "input 2")
+        self.assertEqual(out3, -1, "input 3")
+        self.assertEqual(out4, 5, "input 4")
+        self.assertEqual(out5, 5, "input 5")
 
     def test_eventually_0_1_with_pastify(self):
         spec = rtamt.StlDiscreteTimeSpecification()
@@ -570,7 +582,19 @@ class TestStlDiscreteTimeOnlineSpecification(unittest.TestCase):
 
         spec.parse()
 
-        self.assertRaises(rtamt.RTAMTException, spec.update, 0, [('req', self.left1)])
+        # the verdict for sample i is emitted at sample i + 1, as after pastification
+        out1 = spec.update(0, [('req', self.left1)])
+        out2 = spec.update(1, [('req', self.left2)])
+        out3 = spec.update(2, [('req', self.left3)])
+        out4 = spec.update(3, [('req', self.left4)])
+        out5 = spec.update(4, [('req', self.left5)])
+
+        self.assertEqual(spec.online_interpreter.latency, 1, "latency")
+        self.assertEqual(out1, 100, "input 1")
+        self.assertEqual(out2, -1, "input 2")
+        self.assertEqual(out3, -2, "input 3")
+        self.assertEqual(out4, -2, "input 4")
+        self.assertEqual(out5, -1, "input 5")
 
     def test_always_0_1_with_pastify(self):
         spec = rtamt.StlDiscreteTimeSpecification()
@@ -642,7 +666,18 @@ class TestStlDiscreteTimeOnlineSpecification(unittest.TestCase):
 
         spec.parse()
 
-        self.assertRaises(rtamt.RTAMTException, spec.update, 0, [('req', self.left1), ('gnt', self.right1)])
+        out1 = spec.update(0, [('req', self.left1), ('gnt', self.right1)])
+        out2 = spec.update(1, [('req', self.left2), ('gnt', self.right2)])
+        out3 = spec.update(2, [('req', self.left3), ('gnt', self.right3)])
+        out4 = spec.update(3, [('req', self.left4), ('gnt', self.right4)])
+        out5 = spec.update(4, [('req', self.left5), ('gnt', self.right5)])
+
+        self.assertEqual(spec.online_interpreter.latency, 1, "latency")
+        self.assertEqual(out1, 20, "input 1")
+        self.assertEqual(out2, 20, "input 2")
+        self.assertEqual(out3, -1, "input 3")
+        self.assertEqual(out4, 10, "input 4")
+        self.assertEqual(out5, 4, "input 5")
 
     def test_until_1_2_with_pastify(self):
         spec = rtamt.StlDiscreteTimeSpecification()
@@ -874,5 +909,245 @@ class TestStlDiscreteTimeOnlineSpecification(unittest.TestCase):
         self.assertEqual(out4, 1, "input 4")
         self.assertEqual(out5, 0, "input 5")
 
+    def test_update_batch(self):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = (req >= 0) since[0,1] (gnt >= 0)'
+
+        spec.parse()
+
+        out = spec.update_batch([0, 1, 2], [('req', [self.left1, self.left2, self.left3]),
+                                            ('gnt', [self.right1, self.right2, self.right3])])
+        out += spec.update_batch([3, 4], [('req', [self.left4, self.left5]),
+                                          ('gnt', [self.right4, self.right5])])
+
+        self.assertListEqual(out, [20, -1, 10, 5, -1], "update batch")
+        self.assertEqual(spec.get_value('(req)>=(0.0)'), -1, "update batch subformula")
+        self.assertEqual(spec.sampling_violation_counter, 0, "update batch sampling violations")
+
+    def test_update_batch_same_as_update(self):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = always[0,2]((req >= 3) -> eventually[1,2](gnt >= 3))'
+        spec.parse()
+        spec.pastify()
+
+        spec_batch = rtamt.StlDiscreteTimeSpecification()
+        spec_batch.declare_var('req', 'float')
+        spec_batch.declare_var('gnt', 'float')
+        spec_batch.declare_var('out', 'float')
+        spec_batch.spec = 'out = always[0,2]((req >= 3) -> eventually[1,2](gnt >= 3))'
+        spec_batch.parse()
+        spec_batch.pastify()
+
+        req = [self.left1, self.left2, self.left3, self.left4, self.left5]
+        gnt = [self.right1, self.right2, self.right3, self.right4, self.right5]
+
+        expected = [spec.update(i, [('req', req[i]), ('gnt', gnt[i])]) for i in range(5)]
+        out = spec_batch.update_batch([0, 1, 2, 3, 4], [('req', req), ('gnt', gnt)])
+
+        self.assertListEqual(out, expected, "update batch")
+
+    def test_update_shared_subformula(self):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('a', 'float')
+        spec.declare_var('b', 'float')
+        spec.declare_var('x', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'x = prev a; out = x + b'
+        spec.parse()
+
+        out = [spec.update(i, [('a', i), ('b', 0)]) for i in range(4)]
+
+        self.assertListEqual(out, [float('inf'), 0, 1, 2], "update shared subformula")
+
+    def test_update_nested_shared_subformula(self):
+        # every sub-spec occurs twice in the next one, the compilation must not walk every occurrence
+        depth = 20
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('a', 'float')
+        for i in range(depth + 1):
+            spec.declare_var('x{}'.format(i), 'float')
+        spec.declare_var('out', 'float')
+        lines = ['x0 = a >= 0'] + ['x{0} = x{1} and prev x{1}'.format(i, i - 1) for i in range(1, depth + 1)]
+        spec.spec = ';\n'.join(lines + ['out = x{0} or x{0}'.format(depth)]) + ';'
+        spec.parse()
+
+        out = [spec.update(i, [('a', 2)]) for i in range(3)]
+        self.assertListEqual(out, [2, 2, 2], "update nested shared subformula")
+
+        schedule = spec.online_interpreter.schedule
+        self.assertEqual(len(schedule.instructions), 2 * depth + 2)
+        spec.update(3, [('a', 1)])
+        self.assertEqual(spec.ast.results[spec.ast.specs[0]], 1)
+        self.assertEqual(spec.ast.results[spec.ast.specs[-1]], 1)
+
+    def test_shared_subformula_dag(self):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('a', 'float')
+        spec.declare_var('b', 'float')
+        spec.declare_var('x', 'float')
+        spec.declare_var('out', 'float')
+        spec.add_sub_spec('x = (abs(a - b) <= 1);')
+        spec.spec = 'out = (abs(a - b) <= 1) and once[0,2](x)'
+        spec.parse()
+
+        left = spec.ast.specs[-1].children[0]
+        right = spec.ast.specs[-1].children[1].children[0]
+        self.assertIs(left, right, "shared subformula")
+        self.assertIs(spec.ast.phi_name_to_node_dict['x'], left, "shared subformula")
+
+    def test_shared_delay_line(self):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('a', 'float')
+        spec.declare_var('b', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = (once[2,2](a)) + (once[20,20](a)) + (once[2,2](b))'
+        spec.parse()
+
+        spec_batch = rtamt.StlDiscreteTimeSpecification()
+        spec_batch.declare_var('a', 'float')
+        spec_batch.declare_var('b', 'float')
+        spec_batch.declare_var('out', 'float')
+        spec_batch.spec = 'out = (once[2,2](a)) + (once[20,20](a)) + (once[2,2](b))'
+        spec_batch.parse()
+
+        a = [float(i) for i in range(40)]
+        b = [float(-i) for i in range(40)]
+        out = [spec.update(i, [('a', a[i]), ('b', b[i])]) for i in range(40)]
+        expected = [-float('inf')] * 20 + [a[i - 2] + a[i - 20] + b[i - 2] for i in range(20, 40)]
+        self.assertListEqual(out, expected, "shared delay line")
+
+        # the nodes advance column by column, the delay line grows to keep the lagging samples
+        out = spec_batch.update_batch(list(range(40)), [('a', a), ('b', b)])
+        self.assertListEqual(out, expected, "shared delay line batch")
+
+        self.assertEqual(len(spec.online_interpreter.delay_lines), 2, "one delay line per variable")
+        self.assertEqual(len(spec.online_interpreter.delay_lines['a'].readers), 2, "shared delay line")
+
+        spec.reset()
+        out = [spec.update(i, [('a', a[i]), ('b', b[i])]) for i in range(40)]
+        self.assertListEqual(out, expected, "shared delay line reset")
+
+    def test_future_without_pastify(self):
+        req = [(i * 7) % 11 - 5 for i in range(30)]
+        gnt = [(i * 5) % 7 - 3 for i in range(30)]
+        for formula in ['always[0,4]((req >= 2) -> eventually[1,2](gnt >= 0))',
+                        '(req + gnt >= 0) and always[2,5](eventually[0,2](req <= gnt))',
+                        'once[0,2](eventually[1,2](req >= 0)) or ((req >= 0) until[1,3] (gnt >= 1))']:
+            specs = []
+            for i in range(3):
+                spec = rtamt.StlDiscreteTimeSpecification()
+                spec.declare_var('req', 'float')
+                spec.declare_var('gnt', 'float')
+                spec.declare_var('out', 'float')
+                spec.spec = 'out = ' + formula
+                spec.parse()
+                specs.append(spec)
+            specs[1].pastify()
+
+            out = [specs[0].update(i, [('req', req[i]), ('gnt', gnt[i])]) for i in range(30)]
+            expected = [specs[1].update(i, [('req', req[i]), ('gnt', gnt[i])]) for i in range(30)]
+            self.assertListEqual(out, expected, formula)
+
+            # the output at sample i is the verdict for sample i - latency
+            latency = specs[0].online_interpreter.latency
+            expected = [value for time, value in specs[2].evaluate({'time': list(range(30)), 'req': req, 'gnt': gnt})]
+            self.assertListEqual(out[latency:], expected[:30 - latency], formula)
+
+    def test_early_verdict(self):
+        x = [1, 2, 3, 20, 1, 1, 1, 1, 1, 1, 1, 1]
+        for pastify in [True, False]:
+            spec = rtamt.StlDiscreteTimeSpecification()
+            spec.declare_var('x', 'float')
+            spec.declare_var('out', 'float')
+            spec.spec = 'out = always[0,5](x < 10)'
+            spec.parse()
+            if pastify:
+                spec.pastify()
+
+            out = [spec.update(i, [('x', x[i])], early=True) for i in range(len(x))]
+            # the violation at sample 3 decides the pending windows that contain it at once
+            verdicts = [verdict.verdict for verdict in out]
+            self.assertListEqual(verdicts, [rtamt.Verdict.UNKNOWN] * 3 + [rtamt.Verdict.VIOLATED] * 5 +
+                                 [rtamt.Verdict.UNKNOWN] * 4, "early violation")
+            self.assertEqual(out[3].upper, -10, "early violation bound")
+            for i in range(len(x) - 1):
+                self.assertTrue(out[i].lower <= out[i + 1].robustness <= out[i].upper, "early verdict bounds")
+
+        req = [(i * 7) % 11 - 5 for i in range(30)]
+        gnt = [(i * 5) % 7 - 3 for i in range(30)]
+        for formula in ['eventually[0,4](req >= 4) or (gnt >= 3)',
+                        'always[0,4]((req >= 2) -> eventually[1,2](gnt >= 0))',
+                        'once[1,3](req + gnt >= 2) and historically(abs(gnt) <= 3)']:
+            spec = rtamt.StlDiscreteTimeSpecification()
+            spec.declare_var('req', 'float')
+            spec.declare_var('gnt', 'float')
+            spec.declare_var('out', 'float')
+            spec.spec = 'out = ' + formula
+            spec.parse()
+
+            out = [spec.update(i, [('req', req[i]), ('gnt', gnt[i])], early=True) for i in range(30)]
+            for i in range(29):
+                self.assertTrue(out[i].lower <= out[i + 1].robustness <= out[i].upper, formula)
+                if out[i].verdict == rtamt.Verdict.SATISFIED:
+                    self.assertGreater(out[i + 1].robustness, 0, formula)
+                elif out[i].verdict == rtamt.Verdict.VIOLATED:
+                    self.assertLess(out[i + 1].robustness, 0, formula)
+            self.assertTrue(any(verdict.verdict != rtamt.Verdict.UNKNOWN for verdict in out), formula)
+
+    def test_clone(self):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('req', 'float')
+        spec.declare_var('gnt', 'float')
+        spec.declare_var('out', 'float')
+        spec.set_sampling_period(500, 'ms', 0.1)
+        spec.spec = 'out = (req >= 3) since[0:1s] (gnt >= 3)'
+        spec.parse()
+        spec.pastify()
+
+        out = [spec.update(i * 0.5, [('req', 5), ('gnt', 4)]) for i in range(2)]
+        self.assertListEqual(out, [1, 1], "clone")
+
+        clone = spec.clone()
+        self.assertIs(clone.ast.specs[0], spec.ast.specs[0], "clone shares the formula")
+        self.assertEqual(clone.get_sampling_frequency(), spec.get_sampling_frequency(), "clone sampling period")
+
+        out_clone = [clone.update(i * 0.5, [('req', 4), ('gnt', 1)]) for i in range(3)]
+        out = [spec.update(i * 0.5, [('req', 4), ('gnt', 1)]) for i in range(2, 5)]
+
+        self.assertListEqual(out_clone, [-2, -2, -2], "clone starts fresh")
+        self.assertListEqual(out, [1, 1, -2], "template keeps its state")
+        self.assertEqual(clone.get_value('(gnt)>=(3.0)'), -2, "clone results")
+
+    def test_clone_copies_operators(self):
+        spec = rtamt.StlDiscreteTimeSpecification()
+        spec.declare_var('a', 'float')
+        spec.declare_var('b', 'float')
+        spec.declare_var('x', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'x = prev a; out = (x + b >= 0) until[0:2] (a >= 1)'
+        spec.parse()
+
+        # the clones copy the operators and the schedule of the template, they are not compiled again
+        first = spec.clone()
+        second = spec.clone()
+        self.assertIsNot(first.online_interpreter.schedule, spec.online_interpreter.schedule)
+        self.assertIsNot(first.online_interpreter.online_operator_dict['(a)>=(1.0)'],
+                         second.online_interpreter.online_operator_dict['(a)>=(1.0)'])
+        self.assertEqual(first.online_interpreter.latency, 2)
+
+        inputs = [(i, [('a', i % 3 - 1), ('b', 1 - i % 2)]) for i in range(8)]
+        out = [spec.update(*sample) for sample in inputs]
+        self.assertListEqual([first.update(*sample) for sample in inputs], out, "first clone")
+        self.assertListEqual([second.update(*sample) for sample in inputs], out, "second clone")
+
+        clone = spec.clone()
+        self.assertListEqual([clone.update(*sample) for sample in inputs], out, "clone of an updated template")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
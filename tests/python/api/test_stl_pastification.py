@@ -511,5 +511,42 @@ class TestStlPastification(unittest.TestCase):
 
         self.assertEqual('historically[0,6]((once[3,3]((req)==(1.0)))->(once[0,3]((gnt)==(2.0))))', ast.specs[0].name, 'Complex pastification assertion')
 
+    def test_shared_subformula_scaling(self):
+        # x16 has 2^16 paths to x0 but only 17 shared subformulas
+        ast = StlAst()
+        ast.declare_var('req', 'float')
+        ast.declare_var('x0', 'float')
+        ast.add_sub_spec('x0 = eventually[0,1](req >= 0);')
+        for i in range(1, 17):
+            ast.declare_var('x{}'.format(i), 'float')
+            ast.add_sub_spec('x{0} = x{1} and eventually[0,1](x{1});'.format(i, i - 1))
+        ast.spec = 'x16'
+        ast.parse()
+
+        pastifier = StlPastifier()
+        ast = pastifier.pastify(ast)
+
+        self.assertLess(len(pastifier.pastified), 200, 'Shared pastification assertion')
+        self.assertIs(ast.phi_name_to_node_dict['x16'], ast.specs[-1], 'Shared pastification assertion')
+
+    def test_large_spec(self):
+        def balanced(terms):
+            if len(terms) == 1:
+                return terms[0]
+            return '({}) and ({})'.format(balanced(terms[:len(terms) // 2]), balanced(terms[len(terms) // 2:]))
+
+        ast = StlAst()
+        ast.declare_var('req', 'float')
+        ast.declare_var('gnt', 'float')
+        ast.spec = balanced(['eventually[0,{}](req + gnt >= {})'.format(i % 10 + 1, i) for i in range(1000)])
+        ast.parse()
+
+        pastifier = StlPastifier()
+        ast = pastifier.pastify(ast)
+
+        self.assertLess(len(pastifier.pastified), 5000, 'Large pastification assertion')
+        self.assertIn('(once[0,1](once[9,9](((req)+(gnt))>=(10.0))))', ast.specs[0].name, 'Large pastification assertion')
+        self.assertIn('(once[0,10](((req)+(gnt))>=(9.0)))', ast.specs[0].name, 'Large pastification assertion')
+
     if __name__ == '__main__':
         unittest.main()
\ No newline at end of file
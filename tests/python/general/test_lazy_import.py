@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+import subprocess
+import rtamt
+
+
+class TestLazyImport(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TestLazyImport, self).__init__(*args, **kwargs)
+
+    def test_public_api(self):
+        for name in rtamt.__all__:
+            self.assertTrue(hasattr(rtamt, name), name)
+            self.assertIn(name, dir(rtamt))
+        self.assertIs(rtamt.STLSpecification, rtamt.StlDiscreteTimeSpecification)
+        self.assertIs(rtamt.STLCTSpecification, rtamt.StlDenseTimeSpecification)
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, getattr, rtamt, 'NoSuchSpecification')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'module __getattr__ requires Python 3.7')
+    def test_import_is_lazy(self):
+        code = ('import sys, rtamt; '
+                'assert "rtamt.spec.stl.discrete_time.specification" not in sys.modules; '
+                'assert "antlr4" not in sys.modules; '
+                'rtamt.StlDiscreteTimeSpecification; '
+                'assert "rtamt.spec.stl.discrete_time.specification" in sys.modules')
+        # the child process imports the same rtamt as the tests
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.abspath(rtamt.__file__)))
+        subprocess.check_call([sys.executable, '-c', code], env=env)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import time
 import unittest
 from rtamt.semantics.stl.dense_time.online.and_operation import AndOperation
 from rtamt.semantics.stl.dense_time.online.not_operation import NotOperation
@@ -13,6 +14,18 @@ from rtamt.semantics.stl.dense_time.online.once_timed_operation import OnceTimed
 from rtamt.semantics.stl.dense_time.online.historically_timed_operation import HistoricallyTimedOperation
 
 
+class CountingList(list):
+    """List counting the breakpoints read from it, slices included"""
+    def __init__(self, *args):
+        super(CountingList, self).__init__(*args)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        item = super(CountingList, self).__getitem__(key)
+        self.reads = self.reads + (len(item) if isinstance(key, slice) else 1)
+        return item
+
+
 class TestSTLBooleanAndTemporalOnline(unittest.TestCase):
 
     def __init__(self, *args, **kwargs):
@@ -405,6 +418,24 @@ class TestSTLBooleanAndTemporalOnline(unittest.TestCase):
                                   out_expected_final, out_computed_final))
 
 
+    def _merge_reads(self, oper_class, n):
+        left = [[float(i), float(i % 7)] for i in range(n)]
+        right = [[i + 0.5, float(i % 5)] for i in range(n)]
+        oper = oper_class()
+        # the operator extends its buffers with the inputs and merges them
+        left_buf = oper.sample_left_buf = CountingList()
+        right_buf = oper.sample_right_buf = CountingList()
+        oper.update(left, right)
+        return left_buf.reads + right_buf.reads
+
+    def test_merge_scaling(self):
+        # merging n breakpoints must read O(n) breakpoints: a quadratic merge
+        # reads 64 times more for 8 times more breakpoints
+        for oper_class in [AndOperation, SinceOperation]:
+            small = self._merge_reads(oper_class, 2000)
+            large = self._merge_reads(oper_class, 16000)
+            self.assertLess(large, 9 * small, oper_class.__name__)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -379,6 +379,22 @@ class TestSTLEvaluation(unittest.TestCase):
         self.assertEqual(out4, -1, "input 4")
         self.assertEqual(out5, 5, "input 5")
 
+    def test_once_1_1000000(self):
+        oper = OnceTimedOperation(1, 1000000)
+
+        out1 = oper.update(self.left1)
+        out2 = oper.update(self.left2)
+        out3 = oper.update(self.left3)
+        oper.reset()
+        out4 = oper.update(self.left4)
+        out5 = oper.update(self.left5)
+
+        self.assertEqual(out1, -float("inf"), "input 1")
+        self.assertEqual(out2, 100, "input 2")
+        self.assertEqual(out3, 100, "input 3")
+        self.assertEqual(out4, -float("inf"), "input 4")
+        self.assertEqual(out5, 5, "input 5")
+
     def test_historically_0_1(self):
         oper = HistoricallyTimedOperation(0,1)
 
@@ -409,6 +425,22 @@ class TestSTLEvaluation(unittest.TestCase):
         self.assertEqual(out4, -2, "input 4")
         self.assertEqual(out5, -2, "input 5")
 
+    def test_historically_1_1000000(self):
+        oper = HistoricallyTimedOperation(1, 1000000)
+
+        out1 = oper.update(self.left1)
+        out2 = oper.update(self.left2)
+        out3 = oper.update(self.left3)
+        oper.reset()
+        out4 = oper.update(self.left4)
+        out5 = oper.update(self.left5)
+
+        self.assertEqual(out1, float("inf"), "input 1")
+        self.assertEqual(out2, 100, "input 2")
+        self.assertEqual(out3, -1, "input 3")
+        self.assertEqual(out4, float("inf"), "input 4")
+        self.assertEqual(out5, 5, "input 5")
+
     def test_since_0_1(self):
         oper = SinceTimedOperation(0,1)
 
@@ -439,6 +471,36 @@ class TestSTLEvaluation(unittest.TestCase):
         self.assertEqual(out4, -1, "input 4")
         self.assertEqual(out5, -2, "input 5")
 
+    def test_since_1_1000(self):
+        oper = SinceTimedOperation(1, 1000)
+
+        out1 = oper.update(self.left1, self.right1)
+        out2 = oper.update(self.left2, self.right2)
+        out3 = oper.update(self.left3, self.right3)
+        out4 = oper.update(self.left4, self.right4)
+        out5 = oper.update(self.left5, self.right5)
+
+        self.assertEqual(out1, -float("inf"), "input 1")
+        self.assertEqual(out2, -1, "input 2")
+        self.assertEqual(out3, -2, "input 3")
+        self.assertEqual(out4, 5, "input 4")
+        self.assertEqual(out5, -1, "input 5")
+
+    def test_precedes_1_1000(self):
+        oper = PrecedesTimedOperation(1, 1000)
+
+        out1 = oper.update(self.left1, self.right1)
+        out2 = oper.update(self.left2, self.right2)
+        out3 = oper.update(self.left3, self.right3)
+        out4 = oper.update(self.left4, self.right4)
+        out5 = oper.update(self.left5, self.right5)
+
+        self.assertEqual(out1, 20, "input 1")
+        self.assertEqual(out2, 20, "input 2")
+        self.assertEqual(out3, 20, "input 3")
+        self.assertEqual(out4, 20, "input 4")
+        self.assertEqual(out5, 20, "input 5")
+
     def test_not(self):
         oper = NotOperation()
 
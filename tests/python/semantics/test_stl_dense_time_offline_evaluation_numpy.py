@@ -0,0 +1,125 @@
+import unittest
+import random
+
+import rtamt
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def random_signal(rnd, length):
+    signal = []
+    time = 0
+    for i in range(length):
+        signal.append([time, rnd.choice([rnd.randint(-3, 3), rnd.uniform(-3, 3)])])
+        time = time + rnd.choice([0.25, 0.5, 1, 1.5])
+    return signal
+
+
+def samples(signal):
+    return [[float(time), float(value)] for time, value in signal]
+
+
+def random_formula(rnd, depth):
+    # iff and xor are left out, on infinite robustness they give NaN, which has no order
+    if depth == 0:
+        return rnd.choice(['(a >= {})'.format(rnd.randint(-2, 2)), '(b < {})'.format(rnd.randint(-2, 2)),
+                           '(a + b >= 0)', '(abs(a) <= 2)'])
+    interval = ''
+    if rnd.random() < 0.8:
+        begin = rnd.choice([0, 0.25, 0.5, 1, 2])
+        interval = '[{},{}]'.format(begin, begin + rnd.choice([0, 0.5, 1, 3]))
+    kind = rnd.randint(0, 4)
+    if kind < 2:
+        temporal = rnd.choice(['once', 'historically', 'eventually', 'always'])
+        return '{}{}({})'.format(temporal, interval, random_formula(rnd, depth - 1))
+    if kind < 3:
+        return '({}) {}{} ({})'.format(random_formula(rnd, depth - 1), rnd.choice(['since', 'until']), interval,
+                                       random_formula(rnd, depth - 1))
+    if kind < 4:
+        return '({}) {} ({})'.format(random_formula(rnd, depth - 1), rnd.choice(['and', 'or', '->']),
+                                     random_formula(rnd, depth - 1))
+    return 'not({})'.format(random_formula(rnd, depth - 1))
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestSTLDenseTimeEvaluationNumpy(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(TestSTLDenseTimeEvaluationNumpy, self).__init__(*args, **kwargs)
+        rnd = random.Random(1)
+        self.datasets = [(random_signal(rnd, rnd.randint(1, 40)), random_signal(rnd, rnd.randint(1, 40)))
+                         for i in range(10)]
+
+    def evaluate(self, formula, language, a, b):
+        spec = rtamt.StlDenseTimeOfflineSpecification(language=language)
+        spec.declare_var('a', 'float')
+        spec.declare_var('b', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = ' + formula
+        spec.parse()
+        return spec.evaluate(['a', a], ['b', b])
+
+    def assert_same(self, formula):
+        for a, b in self.datasets:
+            expected = self.evaluate(formula, rtamt.Language.PYTHON, a, b)
+            out = self.evaluate(formula, rtamt.Language.NUMPY, a, b)
+            self.assertListEqual(samples(expected), samples(out), formula)
+
+    def test_arithmetic(self):
+        for formula in ['a + b', 'a - b', 'a * b', 'abs(a)', 'a + 3.5']:
+            self.assert_same(formula)
+
+    def test_predicates(self):
+        for formula in ['a <= b', 'a < b', 'a >= b', 'a > b', 'a == b', 'a !== b']:
+            self.assert_same(formula)
+
+    def test_boolean(self):
+        for formula in ['not(a >= 0)', '(a >= 0) and (b >= 0)', '(a >= 0) or (b >= 0)',
+                        '(a >= 0) -> (b >= 0)', '(a >= 0) iff (b >= 0)', '(a >= 0) xor (b >= 0)']:
+            self.assert_same(formula)
+
+    def test_unbounded_temporal(self):
+        for formula in ['once(a >= 0)', 'historically(a >= 0)', 'eventually(a >= 0)', 'always(a >= 0)',
+                        '(a >= 0) since (b >= 0)', '(a >= 0) until (b >= 0)']:
+            self.assert_same(formula)
+
+    def test_bounded_temporal(self):
+        for begin, end in [(0, 0), (0, 1), (1, 2), (0.5, 3), (2, 10), (0.5, 0.5), (0.5, 1)]:
+            interval = '[{},{}]'.format(begin, end)
+            for formula in ['once' + interval + '(a >= 0)', 'historically' + interval + '(a >= 0)',
+                            'eventually' + interval + '(a >= 0)', 'always' + interval + '(a >= 0)',
+                            '(a >= 0) since' + interval + ' (b >= 0)', '(a >= 0) until' + interval + ' (b >= 0)']:
+                self.assert_same(formula)
+
+    def test_equal_values(self):
+        # equal values in the window keep the breakpoints of the Python interpreter
+        a = [[0, 4], [5, 3], [10, 4]]
+        b = [[0, 1], [1, 1], [2.5, 2], [5, 2]]
+        for formula in ['eventually[1:2](a >= 1)', 'always[0.5:1](b >= 1)', 'once[1:2](a >= 1)',
+                        'historically[0.5:1](b >= 1)', 'eventually[0.5:0.5](always[1:4](a < 2))']:
+            self.assertListEqual(samples(self.evaluate(formula, rtamt.Language.PYTHON, a, b)),
+                                 samples(self.evaluate(formula, rtamt.Language.NUMPY, a, b)), formula)
+
+    def test_random_formulas(self):
+        rnd = random.Random(2)
+        for i in range(200):
+            a = random_signal(rnd, rnd.randint(1, 20))
+            b = random_signal(rnd, rnd.randint(1, 20))
+            formula = random_formula(rnd, rnd.randint(1, 3))
+            expected = self.evaluate(formula, rtamt.Language.PYTHON, a, b)
+            out = self.evaluate(formula, rtamt.Language.NUMPY, a, b)
+            self.assertListEqual(samples(expected), samples(out), formula)
+
+    def test_array_input(self):
+        a, b = self.datasets[0]
+        expected = self.evaluate('always[0,2](a >= b)', rtamt.Language.PYTHON, a, b)
+        out = self.evaluate('always[0,2](a >= b)', rtamt.Language.NUMPY, numpy.array(a), numpy.array(b))
+        self.assertIsInstance(out, rtamt.DenseTimeSignal)
+        self.assertListEqual(samples(expected), samples(out.to_samples()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -577,6 +577,46 @@ class TestSTLEvaluation(unittest.TestCase):
 
         self.assertListEqual(out, expected, "since[0,1]")
 
+    def test_always_1_1000000(self):
+        ast = StlAst()
+        ast.declare_var('a', 'float')
+        ast.declare_var('b', 'float')
+        ast.spec = 'always[1,1000000] a'
+        ast.parse()
+        interpreter = StlDiscreteTimeOfflineInterpreter()
+        interpreter.set_ast(ast)
+
+        a = [100, -1, -2, 5, -1]
+        b = [20, -2, 10, 4, -1]
+        t = [0, 1, 2, 3, 4]
+
+        dataset = {'time': t, 'a': a, 'b': b}
+
+        out = interpreter.evaluate(dataset)
+        expected = [[0, -2], [1, -2], [2, -1], [3, -1], [4, float("inf")]]
+
+        self.assertListEqual(out, expected, "always")
+
+    def test_until_1_1000000(self):
+        ast = StlAst()
+        ast.declare_var('a', 'float')
+        ast.declare_var('b', 'float')
+        ast.spec = 'a until[1,1000000] b'
+        ast.parse()
+        interpreter = StlDiscreteTimeOfflineInterpreter()
+        interpreter.set_ast(ast)
+
+        a = [100, -1, -2, 5, -1]
+        b = [20, -2, 10, 4, -1]
+        t = [0, 1, 2, 3, 4]
+
+        dataset = {'time': t, 'a': a, 'b': b}
+
+        out = interpreter.evaluate(dataset)
+        expected = [[0, -1], [1, -1], [2, -2], [3, -1], [4, -float("inf")]]
+
+        self.assertListEqual(out, expected, "until")
+
     def test_not(self):
         ast = StlAst()
         ast.declare_var('a', 'float')
@@ -0,0 +1,92 @@
+import unittest
+import random
+
+import rtamt
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestSTLEvaluationNumpy(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(TestSTLEvaluationNumpy, self).__init__(*args, **kwargs)
+        rnd = random.Random(1)
+        length = 200
+        self.dataset = {
+            'time': list(range(length)),
+            'a': [rnd.choice([rnd.randint(-5, 5), rnd.uniform(-5, 5)]) for i in range(length)],
+            'b': [rnd.choice([rnd.randint(-5, 5), rnd.uniform(-5, 5)]) for i in range(length)]
+        }
+
+    def evaluate(self, formula, language):
+        spec = rtamt.StlDiscreteTimeOfflineSpecification(language=language)
+        spec.declare_var('a', 'float')
+        spec.declare_var('b', 'float')
+        spec.declare_var('out', 'float')
+        spec.spec = 'out = ' + formula
+        spec.parse()
+        return spec.evaluate(self.dataset)
+
+    def assert_same(self, formula):
+        expected = self.evaluate(formula, rtamt.Language.PYTHON)
+        out = self.evaluate(formula, rtamt.Language.NUMPY)
+        self.assertListEqual(expected, out, formula)
+
+    def assert_close(self, formula):
+        # NumPy and the math module may round exp and pow differently in the last bit
+        expected = self.evaluate(formula, rtamt.Language.PYTHON)
+        out = self.evaluate(formula, rtamt.Language.NUMPY)
+        self.assertListEqual([sample[0] for sample in expected], [sample[0] for sample in out], formula)
+        for sample_expected, sample in zip(expected, out):
+            self.assertLessEqual(abs(sample_expected[1] - sample[1]), 1e-12 * abs(sample_expected[1]), formula)
+
+    def test_arithmetic(self):
+        for formula in ['a + b', 'a - b', 'a * b', 'abs(a)', 'a + 3.5']:
+            self.assert_same(formula)
+
+    def test_arithmetic_functions(self):
+        for formula in ['a / (abs(b) + 1)', 'sqrt(abs(a))', 'ln(a)', 'log(a, b)']:
+            self.assert_same(formula)
+        for formula in ['exp(a)', 'pow(abs(a) + 1, b)', 'pow(a, 2)', 'sqrt(abs(a)) / (exp(b) + pow(a, 2))']:
+            self.assert_close(formula)
+
+    def test_arithmetic_errors(self):
+        # the NumPy backend raises the exceptions of the Python backend
+        for formula, error in [('a / b', ZeroDivisionError), ('sqrt(a)', ValueError), ('pow(a, 0.5)', ValueError),
+                               ('pow(b - b, a - 10)', ValueError), ('exp(a * 1000)', OverflowError),
+                               ('pow(a + 10, 400)', OverflowError)]:
+            for language in [rtamt.Language.PYTHON, rtamt.Language.NUMPY]:
+                with self.assertRaises(error, msg=formula):
+                    self.evaluate(formula, language)
+
+    def test_predicates(self):
+        for formula in ['a <= b', 'a < b', 'a >= b', 'a > b', 'a == b', 'a !== b']:
+            self.assert_same(formula)
+
+    def test_boolean(self):
+        for formula in ['not(a >= 0)', '(a >= 0) and (b >= 0)', '(a >= 0) or (b >= 0)',
+                        '(a >= 0) -> (b >= 0)', '(a >= 0) iff (b >= 0)', '(a >= 0) xor (b >= 0)',
+                        'rise(a >= 0)', 'fall(a >= 0)']:
+            self.assert_same(formula)
+
+    def test_unbounded_temporal(self):
+        for formula in ['once(a >= 0)', 'historically(a >= 0)', 'eventually(a >= 0)', 'always(a >= 0)',
+                        '(a >= 0) since (b >= 0)', '(a >= 0) until (b >= 0)',
+                        'prev(a)', 's_prev(a)', 'next(a)', 's_next(a)']:
+            self.assert_same(formula)
+
+    def test_bounded_temporal(self):
+        for begin, end in [(0, 0), (0, 1), (1, 2), (3, 17), (0, 64), (50, 250)]:
+            interval = '[{},{}]'.format(begin, end)
+            for formula in ['once' + interval + '(a >= 0)', 'historically' + interval + '(a >= 0)',
+                            'eventually' + interval + '(a >= 0)', 'always' + interval + '(a >= 0)',
+                            '(a >= 0) since' + interval + ' (b >= 0)', '(a >= 0) until' + interval + ' (b >= 0)']:
+                self.assert_same(formula)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import random
+
+import rtamt
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestSTLUpdateNumpy(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(TestSTLUpdateNumpy, self).__init__(*args, **kwargs)
+        rnd = random.Random(1)
+        self.streams = 4
+        self.length = 100
+        self.a = [[rnd.choice([rnd.randint(-5, 5), rnd.uniform(-5, 5)]) for n in range(self.streams)]
+                  for i in range(self.length)]
+        self.b = [[rnd.choice([rnd.randint(-5, 5), rnd.uniform(-5, 5)]) for n in range(self.streams)]
+                  for i in range(self.length)]
+
+    def create_spec(self, formula, language, pastify=True):
+        spec = rtamt.StlDiscreteTimeOnlineSpecification(language=language)
+        spec.declare_var('a', 'float')
+        spec.declare_var('b', 'float')
+        spec.declare_var('out', 'float')
+        # both variables occur in every spec, so that both can be updated
+        spec.spec = 'out = (' + formula + ') and (b <= 100)'
+        spec.parse()
+        if pastify:
+            spec.pastify()
+        return spec
+
+    def assert_same(self, formula, pastify=True):
+        specs = [self.create_spec(formula, rtamt.Language.PYTHON, pastify) for n in range(self.streams)]
+        spec = self.create_spec(formula, rtamt.Language.NUMPY, pastify)
+        for i in range(self.length):
+            expected = [specs[n].update(i, [('a', self.a[i][n]), ('b', self.b[i][n])]) for n in range(self.streams)]
+            out = spec.update(i, [('a', self.a[i]), ('b', self.b[i])])
+            self.assertListEqual(expected, out.tolist(), formula)
+
+    def test_arithmetic(self):
+        for formula in ['a + b >= 0', 'a - b >= 0', 'a * b >= 0', 'abs(a) >= 1', 'a / 2 >= b']:
+            self.assert_same(formula)
+
+    def test_boolean(self):
+        for formula in ['not(a >= 0)', '(a >= 0) or (b >= 0)', '(a >= 0) -> (b >= 0)', '(a >= 0) iff (b >= 0)',
+                        '(a >= 0) xor (b >= 0)', 'rise(a >= 0)', 'fall(a >= 0)']:
+            self.assert_same(formula)
+
+    def test_unbounded_temporal(self):
+        for formula in ['once(a >= 0)', 'historically(a >= 0)', '(a >= 0) since (b >= 0)',
+                        '(prev a) >= 0', '(s_prev a) >= 0']:
+            self.assert_same(formula)
+
+    def test_bounded_temporal(self):
+        for begin, end in [(0, 0), (0, 1), (1, 2), (4, 4), (0, 30), (3, 17), (5, 40)]:
+            interval = '[{},{}]'.format(begin, end)
+            for formula in ['once' + interval + '(a >= 0)', 'historically' + interval + '(a >= 0)',
+                            '(a >= 0) since' + interval + ' (b >= 0)', 'eventually' + interval + '(a >= 0)',
+                            'always' + interval + '(a >= 0)', '(a >= 0) until' + interval + ' (b >= 0)']:
+                self.assert_same(formula)
+
+    def test_future_without_pastify(self):
+        for formula in ['eventually[1,3](a >= b)', 'always[0,4]((a >= 2) -> eventually[1,2](b >= 0))',
+                        '(a >= 0) until[1,3] (b >= 1)', '(prev a >= 0) since[0,2] eventually[0,1](b >= 0)']:
+            self.assert_same(formula, pastify=False)
+
+    def test_update_batch(self):
+        spec = self.create_spec('always[0,2](eventually[1,3](a >= b))', rtamt.Language.NUMPY)
+        expected = [spec.update(i, [('a', self.a[i]), ('b', self.b[i])]).tolist() for i in range(self.length)]
+
+        spec = self.create_spec('always[0,2](eventually[1,3](a >= b))', rtamt.Language.NUMPY)
+        out = spec.update_batch(list(range(self.length)), [('a', self.a), ('b', self.b)])
+        self.assertListEqual(expected, [sample.tolist() for sample in out], 'update batch')
+
+
+if __name__ == '__main__':
+    unittest.main()